@@ -0,0 +1,30 @@
+"""
+Gunicorn configuration.
+
+SERVER_INTERFACE=asgi runs the ASGI application on uvicorn workers with the
+async views turned on: each worker serves many concurrent slow clients (open
+chat tabs, mobile connections) from one event loop instead of holding a
+thread per request. Several ASGI workers need
+TASKS_BROADCAST_BACKEND=tasks.broadcast.PostgresBroadcast for chat pushes.
+
+The default, SERVER_INTERFACE=wsgi, keeps the synchronous WSGI application.
+"""
+import multiprocessing
+import os
+
+interface = os.environ.get("SERVER_INTERFACE", "wsgi")
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+timeout = 30
+keepalive = 5
+
+if interface == "asgi":
+    os.environ.setdefault("TASKS_ASYNC_VIEWS", "true")
+    wsgi_app = "task_manager.asgi:application"
+    worker_class = "uvicorn.workers.UvicornWorker"
+    workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() + 1))
+else:
+    wsgi_app = "task_manager.wsgi:application"
+    worker_class = "gthread"
+    threads = int(os.environ.get("GUNICORN_THREADS", 4))
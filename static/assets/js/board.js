@@ -0,0 +1,98 @@
+const board = document.getElementById("board");
+const csrfToken = board.querySelector("[name=csrfmiddlewaretoken]").value;
+const priorityClasses = {"Low": "low-priority", "Medium": "medium-priority", "High": "high-priority"};
+let draggedCard = null;
+
+//Colours a card by its priority, or greys it out once it is done.
+function styleCard(card, status, priority) {
+    card.classList.remove("done-task", ...Object.values(priorityClasses));
+    card.classList.add(status === "Done" ? "done-task" : priorityClasses[priority]);
+    card.dataset.status = status;
+    card.dataset.priority = priority;
+}
+
+//Builds the same markup the server renders for a single card.
+function renderCard(task) {
+    const card = document.createElement("li");
+    const link = document.createElement("a");
+    const deadline = document.createElement("p");
+
+    card.classList.add("tasks__list-type-task");
+    card.dataset.taskId = task.id;
+    if (String(task.creator_id) === board.dataset.userId) {
+        card.draggable = true;
+        card.dataset.statusUrl = `${task.url}status/`;
+    }
+    styleCard(card, task.status, task.priority);
+    link.href = task.url;
+    link.textContent = task.name;
+    deadline.textContent = `(${task.deadline ?? "None"})`;
+    card.append(link, deadline);
+    bindCard(card);
+
+    return card;
+}
+
+function bindCard(card) {
+    card.addEventListener("dragstart", () => {
+        draggedCard = card;
+    });
+}
+
+//Asks the server to move the card; if someone else moved it first, reloads the board.
+function moveCard(card, column) {
+    const from = card.closest(".board__column").dataset.status;
+    const status = column.dataset.status;
+    if (from === status) {
+        return;
+    }
+
+    const body = new URLSearchParams({status: status, from: from});
+    fetch(card.dataset.statusUrl, {
+        method: "POST",
+        credentials: "same-origin",
+        headers: {"X-CSRFToken": csrfToken},
+        body: body
+    }).then(response => {
+        if (!response.ok) {
+            window.location.reload();
+            return;
+        }
+        column.querySelector(".tasks__list-type-status").after(card);
+        styleCard(card, status, card.dataset.priority);
+    });
+}
+
+//Appends the next page of a column.
+function loadMore(column, button) {
+    const url = new URL(board.dataset.dataUrl, window.location.origin);
+    url.searchParams.set("status", column.dataset.status);
+    url.searchParams.set("before", column.dataset.before);
+
+    fetch(url, {credentials: "same-origin"})
+        .then(response => response.json())
+        .then(data => {
+            const page = data.columns[0];
+            page.tasks.forEach(task => button.parentElement.before(renderCard(task)));
+            column.dataset.before = page.before || column.dataset.before;
+            if (!page.has_more) {
+                button.parentElement.remove();
+            }
+        });
+}
+
+document.querySelectorAll(".board__column .tasks__list-type-task").forEach(bindCard);
+
+document.querySelectorAll(".board__column").forEach(column => {
+    column.addEventListener("dragover", event => {
+        if (draggedCard?.dataset.statusUrl) {
+            event.preventDefault();
+        }
+    });
+    column.addEventListener("drop", event => {
+        event.preventDefault();
+        moveCard(draggedCard, column);
+        draggedCard = null;
+    });
+    column.querySelector(".board__more")?.addEventListener("click", event => loadMore(column, event.target));
+});
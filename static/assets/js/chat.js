@@ -0,0 +1,136 @@
+const chatContainer = document.getElementById("chat-messages");
+const chatForm = document.querySelector(".chat__form");
+const renderedMessages = new Set();
+
+//Builds the same markup the server renders for a single message.
+function renderMessage(message) {
+    const isMine = String(message.sender_id) === chatContainer.dataset.userId;
+    const wrapper = document.createElement("div");
+    const header = document.createElement("div");
+    const body = document.createElement("p");
+
+    wrapper.classList.add("messages", isMine ? "sent-by-me" : "sent-by-others");
+    header.textContent = `${isMine ? "Me" : message.sender} (${message.position ?? "None"})`;
+    body.textContent = message.message;
+    wrapper.append(header, body);
+
+    return wrapper;
+}
+
+//Appends a message pushed by the server unless it is already on screen.
+function appendMessage(message) {
+    if (renderedMessages.has(message.id)) {
+        return;
+    }
+    renderedMessages.add(message.id);
+
+    const stickToBottom = chatContainer.scrollHeight - chatContainer.scrollTop - chatContainer.clientHeight < 50;
+    chatContainer.querySelector("h5.no-messages")?.remove();
+    chatContainer.append(renderMessage(message));
+    chatContainer.dataset.after = message.cursor || chatContainer.dataset.after;
+    if (stickToBottom) {
+        chatContainer.scrollTop = chatContainer.scrollHeight;
+    }
+}
+
+//Fetches every message newer than the last one we have,
+//used when a push could not carry the message itself.
+function loadNewerMessages() {
+    const url = new URL(chatContainer.dataset.historyUrl, window.location.origin);
+    url.searchParams.set("after", chatContainer.dataset.after);
+
+    fetch(url, {credentials: "same-origin"})
+        .then(response => response.json())
+        .then(page => {
+            page.messages.forEach(appendMessage);
+            chatContainer.dataset.after = page.after || chatContainer.dataset.after;
+            if (page.has_more) {
+                loadNewerMessages();
+            }
+        });
+}
+
+//Keeps a websocket open to the project channel, reconnecting with a delay if it drops.
+function connectChatSocket() {
+    const scheme = window.location.protocol === "https:" ? "wss" : "ws";
+    const socket = new WebSocket(`${scheme}://${window.location.host}${chatContainer.dataset.socketPath}`);
+
+    socket.addEventListener("message", event => {
+        const message = JSON.parse(event.data);
+        if (message.type === "resync") {
+            loadNewerMessages();
+        } else {
+            appendMessage(message);
+        }
+    });
+    socket.addEventListener("close", event => {
+        if (event.code !== 4403) {
+            setTimeout(connectChatSocket, 3000);
+        }
+    });
+}
+
+let loadingHistory = false;
+
+//Fetches the page of messages older than the oldest one on screen
+//and prepends it without moving the current scroll position.
+function loadOlderMessages() {
+    if (loadingHistory || chatContainer.dataset.hasMore !== "true") {
+        return;
+    }
+    loadingHistory = true;
+
+    const url = new URL(chatContainer.dataset.historyUrl, window.location.origin);
+    url.searchParams.set("before", chatContainer.dataset.before);
+
+    fetch(url, {credentials: "same-origin"})
+        .then(response => response.json())
+        .then(page => {
+            const previousHeight = chatContainer.scrollHeight;
+            const fragment = document.createDocumentFragment();
+
+            page.messages.forEach(message => fragment.append(renderMessage(message)));
+            chatContainer.prepend(fragment);
+            chatContainer.scrollTop += chatContainer.scrollHeight - previousHeight;
+            chatContainer.dataset.before = page.before || "";
+            chatContainer.dataset.hasMore = String(page.has_more);
+        })
+        .finally(() => {
+            loadingHistory = false;
+        });
+}
+
+if (chatContainer) {
+    chatContainer.querySelectorAll("[data-message-id]").forEach(element => {
+        renderedMessages.add(Number(element.dataset.messageId));
+    });
+    chatContainer.scrollTop = chatContainer.scrollHeight;
+    if ("WebSocket" in window) {
+        connectChatSocket();
+    }
+    chatContainer.addEventListener("scroll", function () {
+        if (this.scrollTop < 50) {
+            loadOlderMessages();
+        }
+    });
+}
+
+//Sends the message in the background; the server pushes it back to every open tab.
+if (chatContainer && chatForm) {
+    chatForm.addEventListener("submit", function (event) {
+        event.preventDefault();
+
+        fetch(chatForm.action || window.location.href, {
+            method: "POST",
+            body: new FormData(chatForm),
+            headers: {"Accept": "application/json"},
+            credentials: "same-origin",
+        })
+            .then(response => response.ok ? response.json() : Promise.reject(response))
+            .then(message => {
+                appendMessage(message);
+                chatForm.reset();
+            })
+            .catch(() => chatForm.submit());
+    });
+}
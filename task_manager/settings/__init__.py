@@ -0,0 +1,14 @@
+"""
+Loads the settings of the environment named by DJANGO_ENV ("development" or
+"production"). Render deployments default to production.
+"""
+import os
+
+ENVIRONMENT = os.environ.get("DJANGO_ENV", "production" if "RENDER" in os.environ else "development")
+
+if ENVIRONMENT == "production":
+    from task_manager.settings.production import *  # noqa: F401,F403
+elif ENVIRONMENT == "development":
+    from task_manager.settings.development import *  # noqa: F401,F403
+else:
+    raise ValueError(f"Unknown DJANGO_ENV {ENVIRONMENT!r}, expected 'development' or 'production'.")
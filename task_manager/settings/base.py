@@ -1,5 +1,5 @@
 """
-Django settings for task_manager project.
+Settings shared by every environment of the task_manager project.
 
 Generated by "django-admin startproject" using Django 5.0.4.
 
@@ -14,7 +14,7 @@ import dj_database_url
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / "subdir".
-BASE_DIR = Path(__file__).resolve().parent.parent
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
 
 # Quick-start development settings - unsuitable for production
@@ -24,7 +24,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 SECRET_KEY = os.environ["DJANGO_SECRET_KEY"]
 
 # SECURITY WARNING: don"t run with debug turned on in production!
-DEBUG = "RENDER" not in os.environ
+DEBUG = False
 
 ALLOWED_HOSTS = ["127.0.0.1", "task-manager-u2b4.onrender.com"]
 
@@ -39,21 +39,37 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "tasks",
-    "debug_toolbar"
 ]
 
 TASKS_APP_NAMESPACE = "tasks"
 
+# Delivers new chat messages to open websockets. Use
+# "tasks.broadcast.PostgresBroadcast" when running several ASGI workers.
+TASKS_BROADCAST_BACKEND = os.environ.get("TASKS_BROADCAST_BACKEND", "tasks.broadcast.InMemoryBroadcast")
+
+# Serve the read-heavy views with their async implementations from
+# tasks.async_views. Turn on when running under ASGI (see gunicorn.conf.py).
+TASKS_ASYNC_VIEWS = os.environ.get("TASKS_ASYNC_VIEWS", "false").lower() == "true"
+
+# Share of requests timed by tasks.metrics.RequestMetricsMiddleware (0.0 - 1.0).
+TASKS_METRICS_SAMPLE_RATE = float(os.environ.get("TASKS_METRICS_SAMPLE_RATE", "1.0"))
+
+TASKS_METRICS_SERVER_TIMING = os.environ.get("TASKS_METRICS_SERVER_TIMING", "true").lower() == "true"
+
+# How long project change feed entries are kept. Clients whose cursor is
+# older have to download the project again.
+TASKS_CHANGELOG_RETENTION_DAYS = int(os.environ.get("TASKS_CHANGELOG_RETENTION_DAYS", "30"))
+
 MIDDLEWARE = [
+    "tasks.metrics.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "tasks.middleware.AsyncWhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "debug_toolbar.middleware.DebugToolbarMiddleware",
 ]
 
 ROOT_URLCONF = "task_manager.urls"
@@ -77,6 +93,8 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "task_manager.wsgi.application"
 
+ASGI_APPLICATION = "task_manager.asgi.application"
+
 
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
@@ -143,6 +161,22 @@ MEDIA_ROOT = os.path.join(BASE_DIR / "media",)
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
-INTERNAL_IPS = {
-    "127.0.0.1",
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "tasks.metrics": {
+            "handlers": ["console"],
+            "level": os.environ.get("TASKS_METRICS_LOG_LEVEL", "INFO"),
+            "propagate": False,
+        },
+        "tasks.jobs": {
+            "handlers": ["console"],
+            "level": os.environ.get("TASKS_JOBS_LOG_LEVEL", "WARNING"),
+            "propagate": False,
+        },
+    },
 }
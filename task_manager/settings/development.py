@@ -0,0 +1,18 @@
+import os
+
+from task_manager.settings.base import *  # noqa: F401,F403
+from task_manager.settings.base import INSTALLED_APPS, LOGGING, MIDDLEWARE, TASKS_ASYNC_VIEWS
+
+DEBUG = True
+
+# The toolbar middleware is sync-only and deadlocks concurrent ASGI requests.
+if not TASKS_ASYNC_VIEWS:
+    INSTALLED_APPS = [*INSTALLED_APPS, "debug_toolbar"]
+
+    MIDDLEWARE = [*MIDDLEWARE, "debug_toolbar.middleware.DebugToolbarMiddleware"]
+
+INTERNAL_IPS = {
+    "127.0.0.1",
+}
+
+LOGGING["loggers"]["tasks.metrics"]["level"] = os.environ.get("TASKS_METRICS_LOG_LEVEL", "WARNING")
@@ -0,0 +1,68 @@
+import os
+
+import dj_database_url
+
+from task_manager.settings.base import *  # noqa: F401,F403
+from task_manager.settings.base import BASE_DIR, DATABASES, TEMPLATES
+
+DEBUG = False
+
+# Keep connections open between requests and ping them before reuse, so a
+# connection dropped by the database is replaced instead of failing a request.
+DATABASES["default"].update(dj_database_url.config(conn_max_age=600, conn_health_checks=True))
+
+# The cache is shared by all worker processes, so counter and fragment
+# invalidations are seen by every worker. REDIS_URL or MEMCACHED_LOCATION
+# (host:port, comma separated) select a cache server, which also needs the
+# redis or pymemcache package installed.
+SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+
+if os.environ.get("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ["REDIS_URL"],
+            "TIMEOUT": 60 * 60 * 24,
+        }
+    }
+elif os.environ.get("MEMCACHED_LOCATION"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.memcached.PyMemcacheCache",
+            "LOCATION": os.environ["MEMCACHED_LOCATION"].split(","),
+            "TIMEOUT": 60 * 60 * 24,
+        }
+    }
+else:
+    # Fallback for a single instance. The file cache lists its directory on
+    # every write once it is full and its add() and incr() are not atomic, so
+    # it is kept small and sessions are not stored in it.
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": os.environ.get("DJANGO_CACHE_DIR", BASE_DIR / ".cache"),
+            "TIMEOUT": 60 * 60 * 24,
+            "OPTIONS": {"MAX_ENTRIES": 1000},
+        }
+    }
+    SESSION_ENGINE = "django.contrib.sessions.backends.db"
+
+
+# Time a small share of requests and keep query counts and timings out of
+# the response headers; development measures every request.
+TASKS_METRICS_SAMPLE_RATE = float(os.environ.get("TASKS_METRICS_SAMPLE_RATE", "0.01"))
+
+TASKS_METRICS_SERVER_TIMING = os.environ.get("TASKS_METRICS_SERVER_TIMING", "false").lower() == "true"
+
+TEMPLATES[0]["APP_DIRS"] = False
+TEMPLATES[0]["OPTIONS"]["loaders"] = [
+    ("django.template.loaders.cached.Loader", [
+        "django.template.loaders.filesystem.Loader",
+        "django.template.loaders.app_directories.Loader",
+    ]),
+]
+
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage"},
+}
@@ -14,26 +14,20 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path("blog/", include("blog.urls"))
 """
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include, re_path
-from django.conf.urls.static import static
-from django.views.static import serve
 
-from task_manager import settings
+from tasks.views import serve_media
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("", include("tasks.urls"))
-] + static(
-    settings.MEDIA_URL,
-    document_root=settings.MEDIA_ROOT
-)
+]
 
 urlpatterns += [
-    re_path(r"^media/(?P<path>.*)$", serve, {
-        "document_root": settings.MEDIA_ROOT
-    })
+    re_path(r"^media/(?P<path>.*)$", serve_media)
 ]
-if settings.DEBUG:
+if "debug_toolbar" in settings.INSTALLED_APPS:
     import debug_toolbar
     urlpatterns += path("__debug__/", include(debug_toolbar.urls)),
@@ -6,7 +6,7 @@ from tasks.models import (
     Position,
     TaskType,
     Worker,
-    Project, TaskComment
+    Project, TaskComment, Job
 )
 
 
@@ -47,5 +47,12 @@ class TaskCommentAdmin(admin.ModelAdmin):
     list_display = ["message", "sender", "task",]
 
 
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ["name", "status", "attempts", "run_at", "started", "duration", "locked_by", ]
+    list_filter = ["status", "name"]
+    readonly_fields = ["attempts", "created", "started", "finished", "duration", "heartbeat", "locked_by", "last_error", ]
+
+
 admin.site.register(Position)
 admin.site.register(TaskType)
@@ -0,0 +1,283 @@
+"""
+JSON API over projects, tasks, comments and chat messages.
+
+List endpoints return ``{"data": [...], "included": {...}, "next": cursor}``
+ordered by id and take:
+
+- ``fields=name,status`` to return only those fields; only their columns
+  are selected,
+- ``include=creator,task_type`` to add the related objects, loaded with
+  one query per relation,
+- ``limit=`` and ``after=`` with the ``next`` cursor of the previous page.
+
+Writes take a JSON object validated by the same forms as the HTML views;
+``PATCH`` only changes the fields it sends.
+"""
+import json
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.forms.models import model_to_dict
+from django.http import Http404, HttpResponse, JsonResponse
+from django.views import generic
+
+from tasks.forms import ChatMessageForm, CommentForm, ProjectForm, TaskFilterForm, TaskForm
+from tasks.models import ChatMessage, Project, Task, TaskComment, TaskType
+from tasks.pagination import InvalidCursor, decode_pk_cursor, encode_pk_cursor
+from tasks.permissions import ProjectMemberRequiredMixin, TaskAccessMixin, accessible_projects
+
+
+class ApiError(Exception):
+    def __init__(self, payload, status=400):
+        super().__init__(payload)
+        self.payload = payload if isinstance(payload, dict) else {"error": payload}
+        self.status = status
+
+
+class Resource:
+    def __init__(self, model, fields, includes=None):
+        self.model = model
+        self.fields = fields
+        self.includes = includes or {}
+
+    def parse_fields(self, value):
+        if not value:
+            return self.fields
+
+        fields = [name for name in value.split(",") if name]
+        unknown = set(fields) - set(self.fields)
+        if unknown:
+            raise ApiError(f"Unknown fields: {', '.join(sorted(unknown))}.")
+
+        return ["id", *[name for name in fields if name != "id"]]
+
+    def parse_includes(self, value):
+        includes = [name for name in (value or "").split(",") if name]
+        unknown = set(includes) - set(self.includes)
+        if unknown:
+            raise ApiError(f"Unknown includes: {', '.join(sorted(unknown))}.")
+
+        return includes
+
+    def select(self, queryset, fields, includes=()):
+        # Included relations need their foreign key even when it is not a requested field.
+        return queryset.only(*dict.fromkeys([*fields, *includes]))
+
+    def serialize(self, obj, fields):
+        data = {}
+        for name in fields:
+            value = getattr(obj, self.model._meta.get_field(name).attname)
+            data[name] = value.isoformat() if hasattr(value, "isoformat") else value
+
+        return data
+
+    def included(self, objects, includes):
+        included = {}
+        for name in includes:
+            resource = self.includes[name]
+            attname = self.model._meta.get_field(name).attname
+            ids = {getattr(obj, attname) for obj in objects} - {None}
+            related = resource.select(resource.model.objects.filter(pk__in=ids), resource.fields).order_by("pk")
+            included[name] = [resource.serialize(obj, resource.fields) for obj in related]
+
+        return included
+
+
+WORKER = Resource(get_user_model(), ["id", "username", "first_name", "last_name", "position"])
+TASK_TYPE = Resource(TaskType, ["id", "name"])
+PROJECT = Resource(Project, ["id", "title", "description", "creator"], {"creator": WORKER})
+TASK = Resource(
+    Task,
+    [
+        "id", "name", "description", "deadline", "priority", "status", "task_type", "creator", "project",
+        "comment_count", "modified",
+    ],
+    {"creator": WORKER, "task_type": TASK_TYPE, "project": PROJECT},
+)
+COMMENT = Resource(TaskComment, ["id", "message", "sender", "task", "date"], {"sender": WORKER, "task": TASK})
+MESSAGE = Resource(ChatMessage, ["id", "message", "sender", "project", "date"], {"sender": WORKER})
+
+
+class ApiMixin:
+    resource = None
+    paginate_by = 50
+    max_paginate_by = 500
+
+    def dispatch(self, request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return self.handle_no_permission()
+
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        except ApiError as error:
+            return JsonResponse(error.payload, status=error.status)
+        except Http404 as error:
+            return JsonResponse({"error": str(error)}, status=404)
+
+    def handle_no_permission(self):
+        return JsonResponse({"error": "Authentication required."}, status=401)
+
+    def permission_denied(self):
+        return JsonResponse({"error": self.get_permission_denied_message()}, status=403)
+
+    def get_limit(self):
+        try:
+            return max(min(int(self.request.GET.get("limit", self.paginate_by)), self.max_paginate_by), 1)
+        except ValueError:
+            raise ApiError("Invalid limit.")
+
+    def list_response(self, queryset):
+        fields = self.resource.parse_fields(self.request.GET.get("fields"))
+        includes = self.resource.parse_includes(self.request.GET.get("include"))
+        limit = self.get_limit()
+
+        queryset = self.resource.select(queryset, fields, includes).order_by("pk")
+        if self.request.GET.get("after"):
+            try:
+                queryset = queryset.filter(pk__gt=decode_pk_cursor(self.request.GET["after"]))
+            except InvalidCursor as error:
+                raise ApiError(str(error))
+
+        rows = list(queryset[:limit + 1])
+        objects = rows[:limit]
+
+        return JsonResponse({
+            "data": [self.resource.serialize(obj, fields) for obj in objects],
+            "included": self.resource.included(objects, includes),
+            "next": encode_pk_cursor(objects[-1].pk) if len(rows) > limit else None,
+        })
+
+    def detail_response(self, obj, status=200):
+        includes = self.resource.parse_includes(self.request.GET.get("include"))
+        fields = self.resource.parse_fields(self.request.GET.get("fields"))
+
+        return JsonResponse({
+            "data": self.resource.serialize(obj, fields),
+            "included": self.resource.included([obj], includes),
+        }, status=status)
+
+    def get_data(self):
+        try:
+            data = json.loads(self.request.body or b"{}")
+        except ValueError:
+            raise ApiError("The request body must be JSON.")
+        if not isinstance(data, dict):
+            raise ApiError("The request body must be a JSON object.")
+
+        return data
+
+    def get_form(self, form_class, instance=None):
+        data = self.get_data()
+        if instance is not None:
+            data = {**model_to_dict(instance, fields=form_class._meta.fields), **data}
+
+        form = form_class(data, instance=instance)
+        if not form.is_valid():
+            raise ApiError({"errors": form.errors})
+
+        return form
+
+    def require_creator(self, obj):
+        if obj.creator_id != self.request.user.id:
+            raise ApiError("Only the creator can change this.", status=403)
+
+
+class ApiProjectListView(ApiMixin, generic.View):
+    resource = PROJECT
+
+    def get(self, request):
+        return self.list_response(accessible_projects(request.user))
+
+    def post(self, request):
+        project = self.get_form(ProjectForm).save(commit=False)
+        project.creator = request.user
+        with transaction.atomic():
+            project.save()
+            project.assignees.add(request.user)
+
+        return self.detail_response(project, status=201)
+
+
+class ApiProjectDetailView(ApiMixin, ProjectMemberRequiredMixin, generic.View):
+    resource = PROJECT
+
+    def get(self, request, pk):
+        return self.detail_response(self.project)
+
+    def patch(self, request, pk):
+        self.require_creator(self.project)
+
+        return self.detail_response(self.get_form(ProjectForm, self.project).save())
+
+    def delete(self, request, pk):
+        self.require_creator(self.project)
+        self.project.delete()
+
+        return HttpResponse(status=204)
+
+
+class ApiTaskListView(ApiMixin, ProjectMemberRequiredMixin, generic.View):
+    resource = TASK
+
+    def get(self, request, pk):
+        form = TaskFilterForm(request.GET)
+        if not form.is_valid():
+            raise ApiError({"errors": form.errors})
+
+        return self.list_response(form.filter(Task.objects.filter(project=self.project)))
+
+    def post(self, request, pk):
+        task = self.get_form(TaskForm).save(commit=False)
+        task.project = self.project
+        task.creator = request.user
+        task.save()
+
+        return self.detail_response(task, status=201)
+
+
+class ApiTaskDetailView(ApiMixin, TaskAccessMixin, generic.View):
+    resource = TASK
+
+    def get(self, request, pk, task_pk):
+        return self.detail_response(self.task)
+
+    def patch(self, request, pk, task_pk):
+        self.require_creator(self.task)
+
+        return self.detail_response(self.get_form(TaskForm, self.task).save())
+
+    def delete(self, request, pk, task_pk):
+        self.require_creator(self.task)
+        self.task.delete()
+
+        return HttpResponse(status=204)
+
+
+class ApiCommentListView(ApiMixin, TaskAccessMixin, generic.View):
+    resource = COMMENT
+
+    def get(self, request, pk, task_pk):
+        return self.list_response(TaskComment.objects.filter(task=self.task))
+
+    def post(self, request, pk, task_pk):
+        comment = self.get_form(CommentForm).save(commit=False)
+        comment.task = self.task
+        comment.sender = request.user
+        comment.save()
+
+        return self.detail_response(comment, status=201)
+
+
+class ApiMessageListView(ApiMixin, ProjectMemberRequiredMixin, generic.View):
+    resource = MESSAGE
+
+    def get(self, request, pk):
+        return self.list_response(ChatMessage.objects.filter(project=self.project))
+
+    def post(self, request, pk):
+        message = self.get_form(ChatMessageForm).save(commit=False)
+        message.project = self.project
+        message.sender = request.user
+        message.save()
+
+        return self.detail_response(message, status=201)
@@ -0,0 +1,137 @@
+"""
+Async versions of the read-heavy views, enabled with ``TASKS_ASYNC_VIEWS``.
+
+They reuse the sync views for access checks, forms and context, and only
+replace the parts that hit the database with the async ORM, so that under
+ASGI a request waiting on the database does not hold a thread.
+"""
+import inspect
+
+from asgiref.sync import sync_to_async
+from django.shortcuts import render
+
+from tasks.conditional import aproject_version
+from tasks.counters import aget_dashboard_counts
+from tasks.forms import ChatMessageForm, CommentForm
+from tasks.pagination import akeyset_page
+from tasks.permissions import get_project_access
+from tasks.views import ChatMessagesView, IndexView, ProjectListView, ProjectTaskListView, TaskDetailView
+
+
+async def get_request_user(request):
+    def load():
+        request.user.is_authenticated
+        return request.user
+
+    return await sync_to_async(load)()
+
+
+class AsyncViewMixin:
+    """
+    Resolves the user and preloads the objects the sync access mixins need,
+    so their checks run without queries, then awaits the async handler.
+    """
+
+    async def preload(self, request):
+        pass
+
+    async def dispatch(self, request, *args, **kwargs):
+        user = await get_request_user(request)
+        if user.is_authenticated:
+            await self.preload(request)
+
+        response = super().dispatch(request, *args, **kwargs)
+        if inspect.isawaitable(response):
+            response = await response
+
+        return response
+
+
+class AsyncProjectMixin(AsyncViewMixin):
+    async def preload(self, request):
+        await get_project_access(request).aget_project(self.kwargs[self.project_url_kwarg])
+
+
+class AsyncTaskMixin(AsyncViewMixin):
+    async def preload(self, request):
+        await get_project_access(request).aget_task(
+            self.kwargs[self.project_url_kwarg], self.kwargs[self.task_url_kwarg]
+        )
+
+
+class AsyncConditionalMixin:
+    """Loads the version for ``ConditionalProjectMixin`` with the async ORM."""
+
+    async def preload(self, request):
+        await super().preload(request)
+        if request.method in ("GET", "HEAD"):
+            self.preloaded_version = await aproject_version(self.kwargs[self.project_url_kwarg])
+
+
+class AsyncListMixin:
+    async def render_list(self):
+        self.object_count = await self.object_list.acount()
+        context = self.get_context_data()
+
+        page = context["page_obj"]
+        objects = [obj async for obj in (page.object_list if page is not None else context["object_list"])]
+        if page is not None:
+            page.object_list = objects
+        context["object_list"] = objects
+        context[self.get_context_object_name(self.object_list)] = objects
+
+        return self.render_to_response(context)
+
+    def get_paginator(self, queryset, *args, **kwargs):
+        paginator = super().get_paginator(queryset, *args, **kwargs)
+        paginator.count = self.object_count
+
+        return paginator
+
+
+class AsyncIndexView(IndexView):
+    async def get(self, request, *args, **kwargs):
+        user = await get_request_user(request)
+        context = await aget_dashboard_counts(user) if user.is_authenticated else {}
+
+        return render(request, self.template_name, context)
+
+
+class AsyncProjectListView(AsyncViewMixin, AsyncListMixin, ProjectListView):
+    async def get(self, request, *args, **kwargs):
+        # Ranked search runs a raw query through the search backend.
+        self.object_list = await sync_to_async(self.get_queryset)()
+
+        return await self.render_list()
+
+
+class AsyncProjectTaskListView(AsyncConditionalMixin, AsyncProjectMixin, AsyncListMixin, ProjectTaskListView):
+    async def get(self, request, *args, **kwargs):
+        self.object_list = await sync_to_async(self.get_queryset)()
+
+        return await self.render_list()
+
+
+class AsyncChatMessagesView(AsyncProjectMixin, ChatMessagesView):
+    async def get(self, request, pk):
+        page = await akeyset_page(self.get_message_queryset(), self.paginate_by)
+
+        return render(request, "tasks/chat_messages.html", self.get_context_data(ChatMessageForm(), page))
+
+    async def post(self, request, pk):
+        return await sync_to_async(super().post)(request, pk)
+
+
+class AsyncTaskDetailView(AsyncConditionalMixin, AsyncTaskMixin, TaskDetailView):
+    async def get(self, request, pk, task_pk):
+        try:
+            comments = await akeyset_page(
+                self.get_comment_queryset(), self.paginate_by, before=request.GET.get("before") or None
+            )
+        except ValueError:
+            comments = await akeyset_page(self.get_comment_queryset(), self.paginate_by)
+
+        return render(request, "tasks/task_detail.html", self.get_context_data(CommentForm(), comments))
+
+    async def post(self, request, pk, task_pk):
+        return await sync_to_async(super().post)(request, pk, task_pk)
@@ -0,0 +1,58 @@
+from django.db.models import Count, Q
+
+from tasks.models import Task
+from tasks.pagination import KeysetPage, keyset_query
+
+COLUMNS = [status for status, _ in Task.STATUS_CHOICES]
+PRIORITIES = [priority for priority, _ in Task.PRIORITY_CHOICES]
+
+
+def column_counts(project):
+    """
+    Count the tasks and their priorities in every status column with one
+    grouped query.
+    """
+    rows = (
+        Task.objects
+        .filter(project=project)
+        .order_by()
+        .values("status")
+        .annotate(
+            total=Count("pk"),
+            **{priority.lower(): Count("pk", filter=Q(priority=priority)) for priority in PRIORITIES}
+        )
+    )
+
+    counts = {status: {"total": 0, "priorities": dict.fromkeys(PRIORITIES, 0)} for status in COLUMNS}
+    for row in rows:
+        counts[row["status"]] = {
+            "total": row["total"],
+            "priorities": {priority: row[priority.lower()] for priority in PRIORITIES},
+        }
+
+    return counts
+
+
+def column_page(project, status, limit, before=None):
+    """
+    Return up to ``limit`` tasks of one column, most recently moved first.
+    Pass ``last_cursor`` of a page as ``before`` to get the next one.
+    """
+    queryset = Task.objects.filter(project=project, status=status).select_related("creator", "task_type")
+    queryset, _ = keyset_query(queryset, limit, before=before, field="modified")
+    rows = list(queryset)
+
+    return KeysetPage(rows[:limit], len(rows) > limit, "modified")
+
+
+def get_board(project, limit):
+    counts = column_counts(project)
+
+    return [
+        {
+            "status": status,
+            **counts[status],
+            "tasks": column_page(project, status, limit) if counts[status]["total"] else KeysetPage([], False),
+        }
+        for status in COLUMNS
+    ]
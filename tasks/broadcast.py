@@ -0,0 +1,153 @@
+import asyncio
+import json
+import logging
+import select
+import threading
+import time
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import connection
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+def chat_channel(project_id):
+    return f"project_chat_{project_id}"
+
+
+class Subscription:
+    def __init__(self, broadcast, channel):
+        self.broadcast = broadcast
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue()
+
+    async def get(self):
+        return await self.queue.get()
+
+    def deliver(self, message):
+        if not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self.queue.put_nowait, message)
+
+    def close(self):
+        self.broadcast.unsubscribe(self)
+
+
+class InMemoryBroadcast:
+    """
+    Fans messages out to subscribers living in this process.
+
+    Enough for ``runserver``, a single ASGI worker and the test suite.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.subscribers = {}
+
+    def publish(self, channel, message):
+        self.deliver(channel, message)
+
+    def deliver(self, channel, message):
+        with self.lock:
+            subscribers = list(self.subscribers.get(channel, ()))
+
+        for subscription in subscribers:
+            subscription.deliver(message)
+
+    def subscribe(self, channel):
+        subscription = Subscription(self, channel)
+        with self.lock:
+            self.subscribers.setdefault(channel, set()).add(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            channel_subscribers = self.subscribers.get(subscription.channel, set())
+            channel_subscribers.discard(subscription)
+            if not channel_subscribers:
+                self.subscribers.pop(subscription.channel, None)
+
+
+class PostgresBroadcast(InMemoryBroadcast):
+    """
+    Relays messages between worker processes through Postgres LISTEN/NOTIFY.
+
+    Each process keeps one listening connection and fans notifications out
+    to its local subscribers, so any number of workers share one channel.
+    """
+
+    max_payload = 7900
+    poll_timeout = 1
+
+    def __init__(self):
+        super().__init__()
+        self.listener = None
+        self.listening = set()
+        self.pending = set()
+
+    def publish(self, channel, message):
+        payload = json.dumps(message)
+        if len(payload.encode()) > self.max_payload:
+            payload = json.dumps({"type": "resync"})
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", [channel, payload])
+
+    def subscribe(self, channel):
+        subscription = super().subscribe(channel)
+        with self.lock:
+            if channel not in self.listening:
+                self.listening.add(channel)
+                self.pending.add(channel)
+            if self.listener is None:
+                self.listener = threading.Thread(target=self.listen, name="postgres-broadcast", daemon=True)
+                self.listener.start()
+
+        return subscription
+
+    def listen(self):
+        import psycopg2
+
+        params = connection.get_connection_params()
+        while True:
+            try:
+                pg_connection = psycopg2.connect(**params)
+                pg_connection.autocommit = True
+                with self.lock:
+                    self.pending |= self.listening
+                self.consume(pg_connection)
+            except psycopg2.Error:
+                logger.exception("Broadcast listener lost its database connection, reconnecting.")
+                time.sleep(self.poll_timeout)
+
+    def consume(self, pg_connection):
+        with pg_connection.cursor() as cursor:
+            while True:
+                with self.lock:
+                    channels, self.pending = self.pending, set()
+                for channel in channels:
+                    cursor.execute(f'LISTEN "{channel}"')
+
+                if select.select([pg_connection], [], [], self.poll_timeout) == ([], [], []):
+                    continue
+
+                pg_connection.poll()
+                while pg_connection.notifies:
+                    notification = pg_connection.notifies.pop(0)
+                    self.deliver(notification.channel, json.loads(notification.payload))
+
+
+@lru_cache(maxsize=None)
+def get_broadcast():
+    return import_string(settings.TASKS_BROADCAST_BACKEND)()
+
+
+@receiver(setting_changed)
+def reset_broadcast(*, setting, **kwargs):
+    if setting == "TASKS_BROADCAST_BACKEND":
+        get_broadcast.cache_clear()
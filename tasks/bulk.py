@@ -0,0 +1,67 @@
+from django.db import transaction
+from django.utils import timezone
+
+from tasks.changelog import record_changes
+from tasks.conditional import invalidate_project_version
+from tasks.counters import invalidate_task_counts
+from tasks.models import ChangeLogEntry, Task
+
+NOT_FOUND = "No Task matches the given query."
+NOT_CREATOR = "Only the creator of a task can change it."
+
+
+def lock_tasks(project, user, ids):
+    """
+    Lock the requested tasks of ``project`` and split ``ids`` into the ones
+    ``user`` may change and a failure entry for each of the others.
+
+    The lock does not block foreign key checks, so add_dependency(), which
+    holds the project lock while it inserts an edge, cannot deadlock with
+    the project lock the change log takes next.
+    """
+    creators = dict(
+        Task.objects.select_for_update(no_key=True).filter(project=project, pk__in=ids).values_list("pk", "creator_id")
+    )
+
+    allowed, failed = [], []
+    for pk in ids:
+        if pk not in creators:
+            failed.append({"id": pk, "error": NOT_FOUND})
+        elif creators[pk] != user.pk:
+            failed.append({"id": pk, "error": NOT_CREATOR})
+        else:
+            allowed.append(pk)
+
+    return allowed, failed
+
+
+def owned_tasks(project, user, ids):
+    return Task.objects.filter(project=project, creator=user, pk__in=ids)
+
+
+def bulk_update_tasks(project, user, ids, changes):
+    modified = timezone.now()
+
+    with transaction.atomic():
+        allowed, failed = lock_tasks(project, user, ids)
+        if allowed:
+            owned_tasks(project, user, allowed).update(**changes, modified=modified)
+            record_changes(project.pk, ChangeLogEntry.TASK, allowed)
+
+    # .update() sends no post_save. The search index only covers name and
+    # description, but handing tasks to another worker changes both task counts.
+    if allowed:
+        invalidate_project_version([project.pk])
+    if allowed and "creator" in changes:
+        invalidate_task_counts([user.pk, changes["creator"].pk])
+
+    return allowed, failed, modified
+
+
+def bulk_delete_tasks(project, user, ids):
+    with transaction.atomic():
+        allowed, failed = lock_tasks(project, user, ids)
+        if allowed:
+            owned_tasks(project, user, allowed).delete()
+
+    return allowed, failed
@@ -0,0 +1,159 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from tasks.api import COMMENT, MESSAGE, PROJECT, TASK, WORKER
+from tasks.models import ChangeLogEntry, ChatMessage, Project, Task, TaskComment
+from tasks.pagination import decode_cursor, encode_cursor
+
+CHANGE_KINDS = {
+    Project: ChangeLogEntry.PROJECT,
+    Task: ChangeLogEntry.TASK,
+    TaskComment: ChangeLogEntry.COMMENT,
+    ChatMessage: ChangeLogEntry.MESSAGE,
+}
+
+RESOURCES = {
+    ChangeLogEntry.PROJECT: (PROJECT, lambda project_id: Project.objects.filter(pk=project_id)),
+    ChangeLogEntry.TASK: (TASK, lambda project_id: Task.objects.filter(project_id=project_id)),
+    ChangeLogEntry.COMMENT: (COMMENT, lambda project_id: TaskComment.objects.filter(task__project_id=project_id)),
+    ChangeLogEntry.MESSAGE: (MESSAGE, lambda project_id: ChatMessage.objects.filter(project_id=project_id)),
+    ChangeLogEntry.MEMBER: (
+        WORKER,
+        lambda project_id: get_user_model().objects.filter(
+            pk__in=Project.assignees.through.objects.filter(project_id=project_id).values("worker_id")
+        ),
+    ),
+}
+
+
+class CursorExpired(Exception):
+    pass
+
+
+def append_entries(project_id, entries):
+    """
+    Append ``(kind, object_id, action)`` entries to a project's log while
+    holding the project row lock, see ``ChangeLogEntry``.
+    """
+    if not project_id or not entries:
+        return
+
+    with transaction.atomic(savepoint=False):
+        # NO KEY UPDATE leaves inserts that reference the project, e.g. new tasks, unblocked.
+        list(Project.objects.select_for_update(no_key=True).filter(pk=project_id).order_by().values_list("pk"))
+        ChangeLogEntry.objects.bulk_create(
+            ChangeLogEntry(project_id=project_id, kind=kind, object_id=object_id, action=action)
+            for kind, object_id, action in entries
+        )
+
+
+def record_changes(project_id, kind, object_ids, action=ChangeLogEntry.UPSERT):
+    """Append entries for changes made outside of model signals, e.g. by ``.update()``."""
+    append_entries(project_id, [(kind, object_id, action) for object_id in object_ids])
+
+
+def retention(days=None):
+    return timedelta(days=settings.TASKS_CHANGELOG_RETENTION_DAYS if days is None else days)
+
+
+def make_cursor(last_pk, oldest_unread=None):
+    """
+    The time in a cursor is the age of the oldest entry it has not read
+    yet, or the read time when it has read everything. Retention removes
+    nothing a cursor still needs before that time expires it.
+    """
+    return encode_cursor(ChangeLogEntry(pk=last_pk, created=oldest_unread or timezone.now()), "created")
+
+
+def head_cursor(project_id):
+    last_pk = ChangeLogEntry.objects.filter(project_id=project_id).order_by("-pk").values_list("pk", flat=True).first()
+
+    return make_cursor(last_pk or 0)
+
+
+def read_changes(project_id, since, limit):
+    """
+    Return ``(changes, next cursor, has_more)`` for the entries after
+    ``since``. Each object appears once, with its current state, or as a
+    tombstone when its last entry is a delete. Objects deleted along with
+    their project only get the tombstone of the project.
+
+    Raises ``CursorExpired`` when entries after the cursor may have been
+    removed by retention.
+    """
+    created, last_pk = decode_cursor(since)
+    if created < timezone.now() - retention():
+        raise CursorExpired("The cursor has expired, download the project again.")
+
+    rows = list(ChangeLogEntry.objects.filter(project_id=project_id, pk__gt=last_pk).order_by("pk")[:limit + 1])
+    entries = rows[:limit]
+    if not entries:
+        return [], make_cursor(last_pk), False
+
+    latest = {}
+    for entry in entries:
+        latest.pop((entry.kind, entry.object_id), None)
+        latest[entry.kind, entry.object_id] = entry
+
+    current = {}
+    for kind, (resource, queryset) in RESOURCES.items():
+        ids = [object_id for (entry_kind, object_id), entry in latest.items()
+               if entry_kind == kind and entry.action == ChangeLogEntry.UPSERT]
+        if ids:
+            objects = resource.select(queryset(project_id).filter(pk__in=ids), resource.fields)
+            current.update({(kind, obj.pk): resource.serialize(obj, resource.fields) for obj in objects})
+
+    changes = []
+    for (kind, object_id), entry in latest.items():
+        data = current.get((kind, object_id))
+        if entry.action == ChangeLogEntry.UPSERT and data is None:
+            # Deleted since: a later entry carries the tombstone.
+            continue
+        change = {"kind": kind, "id": object_id, "action": entry.action}
+        if data is not None:
+            change["data"] = data
+        changes.append(change)
+
+    has_more = len(rows) > limit
+
+    return changes, make_cursor(entries[-1].pk, rows[limit].created if has_more else None), has_more
+
+
+def superseded_entries():
+    newer = ChangeLogEntry.objects.filter(
+        project_id=OuterRef("project_id"), kind=OuterRef("kind"), object_id=OuterRef("object_id"), pk__gt=OuterRef("pk")
+    )
+
+    return ChangeLogEntry.objects.filter(Exists(newer))
+
+
+def compact(batch_size=1000, retention_days=None):
+    """
+    Delete entries that a later entry for the same object supersedes,
+    entries past retention and entries of deleted projects, in batches.
+    Returns the number of deleted entries per reason.
+    """
+    orphaned = ChangeLogEntry.objects.exclude(project_id__in=Project.objects.values("pk"))
+    querysets = {
+        "superseded": superseded_entries(),
+        "expired": ChangeLogEntry.objects.filter(created__lt=timezone.now() - retention(retention_days)),
+        "orphaned": orphaned,
+    }
+
+    deleted = {}
+    for reason, queryset in querysets.items():
+        ids = queryset.order_by("pk").values_list("pk", flat=True)
+        deleted[reason] = 0
+        while True:
+            with transaction.atomic():
+                batch = list(ids[:batch_size])
+                if not batch:
+                    break
+                deleted[reason] += ChangeLogEntry.objects.filter(pk__in=batch).delete()[0]
+
+    return deleted
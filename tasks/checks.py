@@ -0,0 +1,22 @@
+from django.conf import settings
+from django.core.checks import Warning, register
+
+PROFILER_PACKAGES = ("debug_toolbar", "silk", "pyinstrument", "django_cprofile_middleware", "nplusone", "querycount")
+
+
+@register()
+def check_profilers_in_production(app_configs, **kwargs):
+    environment = getattr(settings, "ENVIRONMENT", "development" if settings.DEBUG else "production")
+    if environment != "production":
+        return []
+
+    return [
+        Warning(
+            f"{entry} is enabled while DEBUG is off.",
+            hint="Profilers add per-request overhead; enable them in the development settings only.",
+            obj=entry,
+            id="tasks.W001",
+        )
+        for entry in [*settings.INSTALLED_APPS, *settings.MIDDLEWARE]
+        if entry.split(".")[0] in PROFILER_PACKAGES
+    ]
@@ -0,0 +1,151 @@
+import hashlib
+import inspect
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Max, Q, Sum
+from django.middleware.csrf import get_token
+from django.utils.cache import get_conditional_response, patch_cache_control
+
+from tasks.fragments import bump_fragment_versions, fragment_version
+from tasks.models import ChatMessage, Project, Task, TaskComment
+
+VERSION_KEY = "tasks:conditional:project:v2:{}"
+TIMEOUT = 60 * 60 * 24
+
+
+def version_aggregates(project_id):
+    return [
+        (
+            Task.objects.filter(project_id=project_id).order_by(),
+            {"modified": Max("modified"), "tasks": Count("pk"), "comments": Sum("comment_count")},
+        ),
+        (
+            TaskComment.objects.filter(task__project_id=project_id).order_by(),
+            {"last_comment": Max("pk")},
+        ),
+        (
+            ChatMessage.objects.filter(project_id=project_id).order_by(),
+            {"last_message": Max("pk")},
+        ),
+        (
+            Project.assignees.through.objects.filter(project_id=project_id),
+            {"members": Count("pk"), "last_member": Max("pk")},
+        ),
+    ]
+
+
+def build_version(tasks, comments, messages, members):
+    """
+    Return the version tag of a project. It only depends on the data, so a
+    version recomputed after a cache eviction is the same.
+    """
+    return ":".join(str(value) for value in (
+        tasks["modified"].timestamp() if tasks["modified"] else 0, tasks["tasks"], tasks["comments"] or 0,
+        comments["last_comment"] or 0, messages["last_message"] or 0, members["members"], members["last_member"] or 0,
+    ))
+
+
+def project_version(project_id):
+    key = VERSION_KEY.format(project_id)
+    version = cache.get(key)
+    if version is None:
+        version = build_version(*(
+            queryset.aggregate(**aggregates) for queryset, aggregates in version_aggregates(project_id)
+        ))
+        cache.set(key, version, TIMEOUT)
+
+    return version
+
+
+async def aproject_version(project_id):
+    key = VERSION_KEY.format(project_id)
+    version = await cache.aget(key)
+    if version is None:
+        version = build_version(*[
+            await queryset.aaggregate(**aggregates) for queryset, aggregates in version_aggregates(project_id)
+        ])
+        await cache.aset(key, version, TIMEOUT)
+
+    return version
+
+
+def invalidate_project_version(project_ids):
+    keys = [VERSION_KEY.format(project_id) for project_id in set(project_ids) if project_id]
+    if keys:
+        # Deleting before commit would let a concurrent request cache the old state again.
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def invalidate_project_pages(project_ids):
+    """
+    Change the ETag of project pages whose version stays the same, e.g.
+    when a worker or task type they show is renamed. The ETag covers the
+    fragment version of the project.
+    """
+    project_ids = set(project_ids) - {None}
+    if project_ids:
+        transaction.on_commit(lambda: bump_fragment_versions(Project, project_ids))
+
+
+def worker_project_ids(workers):
+    """Projects with pages that show one of ``workers`` as task creator or comment sender."""
+    return set(Project.objects.filter(
+        Q(pk__in=Task.objects.filter(creator__in=workers).values("project_id"))
+        | Q(pk__in=TaskComment.objects.filter(sender__in=workers).values("task__project_id"))
+    ).values_list("pk", flat=True))
+
+
+class ConditionalProjectMixin:
+    """
+    Answers GET and HEAD with ``304 Not Modified``, without running the
+    view, while the project is unchanged. The ETag also covers what the
+    page shows about the user, so it is only ever reused by the same
+    browser.
+
+    There is no ``Last-Modified``: deleted comments and tasks or removed
+    members leave no date behind, so only the ETag notices them.
+
+    Goes after the access mixin, so only members learn the version.
+    """
+
+    preloaded_version = None
+
+    def get_etag(self, tag):
+        request = self.request
+        # Pages embed a token derived from the CSRF secret. get_token() picks
+        # the secret the response will set, so the first revalidation matches.
+        get_token(request)
+        parts = [
+            tag, request.user.pk, fragment_version(request.user), fragment_version(self.project),
+            request.META["CSRF_COOKIE"],
+        ]
+
+        return f"\"{hashlib.md5(':'.join(str(part) for part in parts).encode()).hexdigest()}\""
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD"):
+            return super().dispatch(request, *args, **kwargs)
+
+        etag = self.get_etag(self.preloaded_version or project_version(self.project.pk))
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = super().dispatch(request, *args, **kwargs)
+
+        if inspect.isawaitable(response):
+            async def add_validators():
+                return self.add_validators(await response, etag)
+
+            return add_validators()
+
+        return self.add_validators(response, etag)
+
+    @staticmethod
+    def add_validators(response, etag):
+        if response.status_code in (200, 304):
+            response.headers.setdefault("ETag", etag)
+            # Keep the page in the browser cache, but have it ask every time.
+            patch_cache_control(response, private=True, no_cache=True)
+
+        return response
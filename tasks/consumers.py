@@ -0,0 +1,85 @@
+import asyncio
+import json
+import re
+from http.cookies import SimpleCookie
+from importlib import import_module
+from types import SimpleNamespace
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user
+from django.http.request import split_domain_port, validate_host
+
+from tasks.broadcast import chat_channel, get_broadcast
+from tasks.permissions import accessible_projects
+
+CHAT_PATH = re.compile(r"^/ws/projects/(?P<pk>\d+)/chat/$")
+
+FORBIDDEN = 4403
+NOT_FOUND = 4404
+
+
+def get_headers(scope):
+    return {name.decode("latin1"): value.decode("latin1") for name, value in scope.get("headers", [])}
+
+
+def is_allowed_origin(headers):
+    origin = headers.get("origin")
+    if origin is None:
+        return True
+
+    host, _ = split_domain_port(origin.split("://", 1)[-1])
+    allowed_hosts = settings.ALLOWED_HOSTS or [".localhost", "127.0.0.1", "[::1]"]
+
+    return validate_host(host, allowed_hosts)
+
+
+@sync_to_async
+def get_scope_user(headers):
+    cookie = SimpleCookie(headers.get("cookie", ""))
+    session_key = cookie[settings.SESSION_COOKIE_NAME].value if settings.SESSION_COOKIE_NAME in cookie else None
+    session_store = import_module(settings.SESSION_ENGINE).SessionStore
+    request = SimpleNamespace(session=session_store(session_key))
+
+    return get_user(request)
+
+
+async def project_chat_socket(scope, receive, send, pk):
+    if (await receive())["type"] != "websocket.connect":
+        return
+
+    headers = get_headers(scope)
+    user = await get_scope_user(headers)
+    if (
+        not is_allowed_origin(headers)
+        or not user.is_authenticated
+        or not await accessible_projects(user).filter(pk=pk).aexists()
+    ):
+        await send({"type": "websocket.close", "code": FORBIDDEN})
+        return
+
+    subscription = get_broadcast().subscribe(chat_channel(pk))
+    await send({"type": "websocket.accept"})
+
+    async def forward():
+        while True:
+            message = await subscription.get()
+            await send({"type": "websocket.send", "text": json.dumps(message)})
+
+    forwarder = asyncio.create_task(forward())
+    try:
+        while (await receive())["type"] != "websocket.disconnect":
+            pass
+    finally:
+        forwarder.cancel()
+        subscription.close()
+
+
+async def websocket_application(scope, receive, send):
+    match = CHAT_PATH.match(scope["path"])
+    if match is None:
+        await receive()
+        await send({"type": "websocket.close", "code": NOT_FOUND})
+        return
+
+    await project_chat_socket(scope, receive, send, int(match["pk"]))
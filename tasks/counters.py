@@ -0,0 +1,54 @@
+from django.core.cache import cache
+
+from tasks.models import Task
+from tasks.permissions import accessible_projects
+
+PROJECTS_KEY = "tasks:counters:projects:{}"
+TASKS_KEY = "tasks:counters:tasks:{}"
+TIMEOUT = 60 * 60 * 24
+
+
+def get_dashboard_counts(user):
+    keys = dashboard_keys(user)
+    cached = cache.get_many(keys.values())
+
+    counts = {name: cached.get(key) for name, key in keys.items()}
+    if counts["num_projects"] is None:
+        counts["num_projects"] = accessible_projects(user).count()
+    if counts["num_tasks"] is None:
+        counts["num_tasks"] = Task.objects.filter(creator=user).count()
+
+    missing = {key: counts[name] for name, key in keys.items() if key not in cached}
+    if missing:
+        cache.set_many(missing, TIMEOUT)
+
+    return counts
+
+
+async def aget_dashboard_counts(user):
+    keys = dashboard_keys(user)
+    cached = await cache.aget_many(keys.values())
+
+    counts = {name: cached.get(key) for name, key in keys.items()}
+    if counts["num_projects"] is None:
+        counts["num_projects"] = await accessible_projects(user).acount()
+    if counts["num_tasks"] is None:
+        counts["num_tasks"] = await Task.objects.filter(creator=user).acount()
+
+    missing = {key: counts[name] for name, key in keys.items() if key not in cached}
+    if missing:
+        await cache.aset_many(missing, TIMEOUT)
+
+    return counts
+
+
+def dashboard_keys(user):
+    return {"num_projects": PROJECTS_KEY.format(user.pk), "num_tasks": TASKS_KEY.format(user.pk)}
+
+
+def invalidate_project_counts(user_ids):
+    cache.delete_many([PROJECTS_KEY.format(user_id) for user_id in set(user_ids) if user_id])
+
+
+def invalidate_task_counts(user_ids):
+    cache.delete_many([TASKS_KEY.format(user_id) for user_id in set(user_ids) if user_id])
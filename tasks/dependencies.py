@@ -0,0 +1,174 @@
+import threading
+import time
+from datetime import timedelta
+
+import networkx as nx
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+
+from tasks.models import Project, Task, TaskDependency
+
+VERSION_KEY = "tasks:dependencies:{}"
+
+# Tasks carry no estimates, so every open task counts as one day of work.
+WORK_DAY = timedelta(days=1)
+
+graphs = {}
+graphs_lock = threading.Lock()
+
+
+def graph_version(project_id):
+    key = VERSION_KEY.format(project_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+
+    return version
+
+
+def load_graph(project_id):
+    graph = nx.DiGraph()
+    graph.add_edges_from(TaskDependency.objects.filter(project_id=project_id).values_list("depends_on_id", "task_id"))
+
+    return graph
+
+
+def get_graph(project_id):
+    """
+    Return the project's dependency graph, with an edge from each
+    prerequisite to the task waiting on it.
+
+    Graphs are kept per process and reused while the shared version in the
+    cache is unchanged, which is good enough for reports but not for the
+    cycle check. Treat the returned graph as read-only: edge changes replace
+    it with an updated copy.
+    """
+    version = graph_version(project_id)
+    with graphs_lock:
+        cached = graphs.get(project_id)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    graph = load_graph(project_id)
+    with graphs_lock:
+        graphs[project_id] = (version, graph)
+
+    return graph
+
+
+def edge_changed(project_id, depends_on_id, task_id, added):
+    """
+    Bump the project's graph version and apply the edge to this process's
+    copy when it was current, so the next request does not reload the table.
+    """
+    key = VERSION_KEY.format(project_id)
+    previous = graph_version(project_id)
+    try:
+        version = cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), None)
+        version = None
+
+    with graphs_lock:
+        cached = graphs.pop(project_id, None)
+        if cached is None or version is None or cached[0] != previous or version != previous + 1:
+            return
+
+        graph = cached[1].copy()
+        if added:
+            graph.add_edge(depends_on_id, task_id)
+        elif graph.has_edge(depends_on_id, task_id):
+            graph.remove_edge(depends_on_id, task_id)
+            graph.remove_nodes_from([node for node in (depends_on_id, task_id) if not graph.degree(node)])
+        graphs[project_id] = (version, graph)
+
+
+def add_dependency(task, depends_on):
+    if task.pk == depends_on.pk:
+        raise ValidationError("A task cannot depend on itself.")
+    if task.project_id != depends_on.project_id:
+        raise ValidationError("Tasks can only depend on tasks of the same project.")
+
+    with transaction.atomic():
+        # Serialize edge inserts per project so two requests cannot close a cycle together.
+        list(Project.objects.select_for_update().filter(pk=task.project_id).values_list("pk"))
+
+        # Not the cached graph: its version is only bumped after the commit
+        # that releases the lock, so it can miss the edge added just before.
+        graph = load_graph(task.project_id)
+        if task.pk in graph and depends_on.pk in graph and nx.has_path(graph, task.pk, depends_on.pk):
+            path = nx.shortest_path(graph, task.pk, depends_on.pk)
+            names = dict(Task.objects.filter(pk__in=path).values_list("pk", "name"))
+            cycle = " -> ".join(names[pk] for pk in [task.pk, *reversed(path)])
+            raise ValidationError(f"This dependency would create a cycle: {cycle}.")
+
+        dependency, _ = TaskDependency.objects.get_or_create(
+            task=task, depends_on=depends_on, defaults={"project_id": task.project_id}
+        )
+
+    return dependency
+
+
+def remove_dependency(task, depends_on_id):
+    return TaskDependency.objects.filter(task=task, depends_on_id=depends_on_id).delete()[0]
+
+
+class DependencyReport:
+    """
+    Schedule of the open tasks in a project's dependency graph.
+
+    ``earliest`` is the first day a task can be finished once its open
+    prerequisites are done, ``latest`` the last day it can be finished
+    without missing its own deadline or one further down the chain, and
+    ``slack`` the difference in days. A negative slack means a deadline
+    cannot be met.
+    """
+
+    def __init__(self, graph, tasks, today):
+        self.tasks = tasks
+        self.dependencies = graph
+        open_ids = [pk for pk, task in tasks.items() if task["status"] != Task.DONE]
+        self.graph = graph.subgraph(open_ids)
+        order = list(nx.topological_sort(self.graph))
+
+        self.earliest = {}
+        for pk in order:
+            self.earliest[pk] = max(
+                (self.earliest[prerequisite] for prerequisite in self.graph.predecessors(pk)), default=today
+            ) + WORK_DAY
+
+        self.latest = {}
+        for pk in reversed(order):
+            limits = [
+                self.latest[dependent] - WORK_DAY
+                for dependent in self.graph.successors(pk) if self.latest[dependent] is not None
+            ]
+            if tasks[pk]["deadline"] is not None:
+                limits.append(tasks[pk]["deadline"])
+            self.latest[pk] = min(limits, default=None)
+
+        self.slack = {
+            pk: (self.latest[pk] - self.earliest[pk]).days if self.latest[pk] is not None else None
+            for pk in order
+        }
+        self.critical_path = nx.dag_longest_path(self.graph)
+
+    @property
+    def blocked(self):
+        """Open tasks waiting on at least one prerequisite that is not done."""
+        return [pk for pk in self.graph if self.graph.in_degree(pk)]
+
+
+def dependency_report(project, today=None):
+    graph = get_graph(project.pk)
+    tasks = {
+        task["id"]: task
+        for task in Task.objects.filter(project=project, pk__in=list(graph)).order_by("pk").values(
+            "id", "name", "status", "deadline"
+        )
+    }
+
+    return DependencyReport(graph.subgraph(tasks), tasks, today or timezone.localdate())
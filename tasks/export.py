@@ -0,0 +1,113 @@
+import csv
+import json
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+
+from tasks.models import ChatMessage, Task, TaskComment
+
+CHUNK_SIZE = 2000
+BUFFER_SIZE = 64 * 1024
+FORMATS = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson"}
+
+# Each export is a flat values_list() query, so no model instances are built
+# and related names come from the same SELECT.
+EXPORTS = {
+    "tasks": (
+        lambda project: Task.objects.filter(project=project).order_by("pk"),
+        {
+            "id": "id",
+            "name": "name",
+            "description": "description",
+            "status": "status",
+            "priority": "priority",
+            "deadline": "deadline",
+            "task_type": "task_type__name",
+            "creator": "creator__username",
+            "comment_count": "comment_count",
+            "modified": "modified",
+        },
+    ),
+    "comments": (
+        lambda project: TaskComment.objects.filter(task__project=project).order_by("task_id", "date", "pk"),
+        {
+            "id": "id",
+            "task_id": "task_id",
+            "task": "task__name",
+            "sender": "sender__username",
+            "date": "date",
+            "message": "message",
+        },
+    ),
+    "messages": (
+        lambda project: ChatMessage.objects.filter(project=project).order_by("date", "pk"),
+        {
+            "id": "id",
+            "sender": "sender__username",
+            "date": "date",
+            "message": "message",
+        },
+    ),
+}
+
+
+class Echo:
+    """
+    File-like object that hands back what csv.writer writes to it.
+    """
+
+    def write(self, value):
+        return value
+
+
+def export_rows(project, kind, chunk_size=CHUNK_SIZE):
+    get_queryset, columns = EXPORTS[kind]
+
+    return get_queryset(project).values_list(*columns.values()).iterator(chunk_size=chunk_size)
+
+
+def export_lines(project, kind, fmt, chunk_size=CHUNK_SIZE):
+    names = list(EXPORTS[kind][1])
+    rows = export_rows(project, kind, chunk_size)
+
+    if fmt == "ndjson":
+        for row in rows:
+            yield json.dumps(dict(zip(names, row)), cls=DjangoJSONEncoder) + "\n"
+        return
+
+    writer = csv.writer(Echo())
+    yield writer.writerow(names)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def stream_export(project, kind, fmt, chunk_size=CHUNK_SIZE, buffer_size=BUFFER_SIZE):
+    """
+    Yield the export in blocks of about ``buffer_size`` characters, holding
+    at most one chunk of rows in memory.
+    """
+    buffer, size = [], 0
+    for line in export_lines(project, kind, fmt, chunk_size):
+        buffer.append(line)
+        size += len(line)
+        if size >= buffer_size:
+            yield "".join(buffer)
+            buffer, size = [], 0
+
+    if buffer:
+        yield "".join(buffer)
+
+
+async def astream_export(project, kind, fmt, chunk_size=CHUNK_SIZE, buffer_size=BUFFER_SIZE):
+    """
+    ``stream_export()`` for ASGI servers, which read a sync iterator into a
+    list before sending it. Each block is fetched on the thread that holds
+    the database cursor.
+    """
+    blocks = stream_export(project, kind, fmt, chunk_size, buffer_size)
+    next_block = sync_to_async(next, thread_sensitive=True)
+    try:
+        while (block := await next_block(blocks, None)) is not None:
+            yield block
+    finally:
+        await sync_to_async(blocks.close, thread_sensitive=True)()
@@ -5,6 +5,7 @@ from django.contrib.auth.forms import (
     PasswordChangeForm,
     UsernameField
 )
+from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 
 from tasks.models import Project, ChatMessage, Worker, Task, TaskComment, TaskType
@@ -204,6 +205,99 @@ class ProjectTaskSearchForm(forms.Form):
     }))
 
 
+class TaskFilterForm(forms.Form):
+    status = forms.MultipleChoiceField(choices=Task.STATUS_CHOICES, required=False)
+    priority = forms.MultipleChoiceField(choices=Task.PRIORITY_CHOICES, required=False)
+    deadline_after = forms.DateField(required=False)
+    deadline_before = forms.DateField(required=False)
+
+    def filter(self, queryset):
+        lookups = {
+            "status__in": self.cleaned_data["status"],
+            "priority__in": self.cleaned_data["priority"],
+            "deadline__gte": self.cleaned_data["deadline_after"],
+            "deadline__lte": self.cleaned_data["deadline_before"],
+        }
+
+        return queryset.filter(**{lookup: value for lookup, value in lookups.items() if value})
+
+
+class TaskIdsField(forms.Field):
+    widget = forms.MultipleHiddenInput
+    max_ids = 500
+
+    def to_python(self, value):
+        if not value:
+            return []
+
+        try:
+            ids = list(dict.fromkeys(int(pk) for pk in value))
+        except (TypeError, ValueError):
+            raise forms.ValidationError("Task ids must be integers.")
+
+        if len(ids) > self.max_ids:
+            raise forms.ValidationError(f"At most {self.max_ids} tasks can be changed at once.")
+
+        return ids
+
+
+class TaskBulkForm(forms.Form):
+    ids = TaskIdsField()
+
+
+class TaskBulkUpdateForm(TaskBulkForm):
+    status = forms.ChoiceField(choices=Task.STATUS_CHOICES, required=False)
+    priority = forms.ChoiceField(choices=Task.PRIORITY_CHOICES, required=False)
+    deadline = forms.DateField(required=False)
+    clear_deadline = forms.BooleanField(required=False)
+    task_type = forms.ModelChoiceField(queryset=TaskType.objects.all(), required=False)
+    creator = forms.ModelChoiceField(queryset=Worker.objects.none(), required=False)
+
+    def __init__(self, *args, project, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["creator"].queryset = Worker.objects.filter(
+            Q(pk=project.creator_id) | Q(projects=project)
+        ).distinct()
+
+    def clean(self):
+        cleaned_data = super().clean()
+
+        if cleaned_data.get("deadline") and cleaned_data.get("clear_deadline"):
+            raise forms.ValidationError("Set a deadline or clear it, not both.")
+        if not self.errors and not self.get_changes():
+            raise forms.ValidationError("Choose at least one field to change.")
+
+        return cleaned_data
+
+    def get_changes(self):
+        changes = {
+            name: self.cleaned_data[name]
+            for name in ("status", "priority", "deadline", "task_type", "creator")
+            if self.cleaned_data.get(name)
+        }
+        if self.cleaned_data.get("clear_deadline"):
+            changes["deadline"] = None
+
+        return changes
+
+
+class TaskDependencyForm(forms.Form):
+    depends_on = forms.ModelChoiceField(queryset=Task.objects.none())
+
+    def __init__(self, *args, task, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["depends_on"].queryset = Task.objects.filter(project_id=task.project_id).exclude(pk=task.pk)
+
+
+class TaskImportForm(forms.Form):
+    file = forms.FileField(widget=forms.ClearableFileInput(attrs={"class": "form-control"}))
+    format = forms.ChoiceField(
+        choices=[("csv", "CSV"), ("ndjson", "NDJSON")],
+        widget=forms.Select(attrs={"class": "form-control"})
+    )
+    create_task_types = forms.BooleanField(required=False, label="Create missing task types")
+
+
 class ProfileForm(forms.ModelForm):
     class Meta:
         model = Worker
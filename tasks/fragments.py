@@ -0,0 +1,27 @@
+import time
+
+from django.core.cache import cache
+
+VERSION_KEY = "tasks:fragments:{}:{}"
+
+
+def fragment_version(instance):
+    if getattr(instance, "pk", None) is None:
+        return 0
+
+    key = VERSION_KEY.format(instance._meta.label_lower, instance.pk)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+
+    return version
+
+
+def bump_fragment_version(instance):
+    cache.set(VERSION_KEY.format(instance._meta.label_lower, instance.pk), time.time_ns(), None)
+
+
+def bump_fragment_versions(model, pks):
+    version = time.time_ns()
+    cache.set_many({VERSION_KEY.format(model._meta.label_lower, pk): version for pk in pks}, None)
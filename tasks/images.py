@@ -0,0 +1,73 @@
+import hashlib
+import os
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+
+THUMBNAIL_DIR = "profile_pictures/thumbnails"
+THUMBNAIL_SIZES = (32, 64, 256)
+THUMBNAIL_FORMATS = {"webp": "WEBP", "jpg": "JPEG"}
+MAX_ORIGINAL_SIZE = 1024
+QUALITY = 85
+
+
+def thumbnail_name(digest, size, extension):
+    return f"{THUMBNAIL_DIR}/{digest}-{size}.{extension}"
+
+
+def open_image(file):
+    file.seek(0)
+    image = Image.open(file)
+    image = ImageOps.exif_transpose(image)
+
+    return image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+
+
+def encode(image, image_format):
+    if image_format == "JPEG" and image.mode != "RGB":
+        background = Image.new("RGB", image.size, "white")
+        background.paste(image, mask=image.getchannel("A"))
+        image = background
+
+    buffer = BytesIO()
+    image.save(buffer, image_format, quality=QUALITY, optimize=image_format == "JPEG")
+
+    return buffer.getvalue()
+
+
+def sanitize_upload(file):
+    """
+    Re-encode an uploaded image without EXIF data, rotated upright and
+    capped at ``MAX_ORIGINAL_SIZE`` pixels on the longest side.
+    """
+    image = open_image(file)
+    image.thumbnail((MAX_ORIGINAL_SIZE, MAX_ORIGINAL_SIZE))
+    image_format = "PNG" if image.mode == "RGBA" else "JPEG"
+    name = f"{os.path.splitext(os.path.basename(file.name))[0]}.{'png' if image_format == 'PNG' else 'jpg'}"
+
+    return ContentFile(encode(image, image_format), name=name)
+
+
+def generate_thumbnails(worker):
+    worker.profile_image.open("rb")
+    try:
+        source = worker.profile_image.read()
+    finally:
+        worker.profile_image.close()
+
+    digest = hashlib.sha256(source).hexdigest()[:16]
+    image = open_image(BytesIO(source))
+
+    for size in THUMBNAIL_SIZES:
+        thumbnail = ImageOps.fit(image, (size, size), Image.LANCZOS)
+        for extension, image_format in THUMBNAIL_FORMATS.items():
+            name = thumbnail_name(digest, size, extension)
+            if not default_storage.exists(name):
+                default_storage.save(name, ContentFile(encode(thumbnail, image_format)))
+
+    worker.profile_image_hash = digest
+    worker.save(update_fields=["profile_image_hash"])
+
+    return digest
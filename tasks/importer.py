@@ -0,0 +1,158 @@
+import csv
+import json
+import time
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from tasks.changelog import record_changes
+from tasks.conditional import invalidate_project_version
+from tasks.counters import invalidate_task_counts
+from tasks.forms import TaskForm
+from tasks.models import ChangeLogEntry, Task, TaskType
+from tasks.search.indexing import index_new_instances
+
+FORMATS = ("csv", "ndjson")
+FIELDS = ("name", "description", "deadline", "priority", "status")
+BATCH_SIZE = 1000
+
+
+def read_rows(file, fmt):
+    """
+    Yield ``(line number, row)`` pairs from a text file. A row is a dict, or
+    the raw line when an NDJSON line is not a JSON object.
+    """
+    if fmt == "ndjson":
+        for line_number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                row = line
+            yield line_number, row if isinstance(row, dict) else line.rstrip("\n")
+        return
+
+    reader = csv.DictReader(file)
+    for row in reader:
+        yield reader.line_num, row
+
+
+class ErrorFile:
+    """
+    Writes rejected rows in the input format, with their errors attached,
+    so they can be fixed and imported again.
+    """
+
+    def __init__(self, file, fmt):
+        self.file = file
+        self.fmt = fmt
+        self.writer = None
+
+    def __call__(self, line_number, row, errors):
+        if self.fmt == "ndjson":
+            self.file.write(json.dumps({"line": line_number, "errors": errors, "row": row}) + "\n")
+            return
+
+        if self.writer is None:
+            columns = [column for column in row if column is not None]
+            self.writer = csv.DictWriter(self.file, ["line", "errors", *columns], extrasaction="ignore")
+            self.writer.writeheader()
+        messages = "; ".join(f"{field}: {' '.join(values)}" for field, values in errors.items())
+        self.writer.writerow({**row, "line": line_number, "errors": messages})
+
+
+class TaskImporter:
+    """
+    Validates rows with the field rules of ``TaskForm`` and inserts the
+    valid ones with ``bulk_create``, one transaction per batch.
+    """
+
+    def __init__(self, project, creator, batch_size=BATCH_SIZE, create_task_types=False):
+        self.project = project
+        self.creator = creator
+        self.batch_size = batch_size
+        self.create_task_types = create_task_types
+        self.fields = {name: TaskForm.base_fields[name] for name in FIELDS}
+        self.task_types = {name.casefold(): pk for pk, name in TaskType.objects.values_list("pk", "name")}
+        self.created = self.failed = 0
+        self.elapsed = 0.0
+
+    def run(self, rows, on_error=None):
+        started = time.perf_counter()
+        batch = []
+
+        for line_number, row in rows:
+            task, errors = self.build(row)
+            if errors:
+                self.failed += 1
+                if on_error is not None:
+                    on_error(line_number, row, errors)
+                continue
+
+            batch.append(task)
+            if len(batch) == self.batch_size:
+                self.insert(batch)
+                batch = []
+
+        if batch:
+            self.insert(batch)
+        if self.created:
+            invalidate_task_counts([self.creator.pk])
+            invalidate_project_version([self.project.pk])
+
+        self.elapsed = time.perf_counter() - started
+
+        return self.created, self.failed
+
+    def build(self, row):
+        if not isinstance(row, dict):
+            return None, {"__all__": ["Each line must be a JSON object."]}
+
+        values, errors = {}, {}
+        for name, field in self.fields.items():
+            try:
+                values[name] = field.clean(row.get(name))
+            except ValidationError as error:
+                errors[name] = error.messages
+
+        task_type_id = self.resolve_task_type(str(row.get("task_type") or "").strip(), errors)
+        if errors:
+            return None, errors
+
+        task = Task(**values, task_type_id=task_type_id, project=self.project, creator=self.creator)
+        # Same exclusions as ModelForm: relations are set here and optional form fields may stay empty.
+        exclude = ["task_type", "project", "creator", "comment_count"] + [
+            name for name, field in self.fields.items() if not field.required and values[name] in field.empty_values
+        ]
+        try:
+            task.clean_fields(exclude=exclude)
+        except ValidationError as error:
+            return None, error.message_dict
+
+        return task, None
+
+    def resolve_task_type(self, name, errors):
+        if not name:
+            errors["task_type"] = [TaskForm.base_fields["task_type"].error_messages["required"]]
+            return None
+
+        if name.casefold() not in self.task_types:
+            if not self.create_task_types or len(name) > TaskType._meta.get_field("name").max_length:
+                errors["task_type"] = [f"Unknown task type \"{name}\"."]
+                return None
+            self.task_types[name.casefold()] = TaskType.objects.create(name=name).pk
+
+        return self.task_types[name.casefold()]
+
+    def insert(self, batch):
+        with transaction.atomic():
+            Task.objects.bulk_create(batch)
+            index_new_instances(batch)
+            record_changes(self.project.pk, ChangeLogEntry.TASK, [task.pk for task in batch])
+
+        self.created += len(batch)
+
+    @property
+    def rows_per_second(self):
+        return (self.created + self.failed) / self.elapsed if self.elapsed else 0
@@ -0,0 +1,203 @@
+import logging
+import os
+import socket
+import threading
+import time
+import traceback
+from datetime import date, timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import close_old_connections, connection
+from django.db.models import F
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from tasks import changelog, images
+from tasks.models import Job
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 3
+BACKOFF = 10
+MAX_BACKOFF = 3600
+HEARTBEAT_INTERVAL = timedelta(seconds=30)
+STALE_AFTER = timedelta(minutes=5)
+
+HANDLERS = {}
+
+
+def register(func):
+    """Make ``func`` available to ``enqueue()`` under its function name."""
+    HANDLERS[func.__name__] = func
+
+    return func
+
+
+def enqueue(name, payload=None, *, delay=None, max_attempts=MAX_ATTEMPTS):
+    """
+    Store a job for ``run_worker``. Inside a transaction the job only
+    becomes visible to workers once the surrounding changes are committed.
+    """
+    if name not in HANDLERS:
+        raise ValueError(f"Unknown job \"{name}\".")
+
+    run_at = timezone.now() + delay if delay else timezone.now()
+
+    return Job.objects.create(name=name, payload=payload or {}, run_at=run_at, max_attempts=max_attempts)
+
+
+def backoff(attempts):
+    return timedelta(seconds=min(BACKOFF * 2 ** (attempts - 1), MAX_BACKOFF))
+
+
+def default_worker_name():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def claim(worker_name):
+    """
+    Mark the oldest due job as running and return it, or ``None`` when the
+    queue is empty. The conditional update makes sure only one of several
+    competing workers gets each job.
+    """
+    while True:
+        candidate = (
+            Job.objects
+            .filter(status=Job.QUEUED, run_at__lte=timezone.now())
+            .order_by("run_at", "pk")
+            .values_list("pk", "attempts")
+            .first()
+        )
+        if candidate is None:
+            return None
+
+        pk, attempts = candidate
+        started = timezone.now()
+        claimed = Job.objects.filter(pk=pk, status=Job.QUEUED).update(
+            status=Job.RUNNING, attempts=attempts + 1, started=started, finished=None, duration=None,
+            heartbeat=started, locked_by=worker_name
+        )
+        if claimed:
+            return Job.objects.get(pk=pk)
+
+
+def claimed(job):
+    """The job row while it is still held by the run ``job`` was claimed for."""
+    return Job.objects.filter(pk=job.pk, status=Job.RUNNING, locked_by=job.locked_by, attempts=job.attempts)
+
+
+def keep_alive(job, stop, interval):
+    """Refresh the heartbeat of a running job until ``stop`` is set or the job was requeued."""
+    while not stop.wait(interval.total_seconds()):
+        if not claimed(job).update(heartbeat=timezone.now()):
+            break
+
+
+def execute(job, heartbeat_interval=HEARTBEAT_INTERVAL):
+    """Run a claimed job and record its outcome, retrying failures with exponential backoff."""
+    started = time.perf_counter()
+    stop = threading.Event()
+
+    def beat():
+        try:
+            keep_alive(job, stop, heartbeat_interval)
+        finally:
+            connection.close()
+
+    heartbeat = threading.Thread(target=beat, daemon=True)
+    heartbeat.start()
+    try:
+        handler = HANDLERS.get(job.name)
+        if handler is None:
+            raise LookupError(f"No handler registered for job \"{job.name}\".")
+        handler(**job.payload)
+    except Exception:
+        job.last_error = traceback.format_exc()
+        if job.attempts < job.max_attempts:
+            job.status = Job.QUEUED
+            job.run_at = timezone.now() + backoff(job.attempts)
+        else:
+            job.status = Job.FAILED
+        logger.exception("Job %s (%s) failed on attempt %s.", job.pk, job.name, job.attempts)
+    else:
+        job.status = Job.DONE
+        job.last_error = ""
+    finally:
+        stop.set()
+        heartbeat.join()
+
+    job.duration = timedelta(seconds=time.perf_counter() - started)
+    job.finished = timezone.now()
+    # A job requeued after missing its heartbeats may be running elsewhere by
+    # now, that run records the outcome instead.
+    if not claimed(job).update(
+        status=job.status, run_at=job.run_at, last_error=job.last_error, duration=job.duration, finished=job.finished
+    ):
+        logger.warning("Job %s (%s) was requeued while running, its outcome is not recorded.", job.pk, job.name)
+    logger.info("Job %s (%s) %s in %.1fms.", job.pk, job.name, job.status, job.duration.total_seconds() * 1000)
+
+    return job
+
+
+def requeue_stale(older_than=STALE_AFTER):
+    """
+    Put back jobs whose worker stopped refreshing their heartbeat, see
+    ``keep_alive()``. Long jobs of live workers are left running.
+    """
+    stale = Job.objects.alias(last_seen=Coalesce("heartbeat", "started")).filter(
+        status=Job.RUNNING, last_seen__lt=timezone.now() - older_than
+    )
+    failed = stale.filter(attempts__gte=F("max_attempts")).update(
+        status=Job.FAILED, last_error="The worker running this job stopped responding."
+    )
+    requeued = stale.update(status=Job.QUEUED, run_at=timezone.now())
+
+    return requeued, failed
+
+
+def purge(older_than):
+    return Job.objects.filter(status=Job.DONE, finished__lt=timezone.now() - older_than).delete()[0]
+
+
+def work(worker_name, stop, poll_interval=1.0, burst=False, on_finish=None):
+    """
+    Claim and execute jobs until ``stop`` is set, or until the queue is
+    empty when ``burst`` is true.
+    """
+    while not stop.is_set():
+        job = claim(worker_name)
+        if job is None:
+            if burst:
+                break
+            # Idle workers drop connections that are broken or past CONN_MAX_AGE.
+            close_old_connections()
+            stop.wait(poll_interval)
+            continue
+
+        execute(job)
+        if on_finish is not None:
+            on_finish(job)
+
+
+@register
+def generate_thumbnails(worker_id):
+    worker = get_user_model().objects.filter(pk=worker_id).exclude(profile_image="").first()
+    if worker is not None:
+        images.generate_thumbnails(worker)
+
+
+@register
+def delete_stale_tasks(batch_size=1000, since=None):
+    out = StringIO()
+    call_command(
+        "delete_tasks", batch_size=batch_size, since=date.fromisoformat(since) if since else None, stdout=out
+    )
+    logger.info(out.getvalue().strip().splitlines()[-1])
+
+
+@register
+def compact_changelog(batch_size=1000, retention_days=None):
+    deleted = changelog.compact(batch_size, retention_days)
+    logger.info("Compacted the change log: %s", ", ".join(f"{count} {reason}" for reason, count in deleted.items()))
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from tasks.models import Task, TaskComment
+
+
+class Command(BaseCommand):
+    help = "Recalculate the denormalized comment_count of every task"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000, help="Number of tasks updated per transaction.")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be a positive integer.")
+
+        counts = (
+            TaskComment.objects
+            .filter(task=OuterRef("pk"))
+            .order_by()
+            .values("task")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        task_ids = Task.objects.order_by("pk").values_list("pk", flat=True)
+        last_pk = 0
+        updated = 0
+
+        while True:
+            batch = list(task_ids.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                break
+
+            with transaction.atomic():
+                updated += Task.objects.filter(pk__in=batch).update(comment_count=Coalesce(Subquery(counts), 0))
+            last_pk = batch[-1]
+
+        self.stdout.write(self.style.SUCCESS(f"Recalculated comment counts for {updated} tasks."))
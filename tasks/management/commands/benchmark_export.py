@@ -0,0 +1,116 @@
+import gc
+import os
+import resource
+import time
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import AsyncRequestFactory, RequestFactory
+from django.urls import reverse
+
+from tasks.export import EXPORTS, FORMATS
+from tasks.models import ChatMessage, Project, Task, TaskComment
+from tasks.views import ProjectExportView
+
+
+def current_rss_kb():
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        # Outside Linux only the peak is available.
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+class Command(BaseCommand):
+    help = "Stream exports of growing size and report how much the process RSS grows while streaming"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 1_000_000], help="Export sizes to run.")
+        parser.add_argument("--kind", choices=EXPORTS, default="messages")
+        parser.add_argument("--format", choices=FORMATS, default="csv")
+        parser.add_argument("--batch-size", type=int, default=5000, help="Rows inserted per query while seeding.")
+        parser.add_argument(
+            "--interface",
+            choices=["wsgi", "asgi"],
+            default="wsgi",
+            help="Stream the response the way the WSGI or the ASGI handler consumes it."
+        )
+
+    def handle(self, *args, **options):
+        if min(options["rows"]) < 1 or options["batch_size"] < 1:
+            raise CommandError("--rows and --batch-size must be positive integers.")
+
+        self.stdout.write(f"{'rows':>10}{'MB written':>12}{'seconds':>10}{'rows/s':>10}{'RSS growth MB':>15}")
+        for rows in options["rows"]:
+            # The data only lives for one run: everything is rolled back afterwards.
+            with transaction.atomic():
+                project = self.seed(rows, options["kind"], options["batch_size"])
+                written, elapsed, growth = self.measure(
+                    project, options["kind"], options["format"], options["interface"]
+                )
+                transaction.set_rollback(True)
+
+            self.stdout.write(
+                f"{rows:>10}{written / 1024 / 1024:>12.1f}{elapsed:>10.2f}{rows / elapsed:>10.0f}{growth / 1024:>15.1f}"
+            )
+
+    @staticmethod
+    def seed(rows, kind, batch_size):
+        worker = get_user_model().objects.create(username=f"export-benchmark-{time.time_ns()}")
+        project = Project.objects.create(title="Export benchmark", description="", creator=worker)
+
+        if kind == "tasks":
+            model, build = Task, lambda index: Task(
+                name=f"Task {index}", description="Exported task", project=project, creator=worker
+            )
+        elif kind == "comments":
+            task = Task.objects.create(name="Commented task", description="", project=project, creator=worker)
+            model, build = TaskComment, lambda index: TaskComment(
+                task=task, sender=worker, message=f"Comment {index}"
+            )
+        else:
+            model, build = ChatMessage, lambda index: ChatMessage(
+                project=project, sender=worker, message=f"Message {index}"
+            )
+
+        for start in range(0, rows, batch_size):
+            model.objects.bulk_create([build(index) for index in range(start, min(start + batch_size, rows))])
+
+        return project
+
+    @staticmethod
+    def measure(project, kind, fmt, interface):
+        factory = AsyncRequestFactory() if interface == "asgi" else RequestFactory()
+        request = factory.get(reverse("tasks:project-export", kwargs={"pk": project.pk, "kind": kind}), {
+            "format": fmt
+        })
+        request.user = project.creator
+
+        gc.collect()
+        baseline = peak = current_rss_kb()
+        written = 0
+        started = time.perf_counter()
+
+        def track(index, chunk):
+            nonlocal written, peak
+            written += len(chunk)
+            if index % 16 == 0:
+                peak = max(peak, current_rss_kb())
+
+        response = ProjectExportView.as_view()(request, pk=project.pk, kind=kind)
+        if response.is_async:
+            async def consume():
+                index = 0
+                async for chunk in response.streaming_content:
+                    track(index, chunk)
+                    index += 1
+
+            async_to_sync(consume)()
+        else:
+            for index, chunk in enumerate(response.streaming_content):
+                track(index, chunk)
+
+        return written, time.perf_counter() - started, max(peak, current_rss_kb()) - baseline
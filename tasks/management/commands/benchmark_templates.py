@@ -0,0 +1,61 @@
+import time
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.template.loader import get_template
+from django.test import RequestFactory, override_settings
+
+from tasks.models import Project
+
+DUMMY_CACHES = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+
+
+class Command(BaseCommand):
+    help = "Compare render times of the layout fragments with and without the fragment cache"
+
+    templates = [
+        "includes/head.html",
+        "includes/sidebar.html",
+        "includes/navigation.html",
+        "layouts/base.html",
+    ]
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=500, help="Renders per template and mode.")
+        parser.add_argument("--project", type=int, help="Project to render the fragments for (defaults to the first one).")
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        if iterations < 1:
+            raise CommandError("--iterations must be a positive integer.")
+
+        project = Project.objects.filter(pk=options["project"]) if options["project"] else Project.objects.all()
+        project = project.select_related("creator").first()
+        if project is None:
+            raise CommandError("Create a project first, e.g. with the generate_load_data command.")
+
+        request = RequestFactory().get(project.get_absolute_url())
+        request.user = project.creator
+        context = {"project": project, "show_tabs": True, "show_search": True}
+
+        self.stdout.write(f"{'template':<28}{'uncached ms':>14}{'cached ms':>12}{'saved':>9}")
+        for name in self.templates:
+            template = get_template(name)
+
+            with override_settings(CACHES=DUMMY_CACHES):
+                uncached = self.measure(template, context, request, iterations)
+
+            cache.clear()
+            template.render(context, request)
+            cached = self.measure(template, context, request, iterations)
+
+            saved = (1 - cached / uncached) * 100 if uncached else 0
+            self.stdout.write(f"{name:<28}{uncached:>14.3f}{cached:>12.3f}{saved:>8.1f}%")
+
+    @staticmethod
+    def measure(template, context, request, iterations):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            template.render(context, request)
+
+        return (time.perf_counter() - started) * 1000 / iterations
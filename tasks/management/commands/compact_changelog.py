@@ -0,0 +1,43 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from tasks import changelog
+from tasks.jobs import enqueue
+
+
+class Command(BaseCommand):
+    help = "Delete superseded, expired and orphaned entries from the project change log"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="Number of entries deleted per transaction.")
+        parser.add_argument(
+            "--retention-days",
+            type=int,
+            default=settings.TASKS_CHANGELOG_RETENTION_DAYS,
+            help="Delete entries older than this many days. Clients with an older cursor have to resync."
+        )
+        parser.add_argument(
+            "--enqueue",
+            action="store_true",
+            help="Queue the compaction for run_worker instead of running it now."
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be a positive integer.")
+        if options["retention_days"] < 1:
+            raise CommandError("--retention-days must be a positive integer.")
+
+        if options["enqueue"]:
+            job = enqueue("compact_changelog", {
+                "batch_size": options["batch_size"],
+                "retention_days": options["retention_days"],
+            })
+            self.stdout.write(self.style.SUCCESS(f"Queued job {job.pk}."))
+            return
+
+        deleted = changelog.compact(options["batch_size"], options["retention_days"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Deleted {deleted['superseded']} superseded, {deleted['expired']} expired "
+            f"and {deleted['orphaned']} orphaned change log entries."
+        ))
@@ -1,18 +1,103 @@
-from django.core.management.base import BaseCommand
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count, Q
 from django.utils import timezone
+from tasks.jobs import enqueue
 from tasks.models import Task
 
 
 class Command(BaseCommand):
     help = "Delete tasks based on their deadline and status"
 
-    def handle(self, *args, **kwargs):
-        tasks = Task.objects.all()
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of tasks deleted per transaction."
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report how many tasks would be deleted without deleting them."
+        )
+        parser.add_argument(
+            "--since",
+            type=date.fromisoformat,
+            help="Only delete tasks that became stale on or after this date (YYYY-MM-DD)."
+        )
+        parser.add_argument(
+            "--enqueue",
+            action="store_true",
+            help="Queue the deletion for run_worker instead of running it now."
+        )
+
+    @staticmethod
+    def get_rules(since=None):
+        start_of_today = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+        done = Q(status=Task.DONE, modified__lt=start_of_today)
+        overdue = Q(deadline__lt=start_of_today.date())
+        if since:
+            done &= Q(modified__gte=start_of_today.replace(year=since.year, month=since.month, day=since.day))
+            overdue &= Q(deadline__gte=since)
+
+        return done, overdue
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be a positive integer.")
+
+        if options["enqueue"]:
+            since = options["since"]
+            job = enqueue("delete_stale_tasks", {
+                "batch_size": batch_size,
+                "since": since.isoformat() if since else None,
+            })
+            self.stdout.write(self.style.SUCCESS(f"Queued job {job.pk}."))
+            return
+
+        done, overdue = self.get_rules(options["since"])
+
+        if options["dry_run"]:
+            stats = Task.objects.aggregate(
+                # The comments join repeats each task once per comment.
+                done=Count("pk", distinct=True, filter=done),
+                overdue=Count("pk", distinct=True, filter=overdue & ~done),
+                comments=Count("comments", filter=done | overdue),
+            )
+            self.stdout.write(
+                f"Would delete {stats['done'] + stats['overdue']} tasks "
+                f"({stats['done']} done, {stats['overdue']} past deadline) "
+                f"and {stats['comments']} comments."
+            )
+            return
+
+        stale_ids = Task.objects.filter(done | overdue).order_by("pk").values_list("pk", flat=True)
+        deleted_tasks = deleted_rows = 0
+        started = time.perf_counter()
+
+        while True:
+            with transaction.atomic():
+                batch = list(stale_ids[:batch_size])
+                if not batch:
+                    break
+                rows, per_model = Task.objects.filter(pk__in=batch).delete()
 
-        today = timezone.now().date()
+            deleted_tasks += per_model.get(Task._meta.label, 0)
+            deleted_rows += rows
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f"Deleted {deleted_tasks} tasks so far ({deleted_rows / elapsed:.0f} rows/s)",
+                self.style.HTTP_INFO
+            )
 
-        for task in tasks:
-            if task.status == "Done" and (today - task.modified.date()).days >= 1:
-                task.delete()
-            elif task.deadline and (today - task.deadline).days >= 1:
-                task.delete()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Deleted {deleted_tasks} tasks ({deleted_rows} rows including comments) "
+            f"in {elapsed:.2f}s ({deleted_rows / elapsed if elapsed else 0:.0f} rows/s)."
+        ))
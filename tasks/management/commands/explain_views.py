@@ -0,0 +1,111 @@
+import re
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+
+from tasks.models import Project, Task
+
+SEQUENTIAL_SCAN = {
+    "sqlite": re.compile(r"^SCAN (?!.*USING (COVERING )?INDEX)"),
+    "postgresql": re.compile(r"Seq Scan"),
+}
+
+
+class Command(BaseCommand):
+    help = "Run EXPLAIN on the queries issued by each tasks view and flag sequential scans"
+
+    routes = [
+        "index",
+        "project-list",
+        "project-detail",
+        "project-task-list",
+        "task-list",
+        "task-detail",
+        "project-chat",
+        "project-chat-messages",
+        "profile-detail",
+    ]
+
+    def add_arguments(self, parser):
+        parser.add_argument("--project", type=int, help="Project to explain the views for (defaults to the first one).")
+        parser.add_argument("--fail-on-scan", action="store_true", help="Exit with an error if any scan was flagged.")
+
+    def handle(self, *args, **options):
+        if connection.vendor not in SEQUENTIAL_SCAN:
+            raise CommandError(f"EXPLAIN parsing is not supported for {connection.vendor}.")
+
+        project = Project.objects.filter(pk=options["project"]) if options["project"] else Project.objects.all()
+        project = project.select_related("creator").first()
+        if project is None:
+            raise CommandError("Create a project first, e.g. with the generate_load_data command.")
+
+        task = Task.objects.filter(project=project).first()
+        kwargs = {"pk": project.pk, "task_pk": task.pk if task else 0}
+        flagged = 0
+
+        for name in self.routes:
+            url = self.reverse(name, kwargs)
+            if url is None:
+                continue
+
+            queries = self.capture_queries(url, project.creator)
+            self.stdout.write(self.style.MIGRATE_HEADING(f"tasks:{name} ({url}) - {len(queries)} queries"))
+
+            for sql, params in queries:
+                scans = [line for line in self.explain(sql, params) if SEQUENTIAL_SCAN[connection.vendor].search(line)]
+                flagged += len(scans)
+                for line in scans:
+                    self.stdout.write(self.style.WARNING(f"  {line}"))
+                    self.stdout.write(f"    in: {sql[:200]}")
+
+        if flagged:
+            message = f"{flagged} sequential scan(s) flagged."
+            if options["fail_on_scan"]:
+                raise CommandError(message)
+            self.stdout.write(self.style.WARNING(message))
+        else:
+            self.stdout.write(self.style.SUCCESS("No sequential scans found."))
+
+    @staticmethod
+    def reverse(name, kwargs):
+        for candidate in ({}, {"pk": kwargs["pk"]}, kwargs):
+            try:
+                return reverse(f"tasks:{name}", kwargs=candidate)
+            except Exception:
+                continue
+
+        return None
+
+    @staticmethod
+    def capture_queries(url, user):
+        queries = []
+
+        def capture(execute, sql, params, many, context):
+            if sql.lstrip().upper().startswith("SELECT"):
+                queries.append((sql, params))
+
+            return execute(sql, params, many, context)
+
+        request = RequestFactory().get(url)
+        request.user = get_user_model().objects.get(pk=user.pk)
+        match = resolve(url)
+
+        with connection.execute_wrapper(capture):
+            response = match.func(request, *match.args, **match.kwargs)
+            if hasattr(response, "render"):
+                response.render()
+
+        return queries
+
+    @staticmethod
+    def explain(sql, params):
+        prefix = "EXPLAIN QUERY PLAN " if connection.vendor == "sqlite" else "EXPLAIN "
+
+        with connection.cursor() as cursor:
+            cursor.execute(prefix + sql, params)
+            rows = cursor.fetchall()
+
+        return [str(row[-1]) for row in rows]
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from tasks.export import CHUNK_SIZE, EXPORTS, FORMATS, stream_export
+from tasks.models import Project
+
+
+class Command(BaseCommand):
+    help = "Stream a project's tasks, comments or chat messages as CSV or NDJSON"
+
+    def add_arguments(self, parser):
+        parser.add_argument("project", type=int)
+        parser.add_argument("kind", choices=EXPORTS)
+        parser.add_argument("--format", choices=FORMATS, default="csv")
+        parser.add_argument("--output", help="File to write to (defaults to stdout).")
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Rows fetched per database round trip.")
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be a positive integer.")
+
+        project = Project.objects.filter(pk=options["project"]).first()
+        if project is None:
+            raise CommandError(f"Project {options['project']} does not exist.")
+
+        chunks = stream_export(project, options["kind"], options["format"], options["chunk_size"])
+        if not options["output"]:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
+            return
+
+        with open(options["output"], "w", newline="", encoding="utf-8") as file:
+            for chunk in chunks:
+                file.write(chunk)
+
+        self.stderr.write(self.style.SUCCESS(
+            f"Exported {options['kind']} of project {project.pk} to {options['output']}."
+        ))
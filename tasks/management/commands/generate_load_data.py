@@ -0,0 +1,173 @@
+import random
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from tasks.counters import invalidate_project_counts, invalidate_task_counts
+from tasks.models import ChatMessage, Position, Project, Task, TaskComment, TaskType
+from tasks.search.indexing import index_queryset
+
+POSITIONS = ("Developer", "Designer", "QA Engineer", "Project Manager", "DevOps Engineer")
+TASK_TYPES = ("Bug", "Feature", "Refactoring", "Research", "Documentation")
+WORDS = (
+    "api", "backend", "board", "bug", "cache", "client", "deploy", "design", "docs", "export", "fix", "frontend",
+    "import", "index", "layout", "login", "migration", "page", "query", "release", "report", "review", "search",
+    "server", "settings", "sprint", "test", "update", "upload", "user",
+)
+
+
+class Command(BaseCommand):
+    help = "Fill the database with workers, projects, tasks, comments and chat messages for load testing"
+
+    indexed_models = (Project, Task, TaskComment, ChatMessage)
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=200)
+        parser.add_argument("--projects", type=int, default=50)
+        parser.add_argument("--tasks", type=int, default=5000, help="Total number of tasks across all projects.")
+        parser.add_argument("--comments", type=int, default=20000, help="Total number of task comments.")
+        parser.add_argument("--messages", type=int, default=20000, help="Total number of chat messages.")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--seed", type=int, help="Seed for reproducible data sets.")
+        parser.add_argument("--password", default="password123", help="Password set for every generated worker.")
+        parser.add_argument("--prefix", default="load", help="Username prefix of the generated workers.")
+
+    def handle(self, *args, **options):
+        for name in ("workers", "projects", "batch_size"):
+            if options[name] < 1:
+                raise CommandError(f"--{name.replace('_', '-')} must be a positive integer.")
+
+        self.random = random.Random(options["seed"])
+        self.batch_size = options["batch_size"]
+        last_pks = {model: model.objects.aggregate(last=Max("pk"))["last"] or 0 for model in self.indexed_models}
+
+        with transaction.atomic():
+            workers = self.create_workers(options["workers"], options["prefix"], options["password"])
+            members = self.create_projects(options["projects"], workers)
+            tasks = self.create_tasks(options["tasks"], members, options["comments"])
+            self.create_comments(tasks, members)
+            self.create_messages(options["messages"], members)
+
+        for model, last_pk in last_pks.items():
+            index_queryset(model.objects.filter(pk__gt=last_pk), self.batch_size)
+
+        worker_ids = [worker.pk for worker in workers]
+        invalidate_project_counts(worker_ids)
+        invalidate_task_counts(worker_ids)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {len(workers)} workers, {len(members)} projects, {len(tasks)} tasks, "
+            f"{options['comments']} comments and {options['messages']} chat messages."
+        ))
+
+    def create_workers(self, count, prefix, password):
+        positions = [Position.objects.get_or_create(name=name)[0] for name in POSITIONS]
+        start = get_user_model().objects.filter(username__startswith=prefix).count()
+        password = make_password(password)
+
+        workers = [
+            get_user_model()(
+                username=f"{prefix}{start + index}",
+                first_name=f"First{start + index}",
+                last_name=f"Last{start + index}",
+                email=f"{prefix}{start + index}@example.com",
+                password=password,
+                position=self.random.choice(positions),
+            )
+            for index in range(count)
+        ]
+
+        return get_user_model().objects.bulk_create(workers, batch_size=self.batch_size)
+
+    def create_projects(self, count, workers):
+        projects = Project.objects.bulk_create(
+            [
+                Project(
+                    title=self.sentence(2, 4).title(),
+                    description=self.sentence(10, 30),
+                    creator=self.random.choice(workers),
+                )
+                for _ in range(count)
+            ],
+            batch_size=self.batch_size,
+        )
+
+        # Team sizes follow a long tail: most projects are small, a few are huge.
+        members = {}
+        for project in projects:
+            size = min(len(workers), max(1, int(self.random.paretovariate(1.2) * 3)))
+            team = {project.creator, *self.random.sample(workers, size)}
+            members[project] = list(team)
+
+        Through = Project.assignees.through
+        Through.objects.bulk_create(
+            [Through(project=project, worker=worker) for project, team in members.items() for worker in team],
+            batch_size=self.batch_size,
+        )
+
+        return members
+
+    def create_tasks(self, count, members, comments):
+        projects = list(members)
+        weights = [len(team) for team in members.values()]
+        task_types = [TaskType.objects.get_or_create(name=name)[0] for name in TASK_TYPES]
+        today = timezone.localdate()
+
+        tasks = []
+        for project in self.random.choices(projects, weights, k=count):
+            deadline = None
+            if self.random.random() < 0.7:
+                deadline = today + timedelta(days=self.random.randint(-30, 90))
+
+            tasks.append(Task(
+                name=self.sentence(2, 5).capitalize()[:63],
+                description=self.sentence(15, 60),
+                deadline=deadline,
+                priority=self.random.choice((Task.HIGH, Task.MEDIUM, Task.MEDIUM, Task.LOW)),
+                status=self.random.choice((Task.TODO, Task.TODO, Task.DOING, Task.DONE)),
+                task_type=self.random.choice(task_types),
+                creator=self.random.choice(members[project]),
+                project=project,
+            ))
+
+        # Decide the comment distribution up front so comment_count is right on insert.
+        for task in self.random.choices(tasks, k=comments) if tasks else ():
+            task.comment_count += 1
+
+        return Task.objects.bulk_create(tasks, batch_size=self.batch_size)
+
+    def create_comments(self, tasks, members):
+        comments = (
+            TaskComment(task=task, sender=self.random.choice(members[task.project]), message=self.sentence(3, 25))
+            for task in tasks
+            for _ in range(task.comment_count)
+        )
+        self.bulk_create(TaskComment, comments)
+
+    def create_messages(self, count, members):
+        projects = list(members)
+        weights = [len(team) for team in members.values()]
+        messages = (
+            ChatMessage(project=project, sender=self.random.choice(members[project]), message=self.sentence(1, 20))
+            for project in self.random.choices(projects, weights, k=count)
+        )
+        self.bulk_create(ChatMessage, messages)
+
+    def bulk_create(self, model, objects):
+        batch = []
+        for instance in objects:
+            batch.append(instance)
+            if len(batch) == self.batch_size:
+                model.objects.bulk_create(batch)
+                batch = []
+
+        if batch:
+            model.objects.bulk_create(batch)
+
+    def sentence(self, minimum, maximum):
+        return " ".join(self.random.choices(WORDS, k=self.random.randint(minimum, maximum)))
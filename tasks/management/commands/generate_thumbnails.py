@@ -0,0 +1,26 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from tasks.images import generate_thumbnails
+
+
+class Command(BaseCommand):
+    help = "Generate profile image thumbnails for workers that do not have them yet"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="Regenerate thumbnails for every worker with an image.")
+
+    def handle(self, *args, **options):
+        workers = get_user_model().objects.exclude(profile_image="")
+        if not options["all"]:
+            workers = workers.filter(profile_image_hash="")
+
+        generated = 0
+        for worker in workers.iterator():
+            try:
+                generate_thumbnails(worker)
+                generated += 1
+            except (OSError, ValueError) as error:
+                self.stderr.write(f"Skipped {worker.username}: {error}")
+
+        self.stdout.write(self.style.SUCCESS(f"Generated thumbnails for {generated} workers."))
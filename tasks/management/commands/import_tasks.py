@@ -0,0 +1,56 @@
+import os
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from tasks.importer import BATCH_SIZE, FORMATS, ErrorFile, TaskImporter, read_rows
+from tasks.models import Project
+
+
+class Command(BaseCommand):
+    help = "Import tasks into a project from a CSV or NDJSON file"
+
+    def add_arguments(self, parser):
+        parser.add_argument("project", type=int)
+        parser.add_argument("path", help="CSV or NDJSON file with one task per row.")
+        parser.add_argument("--format", choices=FORMATS, help="Defaults to ndjson for .ndjson/.jsonl files, else csv.")
+        parser.add_argument("--creator", help="Username of the task creator (defaults to the project creator).")
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="Tasks inserted per transaction.")
+        parser.add_argument("--create-task-types", action="store_true", help="Create unknown task types.")
+        parser.add_argument("--errors", help="Where to write rejected rows (defaults to <path>.errors.<format>).")
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be a positive integer.")
+
+        project = Project.objects.select_related("creator").filter(pk=options["project"]).first()
+        if project is None:
+            raise CommandError(f"Project {options['project']} does not exist.")
+
+        creator = project.creator
+        if options["creator"]:
+            creator = get_user_model().objects.filter(username=options["creator"]).first()
+            if creator is None:
+                raise CommandError(f"Worker {options['creator']} does not exist.")
+
+        path = options["path"]
+        fmt = options["format"] or ("ndjson" if os.path.splitext(path)[1] in (".ndjson", ".jsonl") else "csv")
+        errors_path = options["errors"] or f"{path}.errors.{fmt}"
+        importer = TaskImporter(project, creator, options["batch_size"], options["create_task_types"])
+
+        try:
+            with open(path, newline="", encoding="utf-8-sig") as file, \
+                    open(errors_path, "w", newline="", encoding="utf-8") as errors:
+                importer.run(read_rows(file, fmt), ErrorFile(errors, fmt))
+        except OSError as error:
+            raise CommandError(error)
+
+        if not importer.failed:
+            os.remove(errors_path)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {importer.created} tasks in {importer.elapsed:.2f}s "
+            f"({importer.rows_per_second:.0f} rows/s)."
+        ))
+        if importer.failed:
+            self.stdout.write(self.style.WARNING(f"{importer.failed} rows failed, see {errors_path}."))
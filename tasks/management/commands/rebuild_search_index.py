@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from tasks.models import ChatMessage, Project, Task, TaskComment
+from tasks.search.indexing import index_queryset
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index for projects, tasks, comments and chat messages"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        for model in (Project, Task, TaskComment, ChatMessage):
+            indexed = index_queryset(model.objects.all(), options["batch_size"])
+            self.stdout.write(f"Indexed {indexed} {model._meta.verbose_name_plural}.")
+
+        self.stdout.write(self.style.SUCCESS("Search index rebuilt."))
@@ -0,0 +1,319 @@
+import asyncio
+import json
+import platform
+import statistics
+import threading
+import time
+import tracemalloc
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import django
+from asgiref.sync import ThreadSensitiveContext, async_to_sync
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+from django.test import AsyncClient, Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import NoReverseMatch, reverse
+from django.utils import timezone
+from django.utils.crypto import get_random_string
+
+from tasks import urls
+from tasks.models import Project, Task
+
+# Routes whose GET handler changes state, ends the session or reports on the benchmark itself,
+# and routes that only accept POST.
+SKIPPED_ROUTES = {
+    "logout", "project-invitation", "request-metrics", "task-status", "task-bulk-update", "task-bulk-delete",
+    "task-dependency-add", "task-dependency-delete",
+}
+QUERY_STRINGS = {"search": "?title=task"}
+
+
+class Command(BaseCommand):
+    help = "Measure latency, queries and memory of every tasks route and save the results as JSON"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--routes", nargs="+", help="Route names to run (defaults to every GET route).")
+        parser.add_argument("--iterations", type=int, default=50, help="Timed requests per route.")
+        parser.add_argument("--warmup", type=int, default=5, help="Untimed requests per route before measuring.")
+        parser.add_argument("--project", type=int, help="Project to use (defaults to the one with most tasks).")
+        parser.add_argument(
+            "--base-url",
+            help="Benchmark a running server, e.g. a local gunicorn at http://127.0.0.1:8000, "
+                 "instead of the in-process test client. Query counts and memory are not available then."
+        )
+        parser.add_argument(
+            "--asgi",
+            action="store_true",
+            help="Drive the in-process ASGI handler instead of WSGI. Combine with TASKS_ASYNC_VIEWS=true "
+                 "and --concurrency to compare the async views with the WSGI path."
+        )
+        parser.add_argument("--concurrency", type=int, default=1, help="Requests kept in flight at once.")
+        parser.add_argument(
+            "--revalidate",
+            action="store_true",
+            help="Send the ETag of a first response with every request, "
+                 "to measure the 304 Not Modified path of the conditional views."
+        )
+        parser.add_argument("--output", help="Write the results to this JSON file.")
+        parser.add_argument("--compare", help="Print the change against a previous JSON results file.")
+
+    # Outside INTERNAL_IPS, so the debug toolbar stays out of the measurements.
+    remote_addr = "192.0.2.1"
+
+    def handle(self, *args, **options):
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            self.run(options)
+
+    def run(self, options):
+        if options["iterations"] < 2:
+            raise CommandError("--iterations must be at least 2 to compute percentiles.")
+        if options["concurrency"] < 1:
+            raise CommandError("--concurrency must be a positive integer.")
+        if options["asgi"] and options["concurrency"] > 1 and "debug_toolbar" in settings.INSTALLED_APPS:
+            raise CommandError(
+                "The debug toolbar middleware is sync-only and deadlocks concurrent ASGI requests, "
+                "set TASKS_ASYNC_VIEWS=true or DJANGO_ENV=production."
+            )
+
+        project = self.get_project(options["project"])
+        tasks = Task.objects.filter(project=project).order_by("pk")
+        task = tasks.filter(creator=project.creator).first() or tasks.first()
+        kwargs = {"pk": project.pk, "task_pk": task.pk if task else 0}
+        route_names = options["routes"] or [
+            pattern.name for pattern in urls.urlpatterns if pattern.name not in SKIPPED_ROUTES
+        ]
+
+        client = Client(REMOTE_ADDR=self.remote_addr)
+        client.force_login(project.creator)
+        # A fixed CSRF secret, as a returning browser has, keeps the ETags stable between requests.
+        client.cookies[settings.CSRF_COOKIE_NAME] = get_random_string(32)
+        base_url = options["base_url"].rstrip("/") if options["base_url"] else None
+
+        results = {}
+        for name in route_names:
+            url = self.reverse(name, kwargs)
+            if url is None:
+                self.stderr.write(f"Skipped tasks:{name}: it cannot be reversed.")
+                continue
+
+            if base_url:
+                results[name] = self.run_remote(base_url + url, client, options)
+            else:
+                headers = self.conditional_headers(client.get(url)) if options["revalidate"] else {}
+                if options["asgi"]:
+                    results[name] = self.run_asgi(url, client, headers, options)
+                else:
+                    results[name] = self.run_local(url, client, headers, options)
+
+            self.write_result(name, results[name])
+
+        report = {
+            "meta": {
+                "date": timezone.now().isoformat(),
+                "mode": base_url or ("asgi" if options["asgi"] else "wsgi"),
+                "async_views": settings.TASKS_ASYNC_VIEWS,
+                "concurrency": options["concurrency"],
+                "revalidate": options["revalidate"],
+                "database": connection.vendor,
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "iterations": options["iterations"],
+                "project": project.pk,
+            },
+            "routes": results,
+        }
+
+        if options["output"]:
+            with open(options["output"], "w") as file:
+                json.dump(report, file, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Saved results to {options['output']}."))
+
+        if options["compare"]:
+            self.compare(options["compare"], results)
+
+    @staticmethod
+    def get_project(pk):
+        projects = Project.objects.select_related("creator")
+        if pk:
+            project = projects.filter(pk=pk).first()
+        else:
+            project = projects.annotate(num_tasks=Count("task")).order_by("-num_tasks", "pk").first()
+
+        if project is None:
+            raise CommandError("No project found, create one with the generate_load_data command.")
+
+        return project
+
+    @staticmethod
+    def reverse(name, kwargs):
+        for candidate in ({}, {"pk": kwargs["pk"]}, kwargs):
+            try:
+                return reverse(f"tasks:{name}", kwargs=candidate) + QUERY_STRINGS.get(name, "")
+            except NoReverseMatch:
+                continue
+
+        return None
+
+    @staticmethod
+    def conditional_headers(response):
+        return {"If-None-Match": response["ETag"]} if response.get("ETag") else {}
+
+    def run_local(self, url, client, headers, options):
+        local = threading.local()
+
+        def get():
+            if not hasattr(local, "client"):
+                local.client = Client(REMOTE_ADDR=self.remote_addr)
+                local.client.cookies.update(client.cookies)
+
+            return local.client.get(url, headers=headers).status_code
+
+        result = self.measure(get, options)
+        return {**result, **self.profile(url, client, headers)}
+
+    def run_asgi(self, url, client, headers, options):
+        async_client = AsyncClient(client=[self.remote_addr, 0])
+        async_client.cookies.update(client.cookies)
+
+        async def get():
+            # Like the real ASGIHandler, give each request its own thread for sync code.
+            async with ThreadSensitiveContext():
+                return (await async_client.get(url, headers=headers)).status_code
+
+        result = async_to_sync(self.ameasure)(get, options)
+        return {**result, **self.profile(url, client, headers)}
+
+    def run_remote(self, url, client, options):
+        headers = {"Cookie": "; ".join(f"{cookie.key}={cookie.value}" for cookie in client.cookies.values())}
+        if options["revalidate"]:
+            with urlopen(Request(url, headers=headers)) as response:
+                headers.update(self.conditional_headers(response.headers))
+
+        def get():
+            try:
+                with urlopen(Request(url, headers=headers)) as response:
+                    response.read()
+                    return response.status
+            except HTTPError as error:
+                # urllib reports 304 Not Modified as an error.
+                if error.code != 304:
+                    raise
+                return error.code
+
+        return {**self.measure(get, options), "queries": None, "peak_memory_kb": None}
+
+    def measure(self, get, options):
+        for _ in range(options["warmup"]):
+            get()
+
+        latencies, statuses = [], []
+
+        def worker(count):
+            try:
+                for _ in range(count):
+                    started = time.perf_counter()
+                    statuses.append(get())
+                    latencies.append((time.perf_counter() - started) * 1000)
+            finally:
+                if threading.current_thread() is not threading.main_thread():
+                    connection.close()
+
+        started = time.perf_counter()
+        if options["concurrency"] == 1:
+            worker(options["iterations"])
+        else:
+            threads = [
+                threading.Thread(target=worker, args=(count,))
+                for count in self.split(options["iterations"], options["concurrency"])
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        return self.summarize(latencies, statuses, time.perf_counter() - started)
+
+    async def ameasure(self, get, options):
+        for _ in range(options["warmup"]):
+            await get()
+
+        latencies, statuses = [], []
+
+        async def worker(count):
+            for _ in range(count):
+                started = time.perf_counter()
+                statuses.append(await get())
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(count) for count in self.split(options["iterations"], options["concurrency"])))
+
+        return self.summarize(latencies, statuses, time.perf_counter() - started)
+
+    @staticmethod
+    def split(iterations, concurrency):
+        return [iterations // concurrency + (index < iterations % concurrency) for index in range(concurrency)]
+
+    def summarize(self, latencies, statuses, elapsed):
+        return {
+            "status": max(set(statuses), key=statuses.count),
+            **self.percentiles(latencies),
+            "requests_per_second": round(len(latencies) / elapsed, 1) if elapsed else None,
+        }
+
+    @staticmethod
+    def profile(url, client, headers):
+        # Queries and memory are measured on a separate request so that
+        # tracing overhead does not leak into the latency numbers.
+        tracemalloc.start()
+        with CaptureQueriesContext(connection) as queries:
+            client.get(url, headers=headers)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        return {"queries": len(queries), "peak_memory_kb": round(peak / 1024, 1)}
+
+    @staticmethod
+    def percentiles(latencies):
+        cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+
+        return {
+            "p50_ms": round(cuts[49], 3),
+            "p95_ms": round(cuts[94], 3),
+            "p99_ms": round(cuts[98], 3),
+            "mean_ms": round(statistics.fmean(latencies), 3),
+        }
+
+    def write_result(self, name, result):
+        line = (
+            f"tasks:{name:<24} {result['status']}  p50 {result['p50_ms']:>8.2f}ms  "
+            f"p95 {result['p95_ms']:>8.2f}ms  p99 {result['p99_ms']:>8.2f}ms  {result['requests_per_second']:>7} req/s"
+        )
+        if result["queries"] is not None:
+            line += f"  {result['queries']:>3} queries  {result['peak_memory_kb']:>8.1f}KB peak"
+
+        self.stdout.write(line)
+
+    def compare(self, path, results):
+        with open(path) as file:
+            previous = json.load(file)["routes"]
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f"Compared with {path}:"))
+        for name, result in results.items():
+            if name not in previous:
+                continue
+
+            before = previous[name]
+            change = (result["p95_ms"] - before["p95_ms"]) / before["p95_ms"] * 100 if before["p95_ms"] else 0
+            line = f"tasks:{name:<24} p95 {before['p95_ms']:.2f}ms -> {result['p95_ms']:.2f}ms ({change:+.1f}%)"
+            if before.get("requests_per_second"):
+                line += f"  {before['requests_per_second']} -> {result['requests_per_second']} req/s"
+            if result["queries"] is not None and before.get("queries") is not None:
+                line += f"  queries {before['queries']} -> {result['queries']}"
+
+            style = self.style.ERROR if change > 10 else self.style.SUCCESS if change < -10 else str
+            self.stdout.write(style(line))
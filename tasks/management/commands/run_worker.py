@@ -0,0 +1,75 @@
+import signal
+import threading
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from tasks import jobs
+from tasks.models import Job
+
+
+class Command(BaseCommand):
+    help = "Run queued background jobs"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", type=int, default=1, help="Number of jobs run in parallel threads.")
+        parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds to wait when the queue is empty.")
+        parser.add_argument("--burst", action="store_true", help="Exit once the queue is empty.")
+        parser.add_argument("--name", default=jobs.default_worker_name(), help="Recorded on the jobs this worker runs.")
+        parser.add_argument(
+            "--keep-days", type=int, default=7, help="Delete finished jobs older than this many days on start."
+        )
+
+    def handle(self, *args, **options):
+        concurrency = options["concurrency"]
+        if concurrency < 1:
+            raise CommandError("--concurrency must be a positive integer.")
+
+        requeued, failed = jobs.requeue_stale()
+        purged = jobs.purge(timedelta(days=options["keep_days"]))
+        if requeued or failed or purged:
+            self.stdout.write(f"Requeued {requeued} and failed {failed} stale jobs, purged {purged} finished jobs.")
+
+        stop = threading.Event()
+        counts = {Job.DONE: 0, Job.QUEUED: 0, Job.FAILED: 0}
+        lock = threading.Lock()
+
+        def on_finish(job):
+            with lock:
+                counts[job.status] += 1
+            self.stdout.write(
+                f"{job.name} #{job.pk} {job.status} in {job.duration.total_seconds() * 1000:.1f}ms "
+                f"(attempt {job.attempts}/{job.max_attempts})",
+                self.style.SUCCESS if job.status == Job.DONE else self.style.WARNING
+            )
+
+        def run(name):
+            try:
+                jobs.work(name, stop, options["poll_interval"], options["burst"], on_finish)
+            finally:
+                connection.close()
+
+        # Let running jobs finish on Ctrl+C or SIGTERM instead of abandoning them mid-way.
+        previous = {}
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                previous[signum] = signal.signal(signum, lambda *_: stop.set())
+
+        try:
+            if concurrency == 1:
+                jobs.work(options["name"], stop, options["poll_interval"], options["burst"], on_finish)
+            else:
+                threads = [threading.Thread(target=run, args=(f"{options['name']}/{i}",)) for i in range(concurrency)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+        finally:
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Finished {counts[Job.DONE]} jobs, {counts[Job.QUEUED]} to retry, "
+            f"{counts[Job.FAILED]} failed."
+        ))
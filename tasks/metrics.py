@@ -0,0 +1,219 @@
+import contextvars
+import functools
+import json
+import logging
+import random
+import statistics
+import threading
+import time
+from collections import Counter, deque
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connection
+from django.template.backends.django import Template
+
+logger = logging.getLogger(__name__)
+
+BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+current_timer = contextvars.ContextVar("current_timer", default=None)
+
+
+class QueryCollector:
+    def __init__(self):
+        self.time = 0.0
+        self.statements = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.time += time.perf_counter() - started
+            self.statements[(sql, repr(params))] += 1
+
+    @property
+    def count(self):
+        return sum(self.statements.values())
+
+    @property
+    def duplicates(self):
+        return self.count - len(self.statements)
+
+
+class TemplateTimer:
+    def __init__(self):
+        self.time = 0.0
+        self.depth = 0
+
+
+def instrument_templates():
+    """
+    Time top-level template renders, i.e. ``render()``, ``render_to_string()``
+    and ``TemplateResponse``. Includes and nested renders count towards
+    the template that triggered them.
+    """
+    if getattr(Template.render, "timed", False):
+        return
+
+    original = Template.render
+
+    @functools.wraps(original)
+    def render(self, context=None, request=None):
+        timer = current_timer.get()
+        if timer is None:
+            return original(self, context, request)
+
+        timer.depth += 1
+        started = time.perf_counter()
+        try:
+            return original(self, context, request)
+        finally:
+            timer.depth -= 1
+            if not timer.depth:
+                timer.time += time.perf_counter() - started
+
+    render.timed = True
+    Template.render = render
+
+
+class MetricsRegistry:
+    """
+    Keeps the most recent samples of every URL name in memory.
+
+    Each worker process has its own registry, so the numbers describe the
+    process that answers the metrics request.
+    """
+
+    def __init__(self, window=1000):
+        self.window = window
+        self.lock = threading.Lock()
+        self.samples = {}
+
+    def record(self, name, sample):
+        with self.lock:
+            self.samples.setdefault(name, deque(maxlen=self.window)).append(sample)
+
+    def reset(self):
+        with self.lock:
+            self.samples.clear()
+
+    def snapshot(self):
+        with self.lock:
+            samples = {name: list(values) for name, values in self.samples.items()}
+
+        return {name: self.summarize(values) for name, values in sorted(samples.items())}
+
+    @staticmethod
+    def summarize(samples):
+        wall = [sample["wall_ms"] for sample in samples]
+        cuts = statistics.quantiles(wall, n=100, method="inclusive") if len(wall) > 1 else wall * 99
+        buckets = Counter(next((f"le_{bound}" for bound in BUCKETS_MS if value <= bound), "gt_2500") for value in wall)
+
+        return {
+            "count": len(samples),
+            "p50_ms": round(cuts[49], 3),
+            "p95_ms": round(cuts[94], 3),
+            "p99_ms": round(cuts[98], 3),
+            "mean_db_ms": round(statistics.fmean(sample["db_ms"] for sample in samples), 3),
+            "mean_template_ms": round(statistics.fmean(sample["template_ms"] for sample in samples), 3),
+            "mean_queries": round(statistics.fmean(sample["queries"] for sample in samples), 2),
+            "max_duplicate_queries": max(sample["duplicate_queries"] for sample in samples),
+            "histogram": {key: buckets[key] for key in [*(f"le_{bound}" for bound in BUCKETS_MS), "gt_2500"]},
+        }
+
+
+registry = MetricsRegistry()
+
+
+def add_query_collector(collector):
+    connection.execute_wrappers.append(collector)
+
+
+def remove_query_collector(collector):
+    connection.execute_wrappers.remove(collector)
+
+
+class RequestMetricsMiddleware:
+    """
+    Records wall, database and template time plus query counts for a sample
+    of requests, adds a ``Server-Timing`` header and logs one JSON line each.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+        instrument_templates()
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        if random.random() >= settings.TASKS_METRICS_SAMPLE_RATE:
+            return self.get_response(request)
+
+        collector, timer = QueryCollector(), TemplateTimer()
+        token = current_timer.set(timer)
+        started = time.perf_counter()
+        try:
+            with connection.execute_wrapper(collector):
+                response = self.get_response(request)
+        finally:
+            current_timer.reset(token)
+
+        return self.finish(request, response, time.perf_counter() - started, collector, timer)
+
+    async def __acall__(self, request):
+        if random.random() >= settings.TASKS_METRICS_SAMPLE_RATE:
+            return await self.get_response(request)
+
+        collector, timer = QueryCollector(), TemplateTimer()
+        token = current_timer.set(timer)
+        started = time.perf_counter()
+        # Connections are per thread and the async ORM queries from the
+        # thread sync_to_async() hands it, so the wrapper is installed there.
+        await sync_to_async(add_query_collector)(collector)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(remove_query_collector)(collector)
+            current_timer.reset(token)
+
+        return self.finish(request, response, time.perf_counter() - started, collector, timer)
+
+    @staticmethod
+    def finish(request, response, wall, collector, timer):
+        match = getattr(request, "resolver_match", None)
+        name = match.view_name if match else "<unresolved>"
+        sample = {
+            "wall_ms": round(wall * 1000, 3),
+            "db_ms": round(collector.time * 1000, 3),
+            "template_ms": round(timer.time * 1000, 3),
+            "queries": collector.count,
+            "duplicate_queries": collector.duplicates,
+        }
+
+        registry.record(name, sample)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(json.dumps({
+                "view": name,
+                "method": request.method,
+                "path": request.path,
+                "status": response.status_code,
+                **sample,
+            }))
+
+        if settings.TASKS_METRICS_SERVER_TIMING:
+            queries = f"{sample['queries']} queries, {sample['duplicate_queries']} duplicates"
+            response["Server-Timing"] = (
+                f"app;dur={sample['wall_ms']}, "
+                f"db;dur={sample['db_ms']};desc=\"{queries}\", "
+                f"tpl;dur={sample['template_ms']}"
+            )
+
+        return response
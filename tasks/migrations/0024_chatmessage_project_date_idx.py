@@ -0,0 +1,17 @@
+# Generated by Django 4.2.11 on 2026-10-18 05:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0023_alter_task_deadline"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="chatmessage",
+            index=models.Index(fields=["project", "date"], name="chatmessage_project_date_idx"),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.11 on 2026-10-18 05:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0024_chatmessage_project_date_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(fields=["project", "creator"], name="task_project_creator_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(condition=models.Q(("status", "Done")), fields=["modified"], name="task_done_modified_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(condition=models.Q(("deadline__isnull", False)), fields=["deadline"], name="task_deadline_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="taskcomment",
+            index=models.Index(fields=["task", "-date"], name="taskcomment_task_date_idx"),
+        ),
+    ]
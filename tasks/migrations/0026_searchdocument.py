@@ -0,0 +1,92 @@
+# Generated by Django 4.2.11 on 2026-10-18 05:56
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE tasks_searchdocument_fts USING fts5(
+        title, body, content='tasks_searchdocument', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER tasks_searchdocument_ai AFTER INSERT ON tasks_searchdocument BEGIN
+        INSERT INTO tasks_searchdocument_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_searchdocument_ad AFTER DELETE ON tasks_searchdocument BEGIN
+        INSERT INTO tasks_searchdocument_fts(tasks_searchdocument_fts, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_searchdocument_au AFTER UPDATE ON tasks_searchdocument BEGIN
+        INSERT INTO tasks_searchdocument_fts(tasks_searchdocument_fts, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO tasks_searchdocument_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+]
+
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS tasks_searchdocument_au",
+    "DROP TRIGGER IF EXISTS tasks_searchdocument_ad",
+    "DROP TRIGGER IF EXISTS tasks_searchdocument_ai",
+    "DROP TABLE IF EXISTS tasks_searchdocument_fts",
+]
+
+POSTGRES_FORWARD = [
+    """
+    CREATE INDEX tasks_searchdocument_vector_idx ON tasks_searchdocument
+    USING GIN (to_tsvector('english', title || ' ' || body))
+    """,
+]
+
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS tasks_searchdocument_vector_idx",
+]
+
+
+def run_vendor_sql(statements):
+    def run(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+
+    return run
+
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0025_hot_path_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchDocument",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("kind", models.CharField(choices=[("project", "Project"), ("task", "Task"), ("comment", "Comment"), ("message", "Chat message")], max_length=10)),
+                ("object_id", models.PositiveBigIntegerField()),
+                ("title", models.CharField(blank=True, max_length=255)),
+                ("body", models.TextField(blank=True)),
+                ("comment", models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name="+", to="tasks.taskcomment")),
+                ("message", models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name="+", to="tasks.chatmessage")),
+                ("project", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="+", to="tasks.project")),
+                ("task", models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name="+", to="tasks.task")),
+            ],
+            options={
+                "indexes": [models.Index(fields=["project", "kind"], name="searchdocument_project_idx")],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="searchdocument",
+            constraint=models.UniqueConstraint(fields=("kind", "object_id"), name="searchdocument_kind_object_unique"),
+        ),
+        migrations.RunPython(
+            run_vendor_sql({"sqlite": SQLITE_FORWARD, "postgresql": POSTGRES_FORWARD}),
+            run_vendor_sql({"sqlite": SQLITE_BACKWARD, "postgresql": POSTGRES_BACKWARD}),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.11 on 2026-10-18 05:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0026_searchdocument"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="worker",
+            name="profile_image_hash",
+            field=models.CharField(blank=True, editable=False, max_length=16),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.11 on 2026-10-18 06:03
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_comment_counts(apps, schema_editor):
+    Task = apps.get_model("tasks", "Task")
+    TaskComment = apps.get_model("tasks", "TaskComment")
+    counts = (
+        TaskComment.objects
+        .filter(task=OuterRef("pk"))
+        .order_by()
+        .values("task")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    Task.objects.update(comment_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0027_worker_profile_image_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="comment_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_comment_counts, migrations.RunPython.noop),
+    ]
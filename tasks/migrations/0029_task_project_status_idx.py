@@ -0,0 +1,17 @@
+# Generated by Django 4.2.11 on 2026-10-18 06:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0028_task_comment_count"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(fields=["project", "status", "modified"], name="task_project_status_idx"),
+        ),
+    ]
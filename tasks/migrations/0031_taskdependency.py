@@ -0,0 +1,31 @@
+# Generated by Django 4.2.11 on 2026-10-18 07:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0030_job"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaskDependency",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("depends_on", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="dependents", to="tasks.task")),
+                ("project", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="+", to="tasks.project")),
+                ("task", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="dependencies", to="tasks.task")),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="taskdependency",
+            constraint=models.UniqueConstraint(fields=("task", "depends_on"), name="taskdependency_unique"),
+        ),
+        migrations.AddConstraint(
+            model_name="taskdependency",
+            constraint=models.CheckConstraint(check=models.Q(("task", models.F("depends_on")), _negated=True), name="taskdependency_not_self"),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.11 on 2026-10-18 07:27
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0031_taskdependency"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChangeLogEntry",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("project_id", models.PositiveBigIntegerField()),
+                ("kind", models.CharField(choices=[("project", "Project"), ("task", "Task"), ("comment", "Comment"), ("message", "Chat message"), ("member", "Member")], max_length=10)),
+                ("object_id", models.PositiveBigIntegerField()),
+                ("action", models.CharField(choices=[("upsert", "Created or updated"), ("delete", "Deleted")], max_length=10)),
+                ("created", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                "indexes": [models.Index(fields=["project_id", "id"], name="changelog_project_idx"), models.Index(fields=["project_id", "kind", "object_id"], name="changelog_object_idx"), models.Index(fields=["created"], name="changelog_created_idx")],
+            },
+        ),
+    ]
@@ -1,10 +1,12 @@
 import uuid
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.db import models, transaction
 from django.urls import reverse
+from django.utils import timezone
 
-from task_manager import settings
+from tasks.images import thumbnail_name
 
 
 class Position(models.Model):
@@ -23,11 +25,18 @@ class TaskType(models.Model):
 
 class Worker(AbstractUser):
     profile_image = models.ImageField(upload_to="profile_pictures", blank=True)
+    profile_image_hash = models.CharField(max_length=16, blank=True, editable=False)
     position = models.ForeignKey(Position, on_delete=models.CASCADE, null=True, blank=True)
 
     def __str__(self):
         return f"{self.username} ({self.first_name} {self.last_name})"
 
+    def profile_thumbnail_url(self, size, extension="jpg"):
+        if not self.profile_image_hash:
+            return None
+
+        return f"{settings.MEDIA_URL}{thumbnail_name(self.profile_image_hash, size, extension)}"
+
 
 class Project(models.Model):
     title = models.CharField(max_length=63)
@@ -79,6 +88,19 @@ class Task(models.Model):
     modified = models.DateTimeField(auto_now=True)
     creator = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, null=True)
     project = models.ForeignKey(Project, on_delete=models.CASCADE, null=True)
+    comment_count = models.PositiveIntegerField(default=0, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["project", "creator"], name="task_project_creator_idx"),
+            models.Index(fields=["project", "status", "modified"], name="task_project_status_idx"),
+            models.Index(fields=["modified"], condition=models.Q(status="Done"), name="task_done_modified_idx"),
+            models.Index(
+                fields=["deadline"],
+                condition=models.Q(deadline__isnull=False),
+                name="task_deadline_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} {self.deadline}"
@@ -86,6 +108,32 @@ class Task(models.Model):
     def get_absolute_url(self):
         return reverse("tasks:task-detail", kwargs={"pk": self.project.pk, "task_pk": self.pk})
 
+    def save(self, *args, **kwargs):
+        # comment_count is maintained with atomic UPDATEs by TaskComment, so a
+        # full save of a stale instance must not write it back.
+        if not self._state.adding and kwargs.get("update_fields") is None and not kwargs.get("force_insert"):
+            kwargs["update_fields"] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != "comment_count"
+            ]
+
+        super().save(*args, **kwargs)
+
+
+class TaskDependency(models.Model):
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="+")
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name="dependencies")
+    depends_on = models.ForeignKey(Task, on_delete=models.CASCADE, related_name="dependents")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["task", "depends_on"], name="taskdependency_unique"),
+            models.CheckConstraint(check=~models.Q(task=models.F("depends_on")), name="taskdependency_not_self"),
+        ]
+
+    def __str__(self):
+        return f"{self.task_id} depends on {self.depends_on_id}"
+
 
 class ChatMessage(models.Model):
     project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="messages")
@@ -93,6 +141,11 @@ class ChatMessage(models.Model):
     sender = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     date = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["project", "date"], name="chatmessage_project_date_idx"),
+        ]
+
 
 class TaskComment(models.Model):
     message = models.TextField()
@@ -102,3 +155,136 @@ class TaskComment(models.Model):
 
     class Meta:
         ordering = ("-date", )
+        indexes = [
+            models.Index(fields=["task", "-date"], name="taskcomment_task_date_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            return super().save(*args, **kwargs)
+
+        # Keeps the comment_count update of the post_save receiver in the same transaction.
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+    def change_comment_count(self, delta):
+        Task.objects.filter(pk=self.task_id).update(comment_count=models.F("comment_count") + delta)
+        if TaskComment.task.is_cached(self):
+            self.task.comment_count += delta
+
+
+class SearchDocument(models.Model):
+    PROJECT = "project"
+    TASK = "task"
+    COMMENT = "comment"
+    MESSAGE = "message"
+
+    KIND_CHOICES = [
+        (PROJECT, "Project"),
+        (TASK, "Task"),
+        (COMMENT, "Comment"),
+        (MESSAGE, "Chat message"),
+    ]
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="+")
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, null=True, related_name="+")
+    comment = models.ForeignKey(TaskComment, on_delete=models.CASCADE, null=True, related_name="+")
+    message = models.ForeignKey(ChatMessage, on_delete=models.CASCADE, null=True, related_name="+")
+    title = models.CharField(max_length=255, blank=True)
+    body = models.TextField(blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "object_id"], name="searchdocument_kind_object_unique"),
+        ]
+        indexes = [
+            models.Index(fields=["project", "kind"], name="searchdocument_project_idx"),
+        ]
+
+
+class ChangeLogEntry(models.Model):
+    """
+    Append-only log of changes per project, read by the change feed in
+    ``id`` order.
+
+    Rows become visible in commit order, which can differ from ``id``
+    order, so a reader could move past an entry that commits later. Writers
+    therefore take the project row lock before inserting and keep it until
+    they commit: a project's entries commit in ``id`` order.
+    """
+
+    PROJECT = "project"
+    TASK = "task"
+    COMMENT = "comment"
+    MESSAGE = "message"
+    MEMBER = "member"
+
+    KIND_CHOICES = [
+        (PROJECT, "Project"),
+        (TASK, "Task"),
+        (COMMENT, "Comment"),
+        (MESSAGE, "Chat message"),
+        (MEMBER, "Member"),
+    ]
+
+    UPSERT = "upsert"
+    DELETE = "delete"
+
+    ACTION_CHOICES = [
+        (UPSERT, "Created or updated"),
+        (DELETE, "Deleted"),
+    ]
+
+    # Not a foreign key: entries written while a project is being deleted
+    # must not block it. compact_changelog removes them afterwards.
+    project_id = models.PositiveBigIntegerField()
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
+    created = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["project_id", "id"], name="changelog_project_idx"),
+            models.Index(fields=["project_id", "kind", "object_id"], name="changelog_object_idx"),
+            models.Index(fields=["created"], name="changelog_created_idx"),
+        ]
+
+
+class Job(models.Model):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+    STATUS_CHOICES = [
+        (QUEUED, "Queued"),
+        (RUNNING, "Running"),
+        (DONE, "Done"),
+        (FAILED, "Failed"),
+    ]
+
+    name = models.CharField(max_length=63)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=QUEUED)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=3)
+    run_at = models.DateTimeField(default=timezone.now)
+    created = models.DateTimeField(auto_now_add=True)
+    started = models.DateTimeField(null=True, blank=True)
+    finished = models.DateTimeField(null=True, blank=True)
+    duration = models.DurationField(null=True, blank=True)
+    # Refreshed by the worker while the job runs, see tasks.jobs.requeue_stale().
+    heartbeat = models.DateTimeField(null=True, blank=True)
+    locked_by = models.CharField(max_length=255, blank=True)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "run_at"], name="job_status_run_at_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.status})"
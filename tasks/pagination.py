@@ -0,0 +1,98 @@
+import base64
+import binascii
+from datetime import datetime
+
+from django.db.models import Q
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(obj, field="date"):
+    raw = f"{getattr(obj, field).isoformat()}|{obj.pk}"
+
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        value, pk = raw.rsplit("|", 1)
+
+        return datetime.fromisoformat(value), int(pk)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as error:
+        raise InvalidCursor("Invalid cursor.") from error
+
+
+def encode_pk_cursor(pk):
+    return base64.urlsafe_b64encode(str(pk).encode()).decode().rstrip("=")
+
+
+def decode_pk_cursor(cursor):
+    try:
+        return int(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError) as error:
+        raise InvalidCursor("Invalid cursor.") from error
+
+
+class KeysetPage:
+    def __init__(self, items, has_more, field="date"):
+        self.items = items
+        self.has_more = has_more
+        self.field = field
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    @property
+    def first_cursor(self):
+        return encode_cursor(self.items[0], self.field) if self.items else None
+
+    @property
+    def last_cursor(self):
+        return encode_cursor(self.items[-1], self.field) if self.items else None
+
+
+def keyset_query(queryset, limit, before=None, after=None, field="date"):
+    if after is not None:
+        value, pk = decode_cursor(after)
+        queryset = queryset.filter(Q(**{f"{field}__gt": value}) | Q(**{field: value, "pk__gt": pk}))
+
+        return queryset.order_by(field, "pk")[:limit + 1], False
+
+    if before is not None:
+        value, pk = decode_cursor(before)
+        queryset = queryset.filter(Q(**{f"{field}__lt": value}) | Q(**{field: value, "pk__lt": pk}))
+
+    return queryset.order_by(f"-{field}", "-pk")[:limit + 1], True
+
+
+def build_page(rows, limit, newest_first, field):
+    items = rows[:limit]
+
+    return KeysetPage(items[::-1] if newest_first else items, len(rows) > limit, field)
+
+
+def keyset_page(queryset, limit, before=None, after=None, field="date"):
+    """
+    Return up to ``limit`` rows ordered by ``(field, pk)`` ascending.
+
+    Without a cursor the newest rows are returned; ``before`` walks back into
+    older history and ``after`` fetches rows newer than the cursor.
+    """
+    queryset, newest_first = keyset_query(queryset, limit, before, after, field)
+
+    return build_page(list(queryset), limit, newest_first, field)
+
+
+async def akeyset_page(queryset, limit, before=None, after=None, field="date"):
+    queryset, newest_first = keyset_query(queryset, limit, before, after, field)
+
+    return build_page([row async for row in queryset], limit, newest_first, field)
@@ -0,0 +1,170 @@
+from django.contrib.auth.mixins import AccessMixin
+from django.db.models import BooleanField, Exists, ExpressionWrapper, OuterRef, Q
+from django.http import Http404, HttpResponseForbidden
+
+from tasks.models import Project, Task
+
+
+def membership_exists(user_id, project_ref="pk"):
+    return Exists(
+        Project.assignees.through.objects.filter(
+            project_id=OuterRef(project_ref),
+            worker_id=user_id
+        )
+    )
+
+
+def access_condition(user_id, prefix=""):
+    return Q(**{f"{prefix}creator_id": user_id}) | Q(membership_exists(user_id, f"{prefix}id"))
+
+
+def accessible_projects(user):
+    member_of = Project.assignees.through.objects.filter(worker_id=user.id).values("project_id")
+
+    return Project.objects.filter(Q(creator_id=user.id) | Q(pk__in=member_of))
+
+
+class ProjectAccess:
+    def __init__(self, user):
+        self.user = user
+        self.projects = {}
+        self.tasks = {}
+        self.granted = set()
+        self.denied = set()
+
+    def can_access(self, project_id):
+        project_id = int(project_id)
+
+        if project_id in self.granted:
+            return True
+        if project_id in self.denied or not self.user.is_authenticated:
+            return False
+
+        allowed = accessible_projects(self.user).filter(pk=project_id).exists()
+        self._remember(project_id, allowed)
+
+        return allowed
+
+    def get_project(self, project_id):
+        project_id = int(project_id)
+
+        if project_id not in self.projects:
+            self._store_project(project_id, self._project_query(project_id).first())
+
+        return self.projects[project_id]
+
+    async def aget_project(self, project_id):
+        project_id = int(project_id)
+
+        if project_id not in self.projects:
+            self._store_project(project_id, await self._project_query(project_id).afirst())
+
+        return self.projects[project_id]
+
+    def get_task(self, project_id, task_id):
+        key = (int(project_id), int(task_id))
+
+        if key not in self.tasks:
+            self._store_task(key, self._task_query(key).first())
+
+        return self.tasks[key]
+
+    async def aget_task(self, project_id, task_id):
+        key = (int(project_id), int(task_id))
+
+        if key not in self.tasks:
+            self._store_task(key, await self._task_query(key).afirst())
+
+        return self.tasks[key]
+
+    @property
+    def _user_id(self):
+        return self.user.id if self.user.is_authenticated else None
+
+    def _project_query(self, project_id):
+        return (
+            Project.objects
+            .select_related("creator")
+            .annotate(is_member=ExpressionWrapper(access_condition(self._user_id), output_field=BooleanField()))
+            .filter(pk=project_id)
+        )
+
+    def _task_query(self, key):
+        return (
+            Task.objects
+            .select_related("project__creator", "creator", "task_type")
+            .annotate(
+                is_member=ExpressionWrapper(access_condition(self._user_id, "project__"), output_field=BooleanField())
+            )
+            .filter(pk=key[1], project_id=key[0])
+        )
+
+    def _store_project(self, project_id, project):
+        if project is None:
+            raise Http404("No Project matches the given query.")
+
+        self.projects[project_id] = project
+        self._remember(project_id, bool(project.is_member) and self._user_id is not None)
+
+    def _store_task(self, key, task):
+        if task is None:
+            raise Http404("No Task matches the given query.")
+
+        self.tasks[key] = task
+        self.projects.setdefault(key[0], task.project)
+        self._remember(key[0], bool(task.is_member) and self._user_id is not None)
+
+    def _remember(self, project_id, allowed):
+        (self.granted if allowed else self.denied).add(project_id)
+
+
+def get_project_access(request):
+    access = getattr(request, "_project_access", None)
+
+    if access is None or access.user is not request.user:
+        access = ProjectAccess(request.user)
+        request._project_access = access
+
+    return access
+
+
+class ProjectMemberRequiredMixin(AccessMixin):
+    project_url_kwarg = "pk"
+    permission_denied_message = "You do not have permission to view this page."
+
+    def load_objects(self, access):
+        self.project = access.get_project(self.kwargs[self.project_url_kwarg])
+
+    def has_object_permission(self, access):
+        return access.can_access(self.project.pk)
+
+    def dispatch(self, request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return self.handle_no_permission()
+
+        access = get_project_access(request)
+        self.load_objects(access)
+
+        if not self.has_object_permission(access):
+            return self.permission_denied()
+
+        return super().dispatch(request, *args, **kwargs)
+
+    def permission_denied(self):
+        return HttpResponseForbidden(self.get_permission_denied_message())
+
+
+class TaskAccessMixin(ProjectMemberRequiredMixin):
+    task_url_kwarg = "task_pk"
+    permission_denied_message = "You do not have permission to this page."
+    creator_required = False
+
+    def load_objects(self, access):
+        self.task = access.get_task(self.kwargs[self.project_url_kwarg], self.kwargs[self.task_url_kwarg])
+        self.project = self.task.project
+
+    def has_object_permission(self, access):
+        if self.creator_required and self.task.creator_id != self.request.user.id:
+            return False
+
+        return super().has_object_permission(access)
@@ -0,0 +1,55 @@
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import connection
+from django.db.models import OuterRef, Subquery
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+from tasks.models import SearchDocument
+from tasks.permissions import accessible_projects
+
+VENDOR_BACKENDS = {
+    "sqlite": "tasks.search.backends.SQLiteSearchBackend",
+    "postgresql": "tasks.search.backends.PostgresSearchBackend",
+}
+
+
+@lru_cache(maxsize=None)
+def get_search_backend():
+    path = getattr(settings, "TASKS_SEARCH_BACKEND", None) or VENDOR_BACKENDS.get(
+        connection.vendor,
+        "tasks.search.backends.DatabaseSearchBackend"
+    )
+
+    return import_string(path)()
+
+
+@receiver(setting_changed)
+def reset_search_backend(*, setting, **kwargs):
+    if setting == "TASKS_SEARCH_BACKEND":
+        get_search_backend.cache_clear()
+
+
+def search(user, query, kinds=None, project=None):
+    documents = SearchDocument.objects.filter(project__in=accessible_projects(user))
+    if kinds:
+        documents = documents.filter(kind__in=kinds)
+    if project is not None:
+        documents = documents.filter(project=project)
+
+    return get_search_backend().search(documents, query)
+
+
+def filter_by_rank(queryset, user, query, kind, project=None):
+    """
+    Filter ``queryset`` down to the objects whose search document of
+    ``kind`` matches ``query``, best match first. The rank is only
+    computed for matches and is left out of ``count()``.
+    """
+    documents = search(user, query, [kind], project)
+    rank = Subquery(documents.filter(object_id=OuterRef("pk")).values("rank")[:1])
+    ordering = rank.desc() if get_search_backend().rank_descending else rank.asc()
+
+    return queryset.filter(pk__in=documents.values("object_id")).order_by(ordering, "-pk")
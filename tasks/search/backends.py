@@ -0,0 +1,122 @@
+import re
+
+from django.db.models import BooleanField, Expression, F, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(query):
+    return TOKEN.findall(query.lower())
+
+
+class DocumentSQL(Expression):
+    """
+    Raw SQL over the columns of a search document, written with ``{id}``,
+    ``{title}`` and ``{body}`` placeholders. Unlike ``RawSQL`` it still
+    names the right table when the documents are queried in a subquery.
+    """
+
+    def __init__(self, sql, params, output_field):
+        super().__init__(output_field=output_field)
+        self.sql = sql
+        self.params = params
+        self.columns = {name: F(name) for name in ("id", "title", "body") if f"{{{name}}}" in sql}
+
+    def get_source_expressions(self):
+        return list(self.columns.values())
+
+    def set_source_expressions(self, expressions):
+        self.columns = dict(zip(self.columns, expressions))
+
+    def resolve_expression(self, query=None, allow_joins=True, reuse=None, summarize=False, for_save=False):
+        clone = self.copy()
+        clone.set_source_expressions([
+            column.resolve_expression(query, allow_joins, reuse, summarize, for_save) for column in self.columns.values()
+        ])
+
+        return clone
+
+    def as_sql(self, compiler, connection):
+        columns = {name: compiler.compile(column)[0] for name, column in self.columns.items()}
+
+        return f"({self.sql.format(**columns)})", self.params
+
+
+class BaseSearchBackend:
+    # Whether a higher rank is a better match.
+    rank_descending = False
+
+    def search(self, queryset, query):
+        """
+        Filter ``queryset`` of search documents down to matches for ``query``,
+        annotated with ``rank`` and ordered best match first.
+        """
+        raise NotImplementedError
+
+
+class SQLiteSearchBackend(BaseSearchBackend):
+    """
+    Queries the FTS5 table kept in sync with ``tasks_searchdocument`` by triggers.
+    """
+
+    match_sql = "SELECT rowid FROM tasks_searchdocument_fts WHERE tasks_searchdocument_fts MATCH %s"
+    rank_sql = (
+        "SELECT bm25(tasks_searchdocument_fts, 2.0, 1.0) FROM tasks_searchdocument_fts "
+        "WHERE tasks_searchdocument_fts MATCH %s AND rowid = {id}"
+    )
+
+    def search(self, queryset, query):
+        terms = tokenize(query)
+        if not terms:
+            return queryset.none()
+
+        expression = " ".join(f'"{term}"*' for term in terms)
+
+        return (
+            queryset
+            .filter(pk__in=RawSQL(self.match_sql, (expression,)))
+            .annotate(rank=DocumentSQL(self.rank_sql, (expression,), FloatField()))
+            .order_by("rank", "-pk")
+        )
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """
+    Matches against the GIN-indexed ``to_tsvector`` expression on search documents.
+    """
+
+    vector_sql = "to_tsvector('english', {title} || ' ' || {body})"
+    rank_descending = True
+
+    def search(self, queryset, query):
+        terms = tokenize(query)
+        if not terms:
+            return queryset.none()
+
+        expression = " & ".join(f"{term}:*" for term in terms)
+
+        return (
+            queryset
+            .filter(DocumentSQL(f"{self.vector_sql} @@ to_tsquery('english', %s)", (expression,), BooleanField()))
+            .annotate(rank=DocumentSQL(
+                f"ts_rank({self.vector_sql}, to_tsquery('english', %s))", (expression,), FloatField()
+            ))
+            .order_by("-rank", "-pk")
+        )
+
+
+class DatabaseSearchBackend(BaseSearchBackend):
+    """
+    Portable fallback for databases without a full-text engine.
+    """
+
+    def search(self, queryset, query):
+        terms = tokenize(query)
+        if not terms:
+            return queryset.none()
+
+        for term in terms:
+            queryset = queryset.filter(Q(title__icontains=term) | Q(body__icontains=term))
+
+        return queryset.annotate(rank=Value(0.0, output_field=FloatField())).order_by("-pk")
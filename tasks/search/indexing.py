@@ -0,0 +1,90 @@
+from tasks.models import ChatMessage, Project, SearchDocument, Task, TaskComment
+
+
+def project_document(project):
+    return {"project_id": project.pk, "title": project.title, "body": project.description}
+
+
+def task_document(task):
+    if task.project_id is None:
+        return None
+
+    return {"project_id": task.project_id, "task_id": task.pk, "title": task.name, "body": task.description}
+
+
+def comment_document(comment):
+    if comment.task.project_id is None:
+        return None
+
+    return {
+        "project_id": comment.task.project_id,
+        "task_id": comment.task_id,
+        "comment_id": comment.pk,
+        "title": comment.task.name,
+        "body": comment.message,
+    }
+
+
+def message_document(message):
+    return {"project_id": message.project_id, "message_id": message.pk, "body": message.message}
+
+
+DOCUMENTS = {
+    Project: (SearchDocument.PROJECT, project_document, ()),
+    Task: (SearchDocument.TASK, task_document, ()),
+    TaskComment: (SearchDocument.COMMENT, comment_document, ("task", )),
+    ChatMessage: (SearchDocument.MESSAGE, message_document, ()),
+}
+
+
+def index_instance(instance):
+    kind, build, _ = DOCUMENTS[type(instance)]
+    fields = build(instance)
+
+    if fields is None:
+        SearchDocument.objects.filter(kind=kind, object_id=instance.pk).delete()
+    else:
+        SearchDocument.objects.update_or_create(kind=kind, object_id=instance.pk, defaults=fields)
+
+
+def update_comment_titles(task):
+    """Comment documents carry the name of their task as title."""
+    SearchDocument.objects.filter(kind=SearchDocument.COMMENT, task_id=task.pk).exclude(title=task.name).update(
+        title=task.name
+    )
+
+
+def index_new_instances(instances):
+    """
+    Index rows that were just bulk created, without reading them back.
+    """
+    documents = []
+    for instance in instances:
+        kind, build, _ = DOCUMENTS[type(instance)]
+        fields = build(instance)
+        if fields is not None:
+            documents.append(SearchDocument(kind=kind, object_id=instance.pk, **fields))
+
+    SearchDocument.objects.bulk_create(documents)
+
+
+def index_queryset(queryset, batch_size=1000):
+    kind, build, related = DOCUMENTS[queryset.model]
+    queryset = queryset.select_related(*related).order_by("pk")
+    indexed = 0
+    last_pk = 0
+
+    while True:
+        batch = list(queryset.filter(pk__gt=last_pk)[:batch_size])
+        if not batch:
+            return indexed
+
+        last_pk = batch[-1].pk
+        documents = [
+            SearchDocument(kind=kind, object_id=instance.pk, **fields)
+            for instance, fields in ((instance, build(instance)) for instance in batch)
+            if fields is not None
+        ]
+        SearchDocument.objects.filter(kind=kind, object_id__in=[instance.pk for instance in batch]).delete()
+        SearchDocument.objects.bulk_create(documents)
+        indexed += len(documents)
@@ -0,0 +1,59 @@
+from django.urls import reverse
+
+from tasks.pagination import encode_cursor
+
+
+def chat_message_payload(message):
+    return {
+        "id": message.pk,
+        "message": message.message,
+        "date": message.date.isoformat(),
+        "sender_id": message.sender_id,
+        "sender": message.sender.username,
+        "position": str(message.sender.position) if message.sender.position else None,
+        "cursor": encode_cursor(message),
+    }
+
+
+def task_card_payload(task):
+    return {
+        "id": task.pk,
+        "name": task.name,
+        "status": task.status,
+        "priority": task.priority,
+        "deadline": task.deadline.isoformat() if task.deadline else None,
+        "task_type": task.task_type.name if task.task_type else None,
+        "creator_id": task.creator_id,
+        "creator": task.creator.username if task.creator else None,
+        "comment_count": task.comment_count,
+        "url": reverse("tasks:task-detail", kwargs={"pk": task.project_id, "task_pk": task.pk}),
+    }
+
+
+def board_column_payload(column):
+    page = column["tasks"]
+
+    return {
+        **column,
+        "tasks": [task_card_payload(task) for task in page],
+        "has_more": page.has_more,
+        "before": page.last_cursor,
+    }
+
+
+def dependency_report_payload(report):
+    return {
+        "critical_path": report.critical_path,
+        "blocked": report.blocked,
+        "tasks": [
+            {
+                **task,
+                "deadline": task["deadline"].isoformat() if task["deadline"] else None,
+                "depends_on": sorted(report.dependencies.predecessors(pk)),
+                "earliest": report.earliest[pk].isoformat() if pk in report.earliest else None,
+                "latest": report.latest[pk].isoformat() if report.latest.get(pk) else None,
+                "slack": report.slack.get(pk),
+            }
+            for pk, task in report.tasks.items()
+        ],
+    }
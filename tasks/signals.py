@@ -0,0 +1,266 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from tasks.broadcast import chat_channel, get_broadcast
+from tasks.changelog import CHANGE_KINDS, append_entries, record_changes
+from tasks.conditional import invalidate_project_pages, invalidate_project_version, worker_project_ids
+from tasks.counters import invalidate_project_counts, invalidate_task_counts
+from tasks.dependencies import edge_changed
+from tasks.fragments import bump_fragment_version
+from tasks.models import (
+    ChangeLogEntry, ChatMessage, Position, Project, Task, TaskComment, TaskDependency, TaskType, Worker
+)
+from tasks.search.indexing import index_instance, update_comment_titles
+from tasks.serializers import chat_message_payload
+
+
+@receiver(post_save, sender=ChatMessage)
+def broadcast_chat_message(sender, instance, created, **kwargs):
+    if created:
+        payload = {"type": "chat.message", **chat_message_payload(instance)}
+        transaction.on_commit(lambda: get_broadcast().publish(chat_channel(instance.project_id), payload))
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=Task)
+@receiver(post_save, sender=TaskComment)
+@receiver(post_save, sender=ChatMessage)
+def update_search_index(sender, instance, raw=False, **kwargs):
+    if not raw:
+        index_instance(instance)
+
+
+def deletion_memo(origin, name):
+    """
+    State shared by the receivers of one delete, kept on the instance or
+    queryset it started from. The collector sends every pre_delete before
+    the first post_delete, and the post_delete of comments before the one
+    of their task.
+    """
+    if origin is None:
+        return {}
+
+    return origin.__dict__.setdefault(f"_deleted_{name}", {})
+
+
+@receiver(pre_delete, sender=Task)
+def remember_deleted_task(sender, instance, origin=None, **kwargs):
+    # Lets receivers of cascaded comments skip work their task does anyway.
+    deletion_memo(origin, "tasks")[instance.pk] = instance.project_id
+
+
+@receiver(pre_delete, sender=Project)
+def remember_deleted_project(sender, instance, origin=None, **kwargs):
+    deletion_memo(origin, "projects")[instance.pk] = True
+
+
+@receiver(post_save, sender=TaskComment)
+def count_created_comment(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        instance.change_comment_count(1)
+
+
+@receiver(post_delete, sender=TaskComment)
+def count_deleted_comment(sender, instance, origin=None, **kwargs):
+    # Unlike Model.delete(), this also runs for cascades and queryset deletes.
+    if instance.task_id not in deletion_memo(origin, "tasks"):
+        instance.change_comment_count(-1)
+
+
+@receiver(post_save, sender=Task)
+def update_task_comment_titles(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if not created and not raw and (update_fields is None or "name" in update_fields):
+        update_comment_titles(instance)
+
+
+@receiver(post_save, sender=Project)
+def invalidate_creator_project_count(sender, instance, created, **kwargs):
+    if created:
+        invalidate_project_counts([instance.creator_id])
+
+
+@receiver(pre_delete, sender=Project)
+def remember_project_members(sender, instance, **kwargs):
+    instance._member_ids = [instance.creator_id, *instance.assignees.values_list("pk", flat=True)]
+
+
+@receiver(post_delete, sender=Project)
+def invalidate_member_project_counts(sender, instance, **kwargs):
+    invalidate_project_counts(getattr(instance, "_member_ids", [instance.creator_id]))
+
+
+@receiver(m2m_changed, sender=Project.assignees.through)
+def invalidate_assignee_project_counts(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "pre_clear":
+        instance._cleared_ids = [instance.pk] if reverse else list(instance.assignees.values_list("pk", flat=True))
+    elif action == "post_clear":
+        invalidate_project_counts(getattr(instance, "_cleared_ids", []))
+    elif action in ("post_add", "post_remove"):
+        invalidate_project_counts([instance.pk] if reverse else pk_set)
+
+
+@receiver(post_save, sender=Task)
+def invalidate_creator_task_count(sender, instance, created, **kwargs):
+    if created:
+        invalidate_task_counts([instance.creator_id])
+
+
+@receiver(post_delete, sender=Task)
+def invalidate_deleted_task_count(sender, instance, **kwargs):
+    invalidate_task_counts([instance.creator_id])
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=Worker)
+def invalidate_template_fragments(sender, instance, raw=False, **kwargs):
+    if not raw:
+        bump_fragment_version(instance)
+
+
+@receiver(post_save, sender=TaskDependency)
+def add_dependency_edge(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        transaction.on_commit(
+            lambda: edge_changed(instance.project_id, instance.depends_on_id, instance.task_id, added=True)
+        )
+
+
+@receiver(post_delete, sender=TaskDependency)
+def remove_dependency_edge(sender, instance, **kwargs):
+    transaction.on_commit(
+        lambda: edge_changed(instance.project_id, instance.depends_on_id, instance.task_id, added=False)
+    )
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+@receiver(post_save, sender=ChatMessage)
+@receiver(post_delete, sender=ChatMessage)
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def invalidate_project_page_version(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_project_version([instance.pk if sender is Project else instance.project_id])
+
+
+@receiver(post_save, sender=TaskComment)
+@receiver(post_delete, sender=TaskComment)
+def invalidate_comment_project_version(sender, instance, raw=False, origin=None, **kwargs):
+    # A task deleted along with the comment invalidates the version itself.
+    if not raw and instance.task_id not in deletion_memo(origin, "tasks"):
+        invalidate_project_version([instance.task.project_id])
+
+
+@receiver(m2m_changed, sender=Project.assignees.through)
+def invalidate_member_project_version(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "pre_clear" and reverse:
+        instance._cleared_project_ids = list(instance.projects.values_list("pk", flat=True))
+    elif action == "post_clear":
+        invalidate_project_version(getattr(instance, "_cleared_project_ids", []) if reverse else [instance.pk])
+    elif action in ("post_add", "post_remove"):
+        invalidate_project_version(pk_set if reverse else [instance.pk])
+
+
+@receiver(post_save, sender=Worker)
+def invalidate_worker_project_pages(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    # Logging in only updates last_login, which no page shows.
+    if created or raw or (update_fields is not None and set(update_fields) <= {"last_login"}):
+        return
+    invalidate_project_pages(worker_project_ids(Worker.objects.filter(pk=instance.pk)))
+
+
+@receiver(post_save, sender=Position)
+def invalidate_position_project_pages(sender, instance, created, raw=False, **kwargs):
+    if not created and not raw:
+        invalidate_project_pages(worker_project_ids(Worker.objects.filter(position=instance)))
+
+
+@receiver(post_save, sender=TaskType)
+@receiver(pre_delete, sender=TaskType)
+def invalidate_task_type_project_pages(sender, instance, created=False, raw=False, **kwargs):
+    # Deleting a type clears it from its tasks with an UPDATE that sends no signals.
+    if not created and not raw:
+        invalidate_project_pages(instance.tasks.values_list("project_id", flat=True))
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=Task)
+@receiver(post_save, sender=TaskComment)
+@receiver(post_save, sender=ChatMessage)
+def record_saved_change(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+
+    if sender is TaskComment:
+        # The comment count of the task changed with it.
+        append_entries(instance.task.project_id, [
+            (ChangeLogEntry.COMMENT, instance.pk, ChangeLogEntry.UPSERT),
+            (ChangeLogEntry.TASK, instance.task_id, ChangeLogEntry.UPSERT),
+        ])
+    else:
+        record_changes(instance.pk if sender is Project else instance.project_id, CHANGE_KINDS[sender], [instance.pk])
+
+
+@receiver(post_delete, sender=Project)
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=ChatMessage)
+def record_deleted_change(sender, instance, origin=None, **kwargs):
+    if sender is Project:
+        record_changes(instance.pk, ChangeLogEntry.PROJECT, [instance.pk], ChangeLogEntry.DELETE)
+        return
+    if instance.project_id in deletion_memo(origin, "projects"):
+        # The tombstone of the project covers everything in it.
+        return
+
+    entries = [(CHANGE_KINDS[sender], instance.pk, ChangeLogEntry.DELETE)]
+    if sender is Task:
+        comment_ids = deletion_memo(origin, "comments").pop(instance.pk, [])
+        entries += [(ChangeLogEntry.COMMENT, comment_id, ChangeLogEntry.DELETE) for comment_id in comment_ids]
+    append_entries(instance.project_id, entries)
+
+
+@receiver(post_delete, sender=TaskComment)
+def record_deleted_comment(sender, instance, origin=None, **kwargs):
+    if instance.task_id in deletion_memo(origin, "tasks"):
+        # Recorded in one insert with the tombstone of the task.
+        deletion_memo(origin, "comments").setdefault(instance.task_id, []).append(instance.pk)
+        return
+
+    append_entries(instance.task.project_id, [
+        (ChangeLogEntry.COMMENT, instance.pk, ChangeLogEntry.DELETE),
+        (ChangeLogEntry.TASK, instance.task_id, ChangeLogEntry.UPSERT),
+    ])
+
+
+@receiver(m2m_changed, sender=Project.assignees.through)
+def record_member_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "pre_clear":
+        instance._cleared_member_pairs = (
+            [(project_id, instance.pk) for project_id in instance.projects.values_list("pk", flat=True)] if reverse
+            else [(instance.pk, worker_id) for worker_id in instance.assignees.values_list("pk", flat=True)]
+        )
+        return
+    if action == "post_clear":
+        pairs = getattr(instance, "_cleared_member_pairs", [])
+    elif action in ("post_add", "post_remove"):
+        pairs = [(pk, instance.pk) for pk in pk_set] if reverse else [(instance.pk, pk) for pk in pk_set]
+    else:
+        return
+
+    change = ChangeLogEntry.UPSERT if action == "post_add" else ChangeLogEntry.DELETE
+    entries = {}
+    for project_id, worker_id in pairs:
+        entries.setdefault(project_id, []).append((ChangeLogEntry.MEMBER, worker_id, change))
+    for project_id, project_entries in entries.items():
+        append_entries(project_id, project_entries)
+
+
+@receiver(pre_delete, sender=Worker)
+def record_deleted_member(sender, instance, **kwargs):
+    # The assignee rows go with the worker without an m2m_changed signal. Projects
+    # the worker created are deleted with it and get their own tombstone.
+    project_ids = list(instance.projects.exclude(creator=instance).values_list("pk", flat=True))
+    for project_id in project_ids:
+        append_entries(project_id, [(ChangeLogEntry.MEMBER, instance.pk, ChangeLogEntry.DELETE)])
+    invalidate_project_version(project_ids)
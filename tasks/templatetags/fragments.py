@@ -0,0 +1,10 @@
+from django import template
+
+from tasks import fragments
+
+register = template.Library()
+
+
+@register.simple_tag
+def fragment_version(instance):
+    return fragments.fragment_version(instance)
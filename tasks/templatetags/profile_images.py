@@ -0,0 +1,16 @@
+from django import template
+
+register = template.Library()
+
+
+@register.inclusion_tag("includes/profile_image.html")
+def profile_image(worker, size, css_class="img-radius"):
+    context = {"css_class": css_class, "size": size}
+
+    if worker.profile_image_hash:
+        context["webp_url"] = worker.profile_thumbnail_url(size, "webp")
+        context["image_url"] = worker.profile_thumbnail_url(size, "jpg")
+    elif worker.profile_image:
+        context["image_url"] = worker.profile_image.url
+
+    return context
@@ -0,0 +1,130 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from tasks.models import ChatMessage, Position, Project, Task, TaskComment, TaskType
+
+
+class ApiTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="testuser", password="password123", position=Position.objects.create(name="Developer")
+        )
+        self.client.login(username="testuser", password="password123")
+        self.project = Project.objects.create(title="Test Project", description="Text", creator=self.user)
+        self.task_type = TaskType.objects.create(name="Bug")
+        self.tasks = Task.objects.bulk_create(
+            Task(
+                name=f"Task {i}", description="", project=self.project, creator=self.user, task_type=self.task_type,
+                status=Task.DONE if i % 2 else Task.TODO, deadline=f"2030-01-{i + 1:02d}"
+            )
+            for i in range(5)
+        )
+        self.list_url = reverse("tasks:api-task-list", kwargs={"pk": self.project.pk})
+
+    def detail_url(self, task):
+        return reverse("tasks:api-task-detail", kwargs={"pk": self.project.pk, "task_pk": task.pk})
+
+    def send(self, method, url, data):
+        return getattr(self.client, method)(url, json.dumps(data), content_type="application/json")
+
+    def test_sparse_fields_and_cursor_pagination(self):
+        names = []
+        url = f"{self.list_url}?fields=name,status&limit=2"
+        while url:
+            # session, user, project and one page of tasks
+            with self.assertNumQueries(4):
+                response = self.client.get(url).json()
+            names += [task["name"] for task in response["data"]]
+            self.assertEqual(set(response["data"][0]), {"id", "name", "status"})
+            url = f"{self.list_url}?fields=name,status&limit=2&after={response['next']}" if response["next"] else None
+
+        self.assertEqual(names, [f"Task {i}" for i in range(5)])
+
+    def test_only_requested_columns_are_selected(self):
+        with self.assertNumQueries(4) as queries:
+            self.client.get(self.list_url, {"fields": "name"})
+
+        self.assertNotIn("description", queries.captured_queries[-1]["sql"])
+
+    def test_filters(self):
+        response = self.client.get(self.list_url, {
+            "status": Task.TODO, "deadline_after": "2030-01-02", "deadline_before": "2030-01-05"
+        })
+
+        self.assertEqual([task["name"] for task in response.json()["data"]], ["Task 2", "Task 4"])
+        self.assertEqual(self.client.get(self.list_url, {"priority": "Urgent"}).status_code, 400)
+
+    def test_includes_are_batched(self):
+        get_user_model().objects.create_user(username="other")
+
+        # session, user, project, tasks, then one query per include
+        with self.assertNumQueries(6):
+            response = self.client.get(self.list_url, {"include": "creator,task_type"}).json()
+
+        self.assertEqual(response["included"]["creator"], [{
+            "id": self.user.pk, "username": "testuser", "first_name": "", "last_name": "",
+            "position": self.user.position_id
+        }])
+        self.assertEqual(response["included"]["task_type"], [{"id": self.task_type.pk, "name": "Bug"}])
+        self.assertEqual(self.client.get(self.list_url, {"include": "comments"}).status_code, 400)
+
+    def test_create_update_and_delete_task(self):
+        response = self.send("post", self.list_url, {
+            "name": "New", "priority": "High", "status": "Doing", "task_type": self.task_type.pk
+        })
+        self.assertEqual(response.status_code, 201)
+        task = Task.objects.get(pk=response.json()["data"]["id"])
+        self.assertEqual((task.creator, task.project), (self.user, self.project))
+
+        response = self.send("patch", self.detail_url(task), {"status": "Done"})
+        self.assertEqual(response.json()["data"]["status"], "Done")
+        task.refresh_from_db()
+        self.assertEqual((task.name, task.status), ("New", "Done"))
+
+        self.assertEqual(self.send("patch", self.detail_url(task), {"name": ""}).json()["errors"]["name"], [
+            "Please enter a name."
+        ])
+        self.assertEqual(self.client.delete(self.detail_url(task)).status_code, 204)
+        self.assertFalse(Task.objects.filter(pk=task.pk).exists())
+
+    def test_comments_and_messages(self):
+        comments_url = reverse("tasks:api-comment-list", kwargs={"pk": self.project.pk, "task_pk": self.tasks[0].pk})
+        messages_url = reverse("tasks:api-message-list", kwargs={"pk": self.project.pk})
+
+        self.assertEqual(self.send("post", comments_url, {"message": "Hi"}).status_code, 201)
+        self.assertEqual(self.send("post", messages_url, {"message": "Hello"}).status_code, 201)
+
+        comment = self.client.get(comments_url, {"include": "sender"}).json()
+        self.assertEqual(comment["data"][0]["message"], "Hi")
+        self.assertEqual(comment["included"]["sender"][0]["username"], "testuser")
+        self.assertEqual(TaskComment.objects.get().task, self.tasks[0])
+        self.assertEqual(ChatMessage.objects.get().project, self.project)
+
+    def test_projects(self):
+        response = self.send("post", reverse("tasks:api-project-list"), {"title": "Second", "description": "Text"})
+        project = Project.objects.get(pk=response.json()["data"]["id"])
+        self.assertTrue(project.assignees.filter(pk=self.user.pk).exists())
+
+        response = self.client.get(reverse("tasks:api-project-list"), {"fields": "title"})
+        self.assertEqual([item["title"] for item in response.json()["data"]], ["Test Project", "Second"])
+
+    def test_permissions(self):
+        other = get_user_model().objects.create_user(username="member", password="password123")
+        self.project.assignees.add(other)
+        self.client.login(username="member", password="password123")
+
+        self.assertEqual(self.client.get(self.detail_url(self.tasks[0])).status_code, 200)
+        self.assertEqual(self.send("patch", self.detail_url(self.tasks[0]), {"status": "Done"}).status_code, 403)
+
+        get_user_model().objects.create_user(username="outsider", password="password123")
+        self.client.login(username="outsider", password="password123")
+        self.assertEqual(
+            self.client.get(self.list_url).json(), {"error": "You do not have permission to view this page."}
+        )
+        self.assertEqual(self.client.get(self.detail_url(Task(pk=999))).status_code, 404)
+
+        self.client.logout()
+        self.assertEqual(self.client.get(self.list_url).status_code, 401)
@@ -0,0 +1,96 @@
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import AsyncRequestFactory, TestCase
+from django.urls import reverse
+from django.utils.functional import SimpleLazyObject
+
+from tasks.async_views import (
+    AsyncChatMessagesView,
+    AsyncIndexView,
+    AsyncProjectListView,
+    AsyncProjectTaskListView,
+    AsyncTaskDetailView,
+)
+from tasks.models import ChatMessage, Project, Task, TaskComment
+
+
+class AsyncViewsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(username="testuser", password="password123")
+        self.outsider = get_user_model().objects.create_user(username="outsider", password="password123")
+        self.project = Project.objects.create(title="Test Project", creator=self.user)
+        self.project.assignees.add(self.user)
+        self.task = Task.objects.create(name="Test Task", project=self.project, creator=self.user)
+        TaskComment.objects.create(task=self.task, sender=self.user, message="First comment")
+        ChatMessage.objects.create(project=self.project, sender=self.user, message="Hello team")
+
+    async def get(self, view, url, user, headers=None, **kwargs):
+        request = AsyncRequestFactory().get(url, headers=headers)
+        # What CsrfViewMiddleware reads from the cookie of a returning browser.
+        request.META["CSRF_COOKIE"] = "a" * 32
+        request.user = SimpleLazyObject(lambda: get_user_model().objects.get(pk=user.pk))
+
+        response = await view.as_view()(request, **kwargs)
+        if hasattr(response, "render"):
+            response.render()
+
+        return response
+
+    async def test_index(self):
+        response = await self.get(AsyncIndexView, reverse("tasks:index"), self.user)
+
+        self.assertContains(response, "Projects")
+
+    async def test_project_list(self):
+        response = await self.get(AsyncProjectListView, reverse("tasks:project-list"), self.user)
+
+        self.assertContains(response, "Test Project")
+        self.assertEqual(response.context_data["paginator"].count, 1)
+
+    async def test_project_task_list(self):
+        kwargs = {"pk": self.project.pk}
+        response = await self.get(
+            AsyncProjectTaskListView, reverse("tasks:project-task-list", kwargs=kwargs), self.user, **kwargs
+        )
+
+        self.assertContains(response, "Test Task")
+
+    async def test_chat_messages(self):
+        kwargs = {"pk": self.project.pk}
+        response = await self.get(AsyncChatMessagesView, reverse("tasks:project-chat", kwargs=kwargs), self.user, **kwargs)
+
+        self.assertContains(response, "Hello team")
+
+    async def test_task_detail(self):
+        kwargs = {"pk": self.project.pk, "task_pk": self.task.pk}
+        response = await self.get(AsyncTaskDetailView, reverse("tasks:task-detail", kwargs=kwargs), self.user, **kwargs)
+
+        self.assertContains(response, "First comment")
+
+    async def test_task_detail_not_modified(self):
+        kwargs = {"pk": self.project.pk, "task_pk": self.task.pk}
+        url = reverse("tasks:task-detail", kwargs=kwargs)
+        response = await self.get(AsyncTaskDetailView, url, self.user, **kwargs)
+
+        response = await self.get(AsyncTaskDetailView, url, self.user, {"If-None-Match": response["ETag"]}, **kwargs)
+
+        self.assertEqual(response.status_code, 304)
+
+    async def test_outsider_is_forbidden(self):
+        kwargs = {"pk": self.project.pk}
+        response = await self.get(
+            AsyncChatMessagesView, reverse("tasks:project-chat", kwargs=kwargs), self.outsider, **kwargs
+        )
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_asgi_middleware_chain(self):
+        self.client.force_login(self.user)
+        self.async_client.cookies = self.client.cookies
+
+        response = async_to_sync(self.async_client.get)(reverse("tasks:project-chat", kwargs={"pk": self.project.pk}))
+
+        self.assertContains(response, "Hello team")
+        self.assertIn("Server-Timing", response)
@@ -0,0 +1,64 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from tasks.models import Project, Task
+
+
+class BoardTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="testuser", password="password123")
+        self.other = get_user_model().objects.create_user(username="other", password="password123")
+        self.client.login(username="testuser", password="password123")
+        self.project = Project.objects.create(title="Test Project", creator=self.user)
+        self.project.assignees.add(self.other)
+        Task.objects.bulk_create([
+            *(Task(name=f"Todo {i}", project=self.project, creator=self.user, priority=Task.HIGH) for i in range(3)),
+            Task(name="Doing", project=self.project, creator=self.user, status=Task.DOING, priority=Task.LOW),
+            Task(name="Other", project=Project.objects.create(title="Other", creator=self.other), creator=self.other),
+        ])
+        self.task = Task.objects.get(name="Doing")
+        self.status_url = reverse("tasks:task-status", kwargs={"pk": self.project.pk, "task_pk": self.task.pk})
+
+    def test_board_groups_tasks_by_status(self):
+        url = reverse("tasks:project-board", kwargs={"pk": self.project.pk})
+        # session, user, project, column counts, "To do" and "Doing" columns
+        with self.assertNumQueries(6):
+            columns = {column["status"]: column for column in self.client.get(url).context["columns"]}
+
+        self.assertEqual(columns[Task.TODO]["total"], 3)
+        self.assertEqual(columns[Task.TODO]["priorities"], {Task.HIGH: 3, Task.MEDIUM: 0, Task.LOW: 0})
+        self.assertEqual([task.name for task in columns[Task.DOING]["tasks"]], ["Doing"])
+        self.assertEqual(columns[Task.DONE]["total"], 0)
+
+    def test_board_data_pages_through_a_column(self):
+        url = reverse("tasks:project-board-data", kwargs={"pk": self.project.pk})
+
+        first = self.client.get(url, {"status": Task.TODO, "limit": 2}).json()["columns"][0]
+        second = self.client.get(url, {"status": Task.TODO, "limit": 2, "before": first["before"]}).json()["columns"][0]
+
+        self.assertTrue(first["has_more"])
+        self.assertFalse(second["has_more"])
+        self.assertEqual(len({task["id"] for task in first["tasks"] + second["tasks"]}), 3)
+        self.assertEqual(self.client.get(url, {"status": "Blocked"}).status_code, 400)
+
+    def test_move_task(self):
+        response = self.client.post(self.status_url, {"status": Task.DONE, "from": Task.DOING})
+
+        self.assertEqual(response.json()["status"], Task.DONE)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.status, Task.DONE)
+
+    def test_move_conflict(self):
+        Task.objects.filter(pk=self.task.pk).update(status=Task.DONE)
+
+        response = self.client.post(self.status_url, {"status": Task.TODO, "from": Task.DOING})
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()["status"], Task.DONE)
+
+    def test_move_requires_valid_status_and_creator(self):
+        self.assertEqual(self.client.post(self.status_url, {"status": "Blocked"}).status_code, 400)
+
+        self.client.login(username="other", password="password123")
+        self.assertEqual(self.client.post(self.status_url, {"status": Task.DONE}).status_code, 403)
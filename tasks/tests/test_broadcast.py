@@ -0,0 +1,81 @@
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from asgiref.testing import ApplicationCommunicator
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from task_manager.asgi import application
+from tasks.broadcast import InMemoryBroadcast, chat_channel, get_broadcast
+from tasks.models import ChatMessage, Project
+
+
+class InMemoryBroadcastTest(TestCase):
+    async def test_publish_reaches_channel_subscribers_only(self):
+        broadcast = InMemoryBroadcast()
+        subscription = broadcast.subscribe("first")
+        other = broadcast.subscribe("second")
+
+        broadcast.publish("first", {"id": 1})
+
+        self.assertEqual(await asyncio.wait_for(subscription.get(), 1), {"id": 1})
+        self.assertTrue(other.queue.empty())
+
+        subscription.close()
+        other.close()
+        self.assertEqual(broadcast.subscribers, {})
+
+
+class ChatSocketTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="testuser", password="password123")
+        self.project = Project.objects.create(title="Test Project", creator=self.user)
+        get_user_model().objects.create_user(username="outsider", password="password123")
+
+    def get_session_cookie(self, username):
+        self.client.login(username=username, password="password123")
+
+        return f"{settings.SESSION_COOKIE_NAME}={self.client.session.session_key}"
+
+    async def get_communicator(self, username):
+        cookie = await sync_to_async(self.get_session_cookie)(username)
+
+        return ApplicationCommunicator(application, {
+            "type": "websocket",
+            "path": f"/ws/projects/{self.project.pk}/chat/",
+            "headers": [(b"cookie", cookie.encode()), (b"origin", b"http://127.0.0.1")],
+        })
+
+    async def test_member_receives_new_messages(self):
+        communicator = await self.get_communicator("testuser")
+        await communicator.send_input({"type": "websocket.connect"})
+        self.assertEqual((await communicator.receive_output(1))["type"], "websocket.accept")
+
+        get_broadcast().publish(chat_channel(self.project.pk), {"type": "chat.message", "message": "Hello"})
+        event = await communicator.receive_output(1)
+
+        self.assertEqual(json.loads(event["text"])["message"], "Hello")
+        await communicator.send_input({"type": "websocket.disconnect", "code": 1000})
+        await communicator.wait(1)
+
+    async def test_outsider_is_rejected(self):
+        communicator = await self.get_communicator("outsider")
+        await communicator.send_input({"type": "websocket.connect"})
+
+        self.assertEqual(await communicator.receive_output(1), {"type": "websocket.close", "code": 4403})
+
+    def test_saved_message_is_published_on_commit(self):
+        published = []
+        broadcast = get_broadcast()
+        broadcast.publish = lambda channel, message: published.append((channel, message))
+
+        try:
+            with self.captureOnCommitCallbacks(execute=True):
+                ChatMessage.objects.create(project=self.project, sender=self.user, message="Hello")
+        finally:
+            del broadcast.publish
+
+        self.assertEqual(published[0][0], chat_channel(self.project.pk))
+        self.assertEqual(published[0][1]["message"], "Hello")
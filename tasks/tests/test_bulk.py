@@ -0,0 +1,86 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from tasks.counters import get_dashboard_counts
+from tasks.models import Project, Task, TaskComment, TaskType
+
+
+class BulkTaskTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="testuser", password="password123")
+        self.other = get_user_model().objects.create_user(username="other", password="password123")
+        self.client.login(username="testuser", password="password123")
+        self.project = Project.objects.create(title="Test Project", creator=self.user)
+        self.project.assignees.add(self.other)
+        self.mine = Task.objects.bulk_create(
+            Task(name=f"Task {i}", project=self.project, creator=self.user) for i in range(3)
+        )
+        self.theirs = Task.objects.create(name="Theirs", project=self.project, creator=self.other)
+        self.elsewhere = Task.objects.create(
+            name="Elsewhere", project=Project.objects.create(title="Other", creator=self.user), creator=self.user
+        )
+        self.ids = [task.pk for task in self.mine]
+        self.update_url = reverse("tasks:task-bulk-update", kwargs={"pk": self.project.pk})
+        self.delete_url = reverse("tasks:task-bulk-delete", kwargs={"pk": self.project.pk})
+
+    def test_bulk_update(self):
+        task_type = TaskType.objects.create(name="Bug")
+        before = Task.objects.get(pk=self.ids[0]).modified
+
+        # session, user, project, task type, then inside a savepoint the locking SELECT, one UPDATE,
+        # the project lock and the change log
+        with self.assertNumQueries(10):
+            response = self.client.post(self.update_url, {
+                "ids": [*self.ids, self.theirs.pk, self.elsewhere.pk],
+                "status": Task.DONE,
+                "priority": Task.HIGH,
+                "task_type": task_type.pk,
+            })
+
+        self.assertEqual(response.json()["updated"], self.ids)
+        self.assertEqual([failure["id"] for failure in response.json()["failed"]], [self.theirs.pk, self.elsewhere.pk])
+        self.assertEqual(
+            set(Task.objects.filter(pk__in=self.ids).values_list("status", "priority", "task_type")),
+            {(Task.DONE, Task.HIGH, task_type.pk)}
+        )
+        self.assertGreater(Task.objects.get(pk=self.ids[0]).modified, before)
+        self.assertEqual(Task.objects.get(pk=self.theirs.pk).status, Task.TODO)
+
+    def test_bulk_deadline_and_reassign(self):
+        deadline = self.mine[0].modified.date() + timedelta(days=7)
+        get_dashboard_counts(self.other)
+
+        self.client.post(self.update_url, {"ids": self.ids[:2], "deadline": deadline})
+        self.client.post(self.update_url, {"ids": self.ids[1:], "clear_deadline": "on", "creator": self.other.pk})
+
+        self.assertEqual(
+            list(Task.objects.filter(pk__in=self.ids).order_by("pk").values_list("deadline", "creator")),
+            [(deadline, self.user.pk), (None, self.other.pk), (None, self.other.pk)]
+        )
+        self.assertEqual(get_dashboard_counts(self.other)["num_tasks"], 3)
+
+    def test_bulk_update_validation(self):
+        outsider = get_user_model().objects.create_user(username="outsider", password="password123")
+
+        for data in ({"ids": self.ids}, {"ids": ["x"], "status": Task.DONE}, {"ids": self.ids, "creator": outsider.pk}):
+            self.assertEqual(self.client.post(self.update_url, data).status_code, 400)
+
+    def test_bulk_delete(self):
+        TaskComment.objects.create(task=self.mine[0], sender=self.user, message="Hello")
+
+        response = self.client.post(self.delete_url, {"ids": [*self.ids, self.theirs.pk]})
+
+        self.assertEqual(response.json()["deleted"], self.ids)
+        self.assertEqual(len(response.json()["failed"]), 1)
+        self.assertEqual(list(Task.objects.filter(project=self.project)), [self.theirs])
+        self.assertFalse(TaskComment.objects.exists())
+
+    def test_outsider_is_forbidden(self):
+        get_user_model().objects.create_user(username="outsider", password="password123")
+        self.client.login(username="outsider", password="password123")
+
+        self.assertEqual(self.client.post(self.delete_url, {"ids": self.ids}).status_code, 403)
+        self.assertEqual(Task.objects.filter(pk__in=self.ids).count(), 3)
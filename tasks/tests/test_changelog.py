@@ -0,0 +1,184 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from tasks.bulk import bulk_update_tasks
+from tasks.models import ChangeLogEntry, ChatMessage, Position, Project, Task, TaskComment
+from tasks.pagination import encode_cursor
+
+
+class ChangeFeedTest(TestCase):
+    def setUp(self):
+        position = Position.objects.create(name="Developer")
+        self.user = get_user_model().objects.create_user(username="testuser", password="password123", position=position)
+        self.other = get_user_model().objects.create_user(username="other", password="password123", position=position)
+        self.client.login(username="testuser", password="password123")
+        self.project = Project.objects.create(title="Test Project", description="Text", creator=self.user)
+        self.task = Task.objects.create(name="Task", description="", project=self.project, creator=self.user)
+        self.url = reverse("tasks:project-changes", kwargs={"pk": self.project.pk})
+
+    def cursor(self):
+        return self.client.get(self.url).json()["cursor"]
+
+    def changes(self, cursor, **params):
+        response = self.client.get(self.url, {"since": cursor, **params})
+        self.assertEqual(response.status_code, 200)
+
+        return response.json()
+
+    def test_only_changes_after_the_cursor_are_returned(self):
+        cursor = self.cursor()
+        self.task.name = "Renamed"
+        self.task.save()
+        self.task.save()
+        message = ChatMessage.objects.create(project=self.project, message="Hi", sender=self.user)
+        self.project.assignees.add(self.other)
+
+        response = self.changes(cursor)
+
+        self.assertEqual(
+            [(change["kind"], change["id"], change["action"]) for change in response["changes"]],
+            [
+                (ChangeLogEntry.TASK, self.task.pk, ChangeLogEntry.UPSERT),
+                (ChangeLogEntry.MESSAGE, message.pk, ChangeLogEntry.UPSERT),
+                (ChangeLogEntry.MEMBER, self.other.pk, ChangeLogEntry.UPSERT),
+            ]
+        )
+        self.assertEqual(response["changes"][0]["data"]["name"], "Renamed")
+        self.assertEqual(response["changes"][2]["data"]["username"], "other")
+        self.assertEqual(self.changes(response["cursor"])["changes"], [])
+
+    def test_deletes_are_returned_as_tombstones(self):
+        cursor = self.cursor()
+        comment = TaskComment.objects.create(task=self.task, message="Hi", sender=self.user)
+        self.project.assignees.add(self.other)
+        self.project.assignees.clear()
+        comment_pk = comment.pk
+        comment.delete()
+
+        changes = self.changes(cursor)["changes"]
+
+        self.assertIn({"kind": ChangeLogEntry.COMMENT, "id": comment_pk, "action": ChangeLogEntry.DELETE}, changes)
+        self.assertIn({"kind": ChangeLogEntry.MEMBER, "id": self.other.pk, "action": ChangeLogEntry.DELETE}, changes)
+        task = next(change for change in changes if change["kind"] == ChangeLogEntry.TASK)
+        self.assertEqual(task["data"]["comment_count"], 0)
+
+    def test_deleting_a_member_records_its_tombstone(self):
+        self.project.assignees.add(self.other)
+        cursor, other_pk = self.cursor(), self.other.pk
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other.delete()
+
+        self.assertEqual(
+            self.changes(cursor)["changes"],
+            [{"kind": ChangeLogEntry.MEMBER, "id": other_pk, "action": ChangeLogEntry.DELETE}]
+        )
+
+    def test_updates_without_signals_are_recorded(self):
+        cursor = self.cursor()
+        bulk_update_tasks(self.project, self.user, [self.task.pk], {"status": Task.DONE})
+
+        changes = self.changes(cursor)["changes"]
+
+        self.assertEqual([change["data"]["status"] for change in changes], [Task.DONE])
+
+    def test_pages(self):
+        cursor = self.cursor()
+        tasks = [Task.objects.create(name=f"Task {i}", project=self.project, creator=self.user) for i in range(5)]
+
+        ids = []
+        while True:
+            # session, user, project, entries and tasks
+            with self.assertNumQueries(5):
+                response = self.changes(cursor, limit=2)
+            ids += [change["id"] for change in response["changes"]]
+            cursor = response["cursor"]
+            if not response["has_more"]:
+                break
+
+        self.assertEqual(ids, [task.pk for task in tasks])
+
+    def test_cursor_of_an_idle_project_is_not_expired(self):
+        ChangeLogEntry.objects.update(created=timezone.now() - timedelta(days=40))
+
+        response = self.changes(self.cursor())
+
+        self.assertEqual(response["changes"], [])
+        self.assertEqual(self.changes(response["cursor"])["changes"], [])
+
+    def test_deleting_a_task_records_its_comments_in_one_insert(self):
+        TaskComment.objects.bulk_create(
+            TaskComment(task=self.task, sender=self.user, message=f"Comment {i}") for i in range(50)
+        )
+        comment_ids = list(TaskComment.objects.values_list("pk", flat=True))
+        cursor, task_pk = self.cursor(), self.task.pk
+
+        # dependencies twice, comments, search documents twice, comments, task, project lock and one change log insert
+        with self.assertNumQueries(9):
+            self.task.delete()
+
+        changes = self.changes(cursor)["changes"]
+        self.assertEqual(
+            sorted((change["kind"], change["id"]) for change in changes),
+            sorted([(ChangeLogEntry.TASK, task_pk), *[(ChangeLogEntry.COMMENT, pk) for pk in comment_ids]])
+        )
+        self.assertTrue(all(change["action"] == ChangeLogEntry.DELETE for change in changes))
+
+    def test_deleting_a_project_only_records_its_tombstone(self):
+        ChatMessage.objects.create(project=self.project, message="Hi", sender=self.user)
+        TaskComment.objects.create(task=self.task, message="Hi", sender=self.user)
+        ChangeLogEntry.objects.all().delete()
+
+        self.project.delete()
+
+        self.assertEqual(
+            list(ChangeLogEntry.objects.values_list("kind", "action")),
+            [(ChangeLogEntry.PROJECT, ChangeLogEntry.DELETE)]
+        )
+
+    def test_expired_and_invalid_cursors(self):
+        expired = ChangeLogEntry(pk=0, created=timezone.now() - timedelta(days=31))
+
+        response = self.client.get(self.url, {"since": encode_cursor(expired, "created")})
+
+        self.assertEqual(response.status_code, 410)
+        self.assertTrue(response.json()["reset"])
+        self.assertEqual(self.client.get(self.url, {"since": "nope"}).status_code, 400)
+
+    def test_non_members_are_denied(self):
+        self.client.login(username="other", password="password123")
+
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+
+class CompactChangeLogTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="testuser", password="password123", position=Position.objects.create(name="Developer")
+        )
+        self.project = Project.objects.create(title="Test Project", description="Text", creator=self.user)
+
+    def test_compaction_keeps_the_latest_entry_per_object(self):
+        task = Task.objects.create(name="Task", project=self.project, creator=self.user)
+        for _ in range(3):
+            task.save()
+        ChangeLogEntry.objects.filter(pk=ChangeLogEntry.objects.earliest("pk").pk).update(
+            created=timezone.now() - timedelta(days=40)
+        )
+        gone = Project.objects.create(title="Gone", description="Text", creator=self.user)
+        gone.delete()
+
+        out = StringIO()
+        call_command("compact_changelog", batch_size=2, stdout=out)
+
+        self.assertIn("orphaned", out.getvalue())
+        self.assertEqual(
+            list(ChangeLogEntry.objects.values_list("project_id", "kind", "object_id")),
+            [(self.project.pk, ChangeLogEntry.TASK, task.pk)]
+        )
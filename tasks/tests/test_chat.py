@@ -0,0 +1,55 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from tasks.models import ChatMessage, Project
+
+
+class ChatHistoryTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="testuser", password="password123")
+        self.client.login(username="testuser", password="password123")
+        self.project = Project.objects.create(title="Test Project", creator=self.user)
+        self.messages = ChatMessage.objects.bulk_create(
+            ChatMessage(project=self.project, sender=self.user, message=f"Message {i}")
+            for i in range(120)
+        )
+        self.url = reverse("tasks:project-chat-messages", kwargs={"pk": self.project.pk})
+
+    def test_chat_page_renders_latest_messages(self):
+        response = self.client.get(reverse("tasks:project-chat", kwargs={"pk": self.project.pk}))
+        page = response.context["messages"]
+
+        self.assertEqual(len(page), 50)
+        self.assertTrue(page.has_more)
+        self.assertEqual(page.items[-1].message, "Message 119")
+
+    def test_history_walks_back_with_before_cursor(self):
+        first = self.client.get(self.url).json()
+        second = self.client.get(self.url, {"before": first["before"]}).json()
+        third = self.client.get(self.url, {"before": second["before"]}).json()
+
+        self.assertEqual(first["messages"][0]["message"], "Message 70")
+        self.assertEqual(second["messages"][-1]["message"], "Message 69")
+        self.assertEqual(len(third["messages"]), 20)
+        self.assertFalse(third["has_more"])
+
+    def test_history_returns_newer_messages_after_cursor(self):
+        latest = self.client.get(self.url).json()
+        ChatMessage.objects.create(project=self.project, sender=self.user, message="New message")
+
+        response = self.client.get(self.url, {"after": latest["after"]}).json()
+
+        self.assertEqual([message["message"] for message in response["messages"]], ["New message"])
+        self.assertFalse(response["has_more"])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {"before": "not-a-cursor"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_history_requires_membership(self):
+        get_user_model().objects.create_user(username="outsider", password="password123")
+        self.client.login(username="outsider", password="password123")
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 403)
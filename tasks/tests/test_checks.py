@@ -0,0 +1,16 @@
+from django.test import SimpleTestCase, override_settings
+
+from tasks.checks import check_profilers_in_production
+
+
+class ProfilerCheckTest(SimpleTestCase):
+    @override_settings(ENVIRONMENT="production", MIDDLEWARE=["debug_toolbar.middleware.DebugToolbarMiddleware"])
+    def test_warns_about_profilers_in_production(self):
+        warnings = check_profilers_in_production(None)
+
+        self.assertEqual({warning.id for warning in warnings}, {"tasks.W001"})
+        self.assertIn("debug_toolbar.middleware.DebugToolbarMiddleware", [warning.obj for warning in warnings])
+
+    @override_settings(ENVIRONMENT="development", MIDDLEWARE=["debug_toolbar.middleware.DebugToolbarMiddleware"])
+    def test_profilers_are_allowed_in_development(self):
+        self.assertEqual(check_profilers_in_production(None), [])
@@ -1,6 +1,12 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
 from django.utils import timezone
-from tasks.models import Task
+from tasks.models import Project, Task, TaskComment
 from django.core.management import call_command
 
 
@@ -30,3 +36,120 @@ class DeleteTasksTestCase(TestCase):
         self.assertFalse(Task.objects.filter(pk=self.task1.pk).exists(), msg="Task 1 should be deleted")
         self.assertFalse(Task.objects.filter(pk=self.task2.pk).exists(), msg="Task 2 should be deleted")
         self.assertTrue(Task.objects.filter(pk=self.task3.pk).exists(), msg="Task 3 should not be deleted")
+
+    def test_stale_done_task_is_deleted_with_comments(self):
+        Task.objects.filter(pk=self.task3.pk).update(
+            status="Done",
+            modified=timezone.now() - timezone.timedelta(days=2)
+        )
+        user = get_user_model().objects.create_user(username="testuser", password="password123")
+        TaskComment.objects.create(task=self.task3, sender=user, message="comment")
+
+        call_command("delete_tasks", stdout=StringIO())
+
+        self.assertFalse(Task.objects.exists())
+        self.assertFalse(TaskComment.objects.exists())
+
+    def test_dry_run_only_reports(self):
+        user = get_user_model().objects.create_user(username="testuser", password="password123")
+        for task in (self.task1, self.task1, self.task2, self.task2, self.task2):
+            TaskComment.objects.create(task=task, sender=user, message="comment")
+        out = StringIO()
+        call_command("delete_tasks", "--dry-run", stdout=out)
+
+        self.assertIn("Would delete 2 tasks (0 done, 2 past deadline) and 5 comments.", out.getvalue())
+        self.assertEqual(Task.objects.count(), 3)
+
+    def test_batches_and_since(self):
+        old_task = Task.objects.create(
+            name="Task 4",
+            status="To do",
+            deadline=timezone.now() - timezone.timedelta(days=30)
+        )
+        out = StringIO()
+        since = (timezone.now() - timezone.timedelta(days=7)).date().isoformat()
+
+        call_command("delete_tasks", "--batch-size=1", f"--since={since}", stdout=out)
+
+        self.assertEqual(out.getvalue().count("so far"), 2)
+        self.assertQuerySetEqual(Task.objects.order_by("pk"), [self.task3, old_task])
+
+
+class ExplainViewsTestCase(TestCase):
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="testuser", password="password123")
+        project = Project.objects.create(title="Test Project", creator=user)
+        Task.objects.create(name="Task 1", project=project, creator=user)
+
+    def test_explain_views(self):
+        out = StringIO()
+        call_command("explain_views", stdout=out)
+
+        self.assertIn("tasks:project-task-list", out.getvalue())
+        self.assertIn("tasks:task-detail", out.getvalue())
+
+
+class BenchmarkTemplatesTestCase(TestCase):
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="testuser", password="password123")
+        Project.objects.create(title="Test Project", creator=user)
+
+    def test_benchmark_templates(self):
+        out = StringIO()
+        call_command("benchmark_templates", iterations=2, stdout=out)
+
+        self.assertIn("includes/sidebar.html", out.getvalue())
+        self.assertIn("layouts/base.html", out.getvalue())
+
+
+class GenerateLoadDataTestCase(TestCase):
+    def test_generate_load_data(self):
+        call_command(
+            "generate_load_data", workers=10, projects=3, tasks=30, comments=40, messages=20, seed=1, stdout=StringIO()
+        )
+
+        self.assertEqual(get_user_model().objects.count(), 10)
+        self.assertEqual(Project.objects.count(), 3)
+        self.assertEqual(Task.objects.count(), 30)
+        self.assertEqual(TaskComment.objects.count(), 40)
+        self.assertEqual(sum(Task.objects.values_list("comment_count", flat=True)), 40)
+        for project in Project.objects.all():
+            self.assertTrue(project.assignees.filter(pk=project.creator_id).exists())
+
+
+class RunBenchmarksTestCase(TestCase):
+    def setUp(self):
+        call_command("generate_load_data", workers=5, projects=2, tasks=10, comments=10, messages=10, stdout=StringIO())
+
+    def test_run_benchmarks(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "results.json")
+            call_command(
+                "run_benchmarks", routes=["index", "task-detail"], iterations=3, warmup=0, output=output,
+                stdout=StringIO()
+            )
+            out = StringIO()
+            call_command("run_benchmarks", routes=["index"], iterations=3, warmup=0, compare=output, stdout=out)
+
+            with open(output) as file:
+                results = json.load(file)["routes"]
+
+        self.assertEqual(set(results), {"index", "task-detail"})
+        self.assertEqual(results["task-detail"]["status"], 200)
+        self.assertGreater(results["task-detail"]["queries"], 0)
+        self.assertIn("p95", out.getvalue())
+
+    def test_run_benchmarks_asgi(self):
+        out = StringIO()
+        call_command("run_benchmarks", routes=["index"], iterations=4, warmup=0, asgi=True, stdout=out)
+
+        self.assertRegex(out.getvalue(), r"tasks:index\s+200 .* req/s")
+
+    def test_run_benchmarks_revalidate(self):
+        out = StringIO()
+        call_command(
+            "run_benchmarks", routes=["index", "task-detail"], iterations=3, warmup=0, revalidate=True, stdout=out
+        )
+
+        self.assertRegex(out.getvalue(), r"tasks:index\s+200 ")
+        self.assertRegex(out.getvalue(), r"tasks:task-detail\s+304 ")
@@ -0,0 +1,89 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from tasks.models import Project, Task, TaskComment
+
+
+class CommentCountTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="testuser", password="password123")
+        self.client.login(username="testuser", password="password123")
+        self.project = Project.objects.create(title="Test Project", creator=self.user)
+        self.task = Task.objects.create(name="Test Task", project=self.project, creator=self.user)
+        self.url = reverse("tasks:task-detail", kwargs={"pk": self.project.pk, "task_pk": self.task.pk})
+
+    def test_count_follows_create_and_delete(self):
+        comment = TaskComment.objects.create(task=self.task, sender=self.user, message="First")
+        TaskComment.objects.create(task=self.task, sender=self.user, message="Second")
+        self.assertEqual(self.task.comment_count, 2)
+
+        comment.delete()
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.comment_count, 1)
+
+    def test_count_follows_cascaded_and_queryset_deletes(self):
+        other = get_user_model().objects.create_user(username="other", password="password123")
+        TaskComment.objects.create(task=self.task, sender=self.user, message="First")
+        TaskComment.objects.create(task=self.task, sender=other, message="Second")
+        TaskComment.objects.create(task=self.task, sender=self.user, message="Third")
+
+        other.delete()
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.comment_count, 2)
+
+        TaskComment.objects.filter(task=self.task).delete()
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.comment_count, 0)
+
+    def test_deleting_task_skips_count_updates(self):
+        TaskComment.objects.bulk_create(
+            TaskComment(task=self.task, sender=self.user, message=f"Comment {i}") for i in range(5)
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            self.task.delete()
+
+        self.assertFalse(any("UPDATE" in query["sql"] for query in queries.captured_queries))
+
+    def test_saving_stale_task_keeps_count(self):
+        stale = Task.objects.get(pk=self.task.pk)
+        TaskComment.objects.create(task=self.task, sender=self.user, message="First")
+
+        stale.name = "Renamed"
+        stale.save()
+
+        self.task.refresh_from_db()
+        self.assertEqual((self.task.name, self.task.comment_count), ("Renamed", 1))
+
+    def test_posted_comment_is_counted(self):
+        response = self.client.post(self.url, {"message": "Hello"})
+
+        self.assertContains(response, "1 comment<")
+
+    def test_backfill_comment_counts(self):
+        TaskComment.objects.create(task=self.task, sender=self.user, message="First")
+        Task.objects.update(comment_count=0)
+
+        call_command("backfill_comment_counts", stdout=StringIO())
+
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.comment_count, 1)
+
+    def test_comments_are_paginated_by_cursor(self):
+        TaskComment.objects.bulk_create(
+            TaskComment(task=self.task, sender=self.user, message=f"Comment {i}") for i in range(45)
+        )
+
+        first = self.client.get(self.url).context["comments"]
+        second = self.client.get(self.url, {"before": first.first_cursor}).context["comments"]
+        third = self.client.get(self.url, {"before": second.first_cursor}).context["comments"]
+
+        self.assertEqual((len(first), len(second), len(third)), (20, 20, 5))
+        self.assertEqual(first.items[-1].message, "Comment 44")
+        self.assertFalse(third.has_more)
@@ -0,0 +1,110 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils.http import http_date
+
+from tasks.models import Position, Project, Task, TaskComment, TaskType
+
+
+class ConditionalGetTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(username="testuser", password="password123")
+        self.client.login(username="testuser", password="password123")
+        self.project = Project.objects.create(title="Test Project", creator=self.user)
+        self.task = Task.objects.create(name="Test Task", project=self.project, creator=self.user)
+        self.urls = [
+            reverse("tasks:project-task-list", kwargs={"pk": self.project.pk}),
+            reverse("tasks:task-list", kwargs={"pk": self.project.pk}),
+            reverse("tasks:task-detail", kwargs={"pk": self.project.pk, "task_pk": self.task.pk}),
+        ]
+
+    def revalidate(self, url, response):
+        return self.client.get(url, headers={"If-None-Match": response["ETag"]})
+
+    def test_unchanged_pages_are_not_rendered(self):
+        for url in self.urls:
+            response = self.client.get(url)
+            self.assertEqual(response["Cache-Control"], "private, no-cache")
+            self.assertNotIn("Last-Modified", response)
+
+            # session, user and project or task
+            with self.assertNumQueries(3):
+                revalidated = self.revalidate(url, response)
+
+            self.assertEqual(revalidated.status_code, 304)
+            self.assertEqual(revalidated["ETag"], response["ETag"])
+
+    def test_writes_change_the_version(self):
+        url = self.urls[2]
+        writes = [
+            lambda: TaskComment.objects.create(task=self.task, sender=self.user, message="Comment"),
+            lambda: self.client.post(
+                reverse("tasks:task-status", kwargs={"pk": self.project.pk, "task_pk": self.task.pk}),
+                {"status": Task.DONE}
+            ),
+            lambda: self.project.assignees.add(get_user_model().objects.create_user(username="member")),
+            lambda: Project.objects.get(pk=self.project.pk).save(),
+        ]
+
+        for write in writes:
+            response = self.client.get(url)
+            with self.captureOnCommitCallbacks(execute=True):
+                write()
+
+            self.assertEqual(self.revalidate(url, response).status_code, 200)
+            # A new comment leaves every date alone, so a date must not validate the page.
+            self.assertEqual(
+                self.client.get(url, headers={"If-Modified-Since": http_date(time.time() + 60)}).status_code, 200
+            )
+
+    def test_renaming_what_pages_show_changes_the_etag(self):
+        position = Position.objects.create(name="Developer")
+        other = get_user_model().objects.create_user(username="other", position=position)
+        task_type = TaskType.objects.create(name="Bug")
+        self.project.assignees.add(other)
+        Task.objects.create(name="Other Task", project=self.project, creator=other, task_type=task_type)
+        TaskComment.objects.create(task=self.task, sender=other, message="Comment")
+
+        def rename(instance, field):
+            setattr(instance, field, "Renamed")
+            instance.save()
+
+        writes = [
+            lambda: rename(other, "username"),
+            lambda: rename(position, "name"),
+            lambda: rename(task_type, "name"),
+            lambda: task_type.delete(),
+        ]
+        for write in writes:
+            response = self.client.get(self.urls[0])
+            with self.captureOnCommitCallbacks(execute=True):
+                write()
+
+            self.assertEqual(self.revalidate(self.urls[0], response).status_code, 200)
+
+        response = self.client.get(self.urls[0])
+        with self.captureOnCommitCallbacks(execute=True):
+            other.save(update_fields=["last_login"])
+        self.assertEqual(self.revalidate(self.urls[0], response).status_code, 304)
+
+    def test_deleting_a_member_changes_the_version(self):
+        member = get_user_model().objects.create_user(username="member")
+        self.project.assignees.add(member)
+        response = self.client.get(self.urls[0])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            member.delete()
+
+        self.assertEqual(self.revalidate(self.urls[0], response).status_code, 200)
+
+    def test_etag_is_per_user(self):
+        response = self.client.get(self.urls[0])
+        member = get_user_model().objects.create_user(username="member", password="password123")
+        self.project.assignees.add(member)
+        self.client.login(username="member", password="password123")
+
+        self.assertEqual(self.revalidate(self.urls[0], response).status_code, 200)
@@ -0,0 +1,63 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from tasks.counters import get_dashboard_counts
+from tasks.models import Project, Task
+
+
+class DashboardCountersTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(username="testuser", password="password123")
+        self.other = get_user_model().objects.create_user(username="other", password="password123")
+        self.project = Project.objects.create(title="Own project", creator=self.user)
+        self.project.assignees.add(self.user)
+        Task.objects.create(name="Task", project=self.project, creator=self.user)
+
+    def test_counts_are_cached(self):
+        with self.assertNumQueries(2):
+            self.assertEqual(get_dashboard_counts(self.user), {"num_projects": 1, "num_tasks": 1})
+        with self.assertNumQueries(0):
+            self.assertEqual(get_dashboard_counts(self.user), {"num_projects": 1, "num_tasks": 1})
+
+    def test_membership_changes_invalidate_counts(self):
+        project = Project.objects.create(title="Other project", creator=self.other)
+        get_dashboard_counts(self.user)
+
+        project.assignees.add(self.user)
+        self.assertEqual(get_dashboard_counts(self.user)["num_projects"], 2)
+
+        self.user.projects.remove(project)
+        self.assertEqual(get_dashboard_counts(self.user)["num_projects"], 1)
+
+        project.assignees.add(self.user)
+        get_dashboard_counts(self.user)
+        project.assignees.clear()
+        self.assertEqual(get_dashboard_counts(self.user)["num_projects"], 1)
+
+    def test_project_delete_invalidates_members_and_task_creators(self):
+        project = Project.objects.create(title="Other project", creator=self.other)
+        project.assignees.add(self.user)
+        Task.objects.create(name="Task", project=project, creator=self.user)
+        self.assertEqual(get_dashboard_counts(self.user), {"num_projects": 2, "num_tasks": 2})
+
+        project.delete()
+        self.assertEqual(get_dashboard_counts(self.user), {"num_projects": 1, "num_tasks": 1})
+
+    def test_task_changes_invalidate_counts(self):
+        get_dashboard_counts(self.user)
+        task = Task.objects.create(name="Another task", project=self.project, creator=self.user)
+        self.assertEqual(get_dashboard_counts(self.user)["num_tasks"], 2)
+
+        task.delete()
+        self.assertEqual(get_dashboard_counts(self.user)["num_tasks"], 1)
+
+    def test_index_view_uses_counters(self):
+        self.client.login(username="testuser", password="password123")
+        self.client.get(reverse("tasks:index"))
+
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("tasks:index"))
+        self.assertEqual(response.context["num_projects"], 1)
@@ -0,0 +1,107 @@
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from django.urls import reverse
+
+from tasks.dependencies import add_dependency, dependency_report, get_graph
+from tasks.models import Project, Task, TaskDependency, TaskType
+
+
+class TaskDependencyTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(username="testuser", password="password123")
+        self.client.login(username="testuser", password="password123")
+        self.project = Project.objects.create(title="Test Project", creator=self.user)
+        task_type = TaskType.objects.create(name="Bug")
+        self.design, self.build, self.test, self.docs = [
+            Task.objects.create(
+                name=name, description="", deadline=deadline, project=self.project, creator=self.user,
+                task_type=task_type
+            )
+            for name, deadline in [
+                ("Design", None), ("Build", None), ("Test", date(2030, 1, 10)), ("Docs", date(2030, 1, 20)),
+            ]
+        ]
+
+    def depend(self, task, depends_on):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                reverse("tasks:task-dependency-add", kwargs={"pk": self.project.pk, "task_pk": task.pk}),
+                {"depends_on": depends_on.pk}
+            )
+
+    def test_cycles_are_rejected(self):
+        self.assertEqual(self.depend(self.build, self.design).status_code, 201)
+        self.assertEqual(self.depend(self.test, self.build).status_code, 201)
+
+        response = self.depend(self.design, self.test)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json()["errors"]["depends_on"],
+            ["This dependency would create a cycle: Design -> Test -> Build -> Design."]
+        )
+        self.assertEqual(TaskDependency.objects.count(), 2)
+        self.assertEqual(self.depend(self.design, self.design).status_code, 400)
+
+    def test_cycle_check_does_not_trust_the_cached_graph(self):
+        get_graph(self.project.pk)
+        # The version bump of this edge waits for a commit that has not happened yet.
+        add_dependency(self.build, self.design)
+
+        with self.assertRaises(ValidationError):
+            add_dependency(self.design, self.build)
+
+    def test_graph_is_updated_without_reloading(self):
+        self.depend(self.build, self.design)
+        graph = get_graph(self.project.pk)
+
+        self.depend(self.test, self.build)
+        with self.assertNumQueries(0):
+            updated = get_graph(self.project.pk)
+
+        self.assertIsNot(updated, graph)
+        self.assertEqual(set(updated.edges), {(self.design.pk, self.build.pk), (self.build.pk, self.test.pk)})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.test.delete()
+        self.assertEqual(set(get_graph(self.project.pk).edges), {(self.design.pk, self.build.pk)})
+
+    def test_critical_path_slack_and_blocked_tasks(self):
+        self.depend(self.build, self.design)
+        self.depend(self.test, self.build)
+        self.depend(self.docs, self.design)
+        Task.objects.filter(pk=self.design.pk).update(status=Task.DONE)
+
+        report = dependency_report(self.project, today=date(2030, 1, 1))
+
+        self.assertEqual(report.critical_path, [self.build.pk, self.test.pk])
+        self.assertEqual(report.blocked, [self.test.pk])
+        self.assertEqual(report.earliest[self.test.pk], date(2030, 1, 3))
+        self.assertEqual(report.latest[self.build.pk], date(2030, 1, 9))
+        self.assertEqual((report.slack[self.build.pk], report.slack[self.docs.pk]), (7, 18))
+
+    def test_report_view(self):
+        self.depend(self.build, self.design)
+        url = reverse("tasks:project-dependencies", kwargs={"pk": self.project.pk})
+
+        tasks = {task["id"]: task for task in self.client.get(url).json()["tasks"]}
+
+        self.assertEqual(tasks[self.build.pk]["depends_on"], [self.design.pk])
+        self.assertEqual(tasks[self.build.pk]["earliest"], (date.today() + timedelta(days=2)).isoformat())
+
+    def test_remove_dependency(self):
+        self.depend(self.build, self.design)
+        url = reverse("tasks:task-dependency-delete", kwargs={
+            "pk": self.project.pk, "task_pk": self.build.pk, "depends_on_pk": self.design.pk
+        })
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(self.client.post(url).status_code, 200)
+
+        self.assertEqual(self.client.post(url).status_code, 404)
+        self.assertEqual(get_graph(self.project.pk).number_of_edges(), 0)
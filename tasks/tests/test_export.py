@@ -0,0 +1,91 @@
+import csv
+import json
+from io import StringIO
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from tasks.models import ChatMessage, Project, Task, TaskComment, TaskType
+
+
+class ExportTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="testuser", password="password123")
+        self.client.login(username="testuser", password="password123")
+        self.project = Project.objects.create(title="Test Project", creator=self.user)
+        self.task = Task.objects.create(
+            name="Test Task", description="Line one\nline, two", project=self.project, creator=self.user,
+            task_type=TaskType.objects.create(name="Bug")
+        )
+        TaskComment.objects.create(task=self.task, sender=self.user, message="A comment")
+        ChatMessage.objects.bulk_create(
+            ChatMessage(project=self.project, sender=self.user, message=f"Message {i}") for i in range(5)
+        )
+
+    def get_export(self, kind, fmt="csv"):
+        response = self.client.get(
+            reverse("tasks:project-export", kwargs={"pk": self.project.pk, "kind": kind}), {"format": fmt}
+        )
+        self.assertTrue(response.streaming)
+
+        return response, b"".join(response.streaming_content).decode()
+
+    def test_tasks_csv(self):
+        response, content = self.get_export("tasks")
+        rows = list(csv.DictReader(StringIO(content)))
+
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(
+            (rows[0]["description"], rows[0]["task_type"], rows[0]["creator"], rows[0]["comment_count"]),
+            ("Line one\nline, two", "Bug", "testuser", "1")
+        )
+
+    def test_messages_ndjson(self):
+        _, content = self.get_export("messages", "ndjson")
+        rows = [json.loads(line) for line in content.splitlines()]
+
+        self.assertEqual([row["message"] for row in rows], [f"Message {i}" for i in range(5)])
+        self.assertEqual(rows[0]["sender"], "testuser")
+
+    def test_asgi_export_is_streamed_asynchronously(self):
+        self.async_client.force_login(self.user)
+        url = reverse("tasks:project-export", kwargs={"pk": self.project.pk, "kind": "messages"})
+
+        async def get_export():
+            response = await self.async_client.get(url, {"format": "ndjson"})
+            return response, b"".join([chunk async for chunk in response.streaming_content]).decode()
+
+        response, content = async_to_sync(get_export)()
+
+        self.assertTrue(response.is_async)
+        self.assertEqual(content, self.get_export("messages", "ndjson")[1])
+
+    def test_invalid_export(self):
+        url = reverse("tasks:project-export", kwargs={"pk": self.project.pk, "kind": "workers"})
+
+        self.assertEqual(self.client.get(url).status_code, 400)
+
+    def test_outsider_is_forbidden(self):
+        get_user_model().objects.create_user(username="outsider", password="password123")
+        self.client.login(username="outsider", password="password123")
+        url = reverse("tasks:project-export", kwargs={"pk": self.project.pk, "kind": "tasks"})
+
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+    def test_export_command(self):
+        out = StringIO()
+        call_command("export_project", self.project.pk, "comments", format="ndjson", chunk_size=1, stdout=out)
+
+        self.assertEqual(json.loads(out.getvalue())["message"], "A comment")
+
+    def test_benchmark_export(self):
+        out = StringIO()
+        call_command("benchmark_export", rows=[10, 30], batch_size=7, stdout=out)
+        call_command("benchmark_export", rows=[10], interface="asgi", stdout=out)
+
+        self.assertEqual(len(out.getvalue().splitlines()), 5)
+        self.assertEqual(ChatMessage.objects.count(), 5)
@@ -0,0 +1,48 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from tasks.fragments import fragment_version
+from tasks.models import Project
+
+
+class FragmentCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(username="testuser", password="password123")
+        self.project = Project.objects.create(title="Old title", creator=self.user)
+        self.project.assignees.add(self.user)
+        self.client.login(username="testuser", password="password123")
+
+    def test_version_is_stable_until_save(self):
+        version = fragment_version(self.project)
+        self.assertEqual(fragment_version(self.project), version)
+
+        self.project.save()
+        self.assertNotEqual(fragment_version(self.project), version)
+
+    def test_missing_instance_has_no_version(self):
+        self.assertEqual(fragment_version(None), 0)
+        self.assertEqual(fragment_version(""), 0)
+
+    def test_sidebar_shows_renamed_project(self):
+        url = reverse("tasks:project-task-list", kwargs={"pk": self.project.pk})
+        self.assertContains(self.client.get(url), "Old title")
+
+        Project.objects.filter(pk=self.project.pk).update(title="Stale title")
+        response = self.client.get(url)
+        self.assertNotContains(response, "Stale title</span>")
+
+        self.project.title = "New title"
+        self.project.save()
+        response = self.client.get(url)
+        self.assertContains(response, '<span class="pcoded-mtext">New title</span>')
+
+    def test_sidebar_is_cached_per_user(self):
+        url = reverse("tasks:project-list")
+        self.assertContains(self.client.get(url), "Profile Page")
+
+        self.client.logout()
+        response = self.client.get(reverse("tasks:login"))
+        self.assertNotContains(response, "Profile Page")
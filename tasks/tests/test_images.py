@@ -0,0 +1,79 @@
+import shutil
+import tempfile
+from io import BytesIO, StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from PIL import Image
+
+from tasks.images import THUMBNAIL_SIZES, thumbnail_name
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def make_upload(name="photo.jpg", size=(1200, 900)):
+    exif = Image.Exif()
+    exif[0x010F] = "PhoneMaker"
+    buffer = BytesIO()
+    Image.new("RGB", size, "red").save(buffer, "JPEG", exif=exif)
+
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/jpeg")
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class ProfileImagePipelineTest(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+        super().tearDownClass()
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="testuser", password="password123")
+        self.client.login(username="testuser", password="password123")
+
+    def upload(self):
+        response = self.client.post(reverse("tasks:profile-edit"), {
+            "username": "testuser",
+            "first_name": "Test",
+            "last_name": "User",
+            "email": "test@example.com",
+            "profile_image": make_upload(),
+        })
+        self.assertEqual(response.status_code, 302)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.profile_image_hash, "")
+
+        call_command("run_worker", burst=True, stdout=StringIO())
+        self.user.refresh_from_db()
+
+    def test_upload_is_sanitized_and_thumbnailed(self):
+        self.upload()
+
+        with Image.open(self.user.profile_image.path) as original:
+            self.assertEqual(max(original.size), 1024)
+            self.assertEqual(len(original.getexif()), 0)
+
+        for size in THUMBNAIL_SIZES:
+            for extension in ("webp", "jpg"):
+                with Image.open(f"{MEDIA_ROOT}/{thumbnail_name(self.user.profile_image_hash, size, extension)}") as image:
+                    self.assertEqual(image.size, (size, size))
+                    self.assertEqual(len(image.getexif()), 0)
+
+    def test_thumbnails_are_served_as_immutable(self):
+        self.upload()
+
+        response = self.client.get(self.user.profile_thumbnail_url(64, "webp"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Cache-Control"], "public, max-age=31536000, immutable")
+
+    def test_navigation_uses_thumbnails(self):
+        self.upload()
+
+        response = self.client.get(reverse("tasks:profile-detail"))
+
+        self.assertContains(response, self.user.profile_thumbnail_url(64, "webp"))
+        self.assertContains(response, self.user.profile_thumbnail_url(256, "jpg"))
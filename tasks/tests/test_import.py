@@ -0,0 +1,95 @@
+import csv
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from tasks.models import Project, SearchDocument, Task, TaskType
+
+CSV = (
+    "name,description,deadline,priority,status,task_type\n"
+    "Write docs,,2030-01-31,High,To do,bug\n"
+    "Ship it,\"Multi\nline\",,Low,Done,Feature\n"
+    ",Missing name,,Low,Done,Bug\n"
+    "Bad date,,31/01/2030,Urgent,To do,Chore\n"
+)
+
+
+class TaskImportTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="testuser", password="password123")
+        self.client.login(username="testuser", password="password123")
+        self.project = Project.objects.create(title="Test Project", creator=self.user)
+        TaskType.objects.create(name="Bug")
+        TaskType.objects.create(name="Feature")
+        self.url = reverse("tasks:task-import", kwargs={"pk": self.project.pk})
+
+    def test_import_command_writes_error_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tasks.csv")
+            with open(path, "w", newline="") as file:
+                file.write(CSV)
+
+            out = StringIO()
+            call_command("import_tasks", self.project.pk, path, batch_size=1, stdout=out)
+
+            with open(f"{path}.errors.csv", newline="") as file:
+                errors = list(csv.DictReader(file))
+
+        self.assertIn("Imported 2 tasks", out.getvalue())
+        self.assertEqual(
+            list(Task.objects.order_by("pk").values_list("name", "description", "priority", "task_type__name")),
+            [("Write docs", "", "High", "Bug"), ("Ship it", "Multi\nline", "Low", "Feature")]
+        )
+        self.assertEqual(SearchDocument.objects.filter(kind=SearchDocument.TASK).count(), 2)
+        self.assertEqual([error["line"] for error in errors], ["5", "6"])
+        self.assertIn("name: Please enter a name.", errors[0]["errors"])
+        self.assertIn("priority:", errors[1]["errors"])
+        self.assertIn("deadline:", errors[1]["errors"])
+        self.assertIn("task_type:", errors[1]["errors"])
+
+    def test_import_ndjson_view(self):
+        lines = [
+            {"name": "One", "priority": "Medium", "status": "Doing", "task_type": "Chore"},
+            "not json",
+            {"name": "x" * 64, "priority": "Medium", "status": "Doing", "task_type": "Bug"},
+        ]
+        content = "\n".join(json.dumps(line) if isinstance(line, dict) else line for line in lines).encode()
+
+        # session, user, project, task type map, new task type, then a savepoint with the project lock and three inserts
+        with self.assertNumQueries(11):
+            response = self.client.post(
+                self.url,
+                {
+                    "file": SimpleUploadedFile("tasks.ndjson", content),
+                    "format": "ndjson",
+                    "create_task_types": "on",
+                },
+                HTTP_ACCEPT="application/json",
+            )
+
+        result = response.json()
+        self.assertEqual((result["created"], result["failed"]), (1, 2))
+        self.assertEqual([error["line"] for error in result["errors"]], [2, 3])
+        self.assertEqual(Task.objects.get().task_type.name, "Chore")
+
+    def test_exported_tasks_can_be_imported(self):
+        Task.objects.create(
+            name="Exported", description="Text", project=self.project, creator=self.user,
+            task_type=TaskType.objects.get(name="Bug")
+        )
+        export = self.client.get(reverse("tasks:project-export", kwargs={"pk": self.project.pk, "kind": "tasks"}))
+
+        response = self.client.post(self.url, {
+            "file": SimpleUploadedFile("tasks.csv", b"".join(export.streaming_content)),
+            "format": "csv",
+        })
+
+        self.assertContains(response, "Imported 1 tasks, 0 rows failed.")
+        self.assertEqual(Task.objects.filter(name="Exported").count(), 2)
@@ -0,0 +1,130 @@
+import threading
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from tasks import jobs
+from tasks.models import Job, Project, Task, TaskType
+
+CALLS = []
+
+
+@jobs.register
+def record_call(value, fail_times=0):
+    CALLS.append(value)
+    if CALLS.count(value) <= fail_times:
+        raise RuntimeError("Temporary failure")
+
+
+class JobQueueTest(TestCase):
+    def setUp(self):
+        CALLS.clear()
+
+    def run_worker(self):
+        out = StringIO()
+        call_command("run_worker", burst=True, stdout=out)
+
+        return out.getvalue()
+
+    def test_jobs_run_in_order_with_timing(self):
+        jobs.enqueue("record_call", {"value": "first"})
+        jobs.enqueue("record_call", {"value": "later"}, delay=timedelta(hours=1))
+        jobs.enqueue("record_call", {"value": "second"})
+
+        out = self.run_worker()
+
+        self.assertEqual(CALLS, ["first", "second"])
+        self.assertIn("Finished 2 jobs, 0 to retry, 0 failed.", out)
+        job = Job.objects.filter(status=Job.DONE).first()
+        self.assertEqual(job.attempts, 1)
+        self.assertIsNotNone(job.duration)
+        self.assertTrue(job.locked_by)
+        self.assertEqual(Job.objects.filter(status=Job.QUEUED).count(), 1)
+
+    def test_failed_jobs_are_retried_with_backoff(self):
+        job = jobs.enqueue("record_call", {"value": "flaky", "fail_times": 1}, max_attempts=2)
+
+        self.run_worker()
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.QUEUED, 1))
+        self.assertIn("Temporary failure", job.last_error)
+        self.assertGreater(job.run_at, timezone.now() + jobs.backoff(1) - timedelta(seconds=5))
+
+        Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+        self.run_worker()
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts, job.last_error), (Job.DONE, 2, ""))
+
+    def test_jobs_fail_after_max_attempts(self):
+        job = jobs.enqueue("record_call", {"value": "broken", "fail_times": 5}, max_attempts=1)
+
+        self.assertIn("0 to retry, 1 failed", self.run_worker())
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FAILED)
+
+    def test_stale_jobs_are_requeued(self):
+        job = jobs.enqueue("record_call", {"value": "stale"})
+        Job.objects.filter(pk=job.pk).update(
+            status=Job.RUNNING, attempts=1, started=timezone.now() - jobs.STALE_AFTER * 2,
+            heartbeat=timezone.now() - jobs.STALE_AFTER * 2
+        )
+
+        self.run_worker()
+
+        self.assertEqual(CALLS, ["stale"])
+        self.assertEqual(Job.objects.get(pk=job.pk).attempts, 2)
+
+    def test_long_jobs_with_a_heartbeat_are_not_requeued(self):
+        jobs.enqueue("record_call", {"value": "long"})
+        job = jobs.claim("first")
+        Job.objects.filter(pk=job.pk).update(started=timezone.now() - jobs.STALE_AFTER * 2)
+
+        self.assertEqual(jobs.requeue_stale(), (0, 0))
+        self.assertEqual(Job.objects.get(pk=job.pk).status, Job.RUNNING)
+
+    def test_requeued_run_does_not_overwrite_the_next_run(self):
+        jobs.enqueue("record_call", {"value": "raced"})
+        job = jobs.claim("first")
+        Job.objects.filter(pk=job.pk).update(heartbeat=timezone.now() - jobs.STALE_AFTER * 2)
+        self.assertEqual(jobs.requeue_stale(), (1, 0))
+        jobs.claim("second")
+
+        jobs.execute(job)
+
+        self.assertEqual(CALLS, ["raced"])
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts, job.locked_by, job.finished), (Job.RUNNING, 2, "second", None))
+
+    def test_running_jobs_refresh_their_heartbeat(self):
+        jobs.enqueue("record_call", {"value": "beat"})
+        job = jobs.claim("first")
+        Job.objects.filter(pk=job.pk).update(heartbeat=timezone.now() - jobs.STALE_AFTER * 2)
+        stop = threading.Event()
+        stop.set()
+        with mock.patch.object(stop, "wait", side_effect=[False, True]):
+            jobs.keep_alive(job, stop, jobs.HEARTBEAT_INTERVAL)
+
+        self.assertEqual(jobs.requeue_stale(), (0, 0))
+
+    def test_unknown_job(self):
+        with self.assertRaises(ValueError):
+            jobs.enqueue("missing")
+
+    def test_delete_tasks_can_be_queued(self):
+        user = get_user_model().objects.create_user(username="testuser", password="password123")
+        Task.objects.create(
+            name="Overdue", description="", deadline=timezone.now().date() - timedelta(days=2),
+            project=Project.objects.create(title="Test Project", creator=user), creator=user,
+            task_type=TaskType.objects.create(name="Bug")
+        )
+
+        call_command("delete_tasks", enqueue=True, stdout=StringIO())
+        self.assertTrue(Task.objects.exists())
+
+        self.run_worker()
+        self.assertFalse(Task.objects.exists())
@@ -0,0 +1,77 @@
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.http import HttpResponse
+from django.test import AsyncRequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from tasks.metrics import QueryCollector, RequestMetricsMiddleware, registry
+from tasks.models import Project, Task
+
+
+class RequestMetricsTest(TestCase):
+    def setUp(self):
+        registry.reset()
+        self.user = get_user_model().objects.create_user(username="testuser", password="password123")
+        self.project = Project.objects.create(title="Test Project", creator=self.user)
+        self.project.assignees.add(self.user)
+        self.client.login(username="testuser", password="password123")
+
+    def test_server_timing_header(self):
+        response = self.client.get(reverse("tasks:project-task-list", kwargs={"pk": self.project.pk}))
+
+        self.assertRegex(
+            response["Server-Timing"],
+            r'^app;dur=[\d.]+, db;dur=[\d.]+;desc="\d+ queries, \d+ duplicates", tpl;dur=[\d.]+$'
+        )
+
+    def test_async_queries_are_counted(self):
+        async def view(request):
+            await Task.objects.acount()
+            await Project.objects.filter(pk=self.project.pk).aexists()
+            return HttpResponse()
+
+        middleware = RequestMetricsMiddleware(view)
+        response = async_to_sync(middleware)(AsyncRequestFactory().get("/"))
+
+        self.assertIn("desc=\"2 queries, 0 duplicates\"", response["Server-Timing"])
+
+    def test_samples_are_grouped_by_url_name(self):
+        url = reverse("tasks:project-chat", kwargs={"pk": self.project.pk})
+        self.client.get(url)
+        self.client.get(url)
+
+        summary = registry.snapshot()["tasks:project-chat"]
+        self.assertEqual(summary["count"], 2)
+        self.assertGreater(summary["mean_queries"], 0)
+        self.assertGreater(summary["mean_template_ms"], 0)
+        self.assertEqual(sum(summary["histogram"].values()), 2)
+
+    @override_settings(TASKS_METRICS_SAMPLE_RATE=0)
+    def test_unsampled_requests_are_not_recorded(self):
+        response = self.client.get(reverse("tasks:project-list"))
+
+        self.assertNotIn("Server-Timing", response)
+        self.assertEqual(registry.snapshot(), {})
+
+    def test_duplicate_queries_are_counted(self):
+        Task.objects.create(name="Task", project=self.project, creator=self.user)
+        collector = QueryCollector()
+
+        with connection.execute_wrapper(collector):
+            for _ in range(3):
+                list(Task.objects.filter(project=self.project))
+            list(Project.objects.all())
+
+        self.assertEqual(collector.count, 4)
+        self.assertEqual(collector.duplicates, 2)
+
+    def test_metrics_view_is_staff_only(self):
+        url = reverse("tasks:request-metrics")
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("tasks:request-metrics", response.json()["views"])
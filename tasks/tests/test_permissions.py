@@ -0,0 +1,91 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, RequestFactory
+from django.urls import reverse
+
+from tasks.models import Project, Task
+from tasks.permissions import accessible_projects, get_project_access
+
+
+class ProjectAccessTest(TestCase):
+    def setUp(self):
+        self.creator = get_user_model().objects.create_user(username="creator", password="password123")
+        self.member = get_user_model().objects.create_user(username="member", password="password123")
+        self.outsider = get_user_model().objects.create_user(username="outsider", password="password123")
+        self.project = Project.objects.create(title="Test Project", creator=self.creator)
+        self.project.assignees.add(self.member)
+
+    def test_accessible_projects(self):
+        self.assertQuerySetEqual(accessible_projects(self.creator), [self.project])
+        self.assertQuerySetEqual(accessible_projects(self.member), [self.project])
+        self.assertQuerySetEqual(accessible_projects(self.outsider), [])
+
+    def test_access_is_memoized_per_request(self):
+        request = RequestFactory().get("/")
+        request.user = self.member
+
+        with self.assertNumQueries(1):
+            self.assertTrue(get_project_access(request).can_access(self.project.pk))
+            self.assertTrue(get_project_access(request).can_access(self.project.pk))
+
+    def test_get_project_records_access(self):
+        request = RequestFactory().get("/")
+        request.user = self.outsider
+        access = get_project_access(request)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(access.get_project(self.project.pk), self.project)
+            self.assertFalse(access.can_access(self.project.pk))
+
+    def test_outsider_is_forbidden(self):
+        self.client.login(username="outsider", password="password123")
+        for name in ("tasks:project-detail", "tasks:project-task-list", "tasks:project-chat"):
+            response = self.client.get(reverse(name, kwargs={"pk": self.project.pk}))
+            self.assertEqual(response.status_code, 403)
+
+    def test_member_is_allowed(self):
+        self.client.login(username="member", password="password123")
+        for name in ("tasks:project-detail", "tasks:project-task-list", "tasks:project-chat"):
+            response = self.client.get(reverse(name, kwargs={"pk": self.project.pk}))
+            self.assertEqual(response.status_code, 200)
+
+    def test_anonymous_is_redirected_to_login(self):
+        response = self.client.get(reverse("tasks:project-detail", kwargs={"pk": self.project.pk}))
+        self.assertEqual(response.status_code, 302)
+
+
+class TaskAccessTest(TestCase):
+    def setUp(self):
+        self.creator = get_user_model().objects.create_user(username="creator", password="password123")
+        self.member = get_user_model().objects.create_user(username="member", password="password123")
+        self.project = Project.objects.create(title="Test Project", creator=self.creator)
+        self.project.assignees.add(self.creator, self.member)
+        self.other_project = Project.objects.create(title="Other Project", creator=self.creator)
+        self.task = Task.objects.create(name="Test Task", project=self.project, creator=self.creator)
+
+    def test_task_is_loaded_with_project_in_one_query(self):
+        request = RequestFactory().get("/")
+        request.user = self.member
+        access = get_project_access(request)
+
+        with self.assertNumQueries(1):
+            task = access.get_task(self.project.pk, self.task.pk)
+            self.assertIs(access.get_task(self.project.pk, self.task.pk), task)
+            self.assertIs(access.get_project(self.project.pk), task.project)
+            self.assertTrue(access.can_access(self.project.pk))
+            self.assertEqual(task.project.creator, self.creator)
+
+    def test_task_must_belong_to_project(self):
+        self.client.login(username="creator", password="password123")
+        response = self.client.get(
+            reverse("tasks:task-detail", kwargs={"pk": self.other_project.pk, "task_pk": self.task.pk})
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_only_creator_can_change_task(self):
+        self.client.login(username="member", password="password123")
+        kwargs = {"pk": self.project.pk, "task_pk": self.task.pk}
+
+        self.assertEqual(self.client.get(reverse("tasks:task-detail", kwargs=kwargs)).status_code, 200)
+        self.assertEqual(self.client.get(reverse("tasks:task-update", kwargs=kwargs)).status_code, 403)
+        self.assertEqual(self.client.post(reverse("tasks:task-delete", kwargs=kwargs)).status_code, 403)
+        self.assertTrue(Task.objects.filter(pk=self.task.pk).exists())
@@ -0,0 +1,107 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from tasks.models import ChatMessage, Position, Project, Task, TaskComment, TaskType
+
+
+class QueryCountMixin:
+    rows = 10
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(username="testuser", password="password123")
+        position = Position.objects.create(name="Developer")
+        task_type = TaskType.objects.create(name="Bug")
+        workers = get_user_model().objects.bulk_create(
+            get_user_model()(username=f"worker{i}", password="!", position=position)
+            for i in range(cls.rows)
+        )
+
+        cls.project = Project.objects.create(title="Project", creator=cls.user)
+        cls.project.assignees.add(cls.user, *workers)
+        Project.assignees.through.objects.bulk_create(
+            Project.assignees.through(project=project, worker=cls.user)
+            for project in Project.objects.bulk_create(
+                Project(title=f"Project {i}", description="", creator=workers[i])
+                for i in range(cls.rows)
+            )
+        )
+
+        Task.objects.bulk_create(
+            Task(
+                name=f"Task {i}",
+                description="",
+                project=cls.project,
+                creator=cls.user if i % 2 else workers[i],
+                task_type=task_type
+            )
+            for i in range(cls.rows)
+        )
+        cls.task = Task.objects.filter(project=cls.project).first()
+        TaskComment.objects.bulk_create(
+            TaskComment(message=f"Comment {i}", sender=workers[i], task=cls.task)
+            for i in range(cls.rows)
+        )
+        ChatMessage.objects.bulk_create(
+            ChatMessage(message=f"Message {i}", sender=workers[i], project=cls.project)
+            for i in range(cls.rows)
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def assertQueriesOnGet(self, num, url):
+        with self.assertNumQueries(num):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+    def test_index(self):
+        cache.clear()
+        self.assertQueriesOnGet(4, reverse("tasks:index"))
+        self.assertQueriesOnGet(2, reverse("tasks:index"))
+
+    def test_project_list(self):
+        self.assertQueriesOnGet(4, reverse("tasks:project-list"))
+
+    def test_project_detail(self):
+        self.assertQueriesOnGet(4, reverse("tasks:project-detail", kwargs={"pk": self.project.pk}))
+
+    def test_project_task_list(self):
+        cache.clear()
+        # The first request also computes the project version for conditional GETs.
+        self.assertQueriesOnGet(9, reverse("tasks:project-task-list", kwargs={"pk": self.project.pk}))
+        self.assertQueriesOnGet(5, reverse("tasks:project-task-list", kwargs={"pk": self.project.pk}))
+
+    def test_project_board(self):
+        self.assertQueriesOnGet(5, reverse("tasks:project-board", kwargs={"pk": self.project.pk}))
+
+    def test_task_list(self):
+        cache.clear()
+        self.assertQueriesOnGet(8, reverse("tasks:task-list", kwargs={"pk": self.project.pk}))
+        self.assertQueriesOnGet(4, reverse("tasks:task-list", kwargs={"pk": self.project.pk}))
+
+    def test_task_detail(self):
+        cache.clear()
+        url = reverse("tasks:task-detail", kwargs={"pk": self.project.pk, "task_pk": self.task.pk})
+        self.assertQueriesOnGet(8, url)
+        self.assertQueriesOnGet(4, url)
+
+    def test_project_chat(self):
+        self.assertQueriesOnGet(4, reverse("tasks:project-chat", kwargs={"pk": self.project.pk}))
+
+    def test_profile_detail(self):
+        self.assertQueriesOnGet(2, reverse("tasks:profile-detail"))
+
+
+class TenRowsQueryCountTest(QueryCountMixin, TestCase):
+    rows = 10
+
+
+class HundredRowsQueryCountTest(QueryCountMixin, TestCase):
+    rows = 100
+
+
+class ThousandRowsQueryCountTest(QueryCountMixin, TestCase):
+    rows = 1000
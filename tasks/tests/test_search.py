@@ -0,0 +1,98 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from tasks.models import ChatMessage, Project, SearchDocument, Task, TaskComment
+from tasks.search import search
+from tasks.search.indexing import index_new_instances
+
+
+class SearchTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="testuser", password="password123")
+        self.client.login(username="testuser", password="password123")
+        self.project = Project.objects.create(title="Website redesign", description="New landing pages", creator=self.user)
+        self.task = Task.objects.create(
+            name="Update footer",
+            description="Footer links point to the archived blog",
+            project=self.project,
+            creator=self.user
+        )
+        self.comment = TaskComment.objects.create(task=self.task, sender=self.user, message="Blog migration is done")
+        self.message = ChatMessage.objects.create(project=self.project, sender=self.user, message="Standup moved")
+
+    def kinds_for(self, query, user=None):
+        return sorted(search(user or self.user, query).values_list("kind", flat=True))
+
+    def test_documents_are_indexed_on_save(self):
+        self.assertEqual(self.kinds_for("blog"), ["comment", "task"])
+        self.assertEqual(self.kinds_for("landing"), ["project"])
+        self.assertEqual(self.kinds_for("standup"), ["message"])
+
+    def test_prefix_and_stemmed_matches(self):
+        self.assertEqual(self.kinds_for("redesig"), ["project"])
+        self.assertEqual(self.kinds_for("links"), ["task"])
+
+    def test_updates_and_deletes_are_reflected(self):
+        self.task.description = "Nothing to see"
+        self.task.save()
+        self.assertEqual(self.kinds_for("archived"), [])
+
+        self.task.delete()
+        self.assertEqual(self.kinds_for("blog"), [])
+        self.assertEqual(SearchDocument.objects.filter(kind=SearchDocument.COMMENT).count(), 0)
+
+    def test_renaming_a_task_updates_its_comment_documents(self):
+        self.task.name = "Replace navigation"
+        self.task.save()
+
+        self.assertEqual(self.kinds_for("navigation"), ["comment", "task"])
+        self.assertEqual(self.kinds_for("footer"), ["task"])
+
+    def test_results_are_limited_to_accessible_projects(self):
+        outsider = get_user_model().objects.create_user(username="outsider", password="password123")
+        self.assertEqual(self.kinds_for("blog", outsider), [])
+
+    def test_project_task_list_search(self):
+        Task.objects.create(name="Update header", description="", project=self.project, creator=self.user)
+        response = self.client.get(
+            reverse("tasks:project-task-list", kwargs={"pk": self.project.pk}),
+            {"title": "archived"}
+        )
+
+        self.assertEqual(list(response.context["project_tasks"]), [self.task])
+
+    def test_project_task_list_search_is_ranked_and_not_capped(self):
+        best = Task.objects.create(name="Footer footer", description="footer", project=self.project, creator=self.user)
+        tasks = Task.objects.bulk_create(
+            Task(name=f"Footer {i}", description="", project=self.project, creator=self.user) for i in range(1005)
+        )
+        index_new_instances(tasks)
+
+        response = self.client.get(
+            reverse("tasks:project-task-list", kwargs={"pk": self.project.pk}), {"title": "footer"}
+        )
+
+        self.assertEqual(response.context["paginator"].count, 1007)
+        self.assertEqual(response.context["project_tasks"][0], best)
+
+    def test_project_list_search(self):
+        Project.objects.create(title="Mobile app", description="", creator=self.user)
+        response = self.client.get(reverse("tasks:project-list"), {"title": "website"})
+
+        self.assertEqual(list(response.context["project_list"]), [self.project])
+
+    def test_search_view(self):
+        response = self.client.get(reverse("tasks:search"), {"title": "blog"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["results"]), 2)
+
+    def test_rebuild_search_index(self):
+        SearchDocument.objects.all().delete()
+        call_command("rebuild_search_index", stdout=StringIO())
+
+        self.assertEqual(self.kinds_for("blog"), ["comment", "task"])
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path
 
 from tasks.views import (
@@ -10,6 +11,16 @@ from tasks.views import (
     ProjectDeleteView,
     TaskCreateView,
     ProjectTaskListView,
+    ProjectBoardView,
+    ProjectBoardDataView,
+    TaskStatusView,
+    ProjectDependencyView,
+    ProjectChangesView,
+    TaskDependencyView,
+    TaskDependencyDeleteView,
+    TaskBulkUpdateView,
+    TaskBulkDeleteView,
+    TaskImportView,
     ProfileDetailView,
     ProfileUpdateView,
     TaskListView,
@@ -18,11 +29,32 @@ from tasks.views import (
     JoinProjectView,
     GenerateCodeView,
     ChatMessagesView,
+    ChatHistoryView,
+    ProjectExportView,
     LogoutView,
     TaskUpdateView,
     TaskDeleteView,
-    IndexView
+    IndexView,
+    SearchView,
+    RequestMetricsView
 )
+from tasks.api import (
+    ApiProjectListView,
+    ApiProjectDetailView,
+    ApiTaskListView,
+    ApiTaskDetailView,
+    ApiCommentListView,
+    ApiMessageListView
+)
+
+if settings.TASKS_ASYNC_VIEWS:
+    from tasks.async_views import (  # noqa: F811
+        AsyncIndexView as IndexView,
+        AsyncProjectListView as ProjectListView,
+        AsyncProjectTaskListView as ProjectTaskListView,
+        AsyncChatMessagesView as ChatMessagesView,
+        AsyncTaskDetailView as TaskDetailView,
+    )
 
 urlpatterns = [
     path("", IndexView.as_view(), name="index"),
@@ -41,6 +73,12 @@ urlpatterns = [
     path("projects/<int:pk>/project_tasks/",
          ProjectTaskListView.as_view(),
          name="project-task-list"),
+    path("projects/<int:pk>/board/",
+         ProjectBoardView.as_view(),
+         name="project-board"),
+    path("projects/<int:pk>/board/data/",
+         ProjectBoardDataView.as_view(),
+         name="project-board-data"),
     path("projects/<int:pk>/tasks/",
          TaskListView.as_view(),
          name="task-list"),
@@ -56,6 +94,30 @@ urlpatterns = [
     path("projects/<int:pk>/tasks/<int:task_pk>/delete/",
          TaskDeleteView.as_view(),
          name="task-delete"),
+    path("projects/<int:pk>/tasks/import/",
+         TaskImportView.as_view(),
+         name="task-import"),
+    path("projects/<int:pk>/tasks/bulk/update/",
+         TaskBulkUpdateView.as_view(),
+         name="task-bulk-update"),
+    path("projects/<int:pk>/tasks/bulk/delete/",
+         TaskBulkDeleteView.as_view(),
+         name="task-bulk-delete"),
+    path("projects/<int:pk>/tasks/<int:task_pk>/status/",
+         TaskStatusView.as_view(),
+         name="task-status"),
+    path("projects/<int:pk>/dependencies/",
+         ProjectDependencyView.as_view(),
+         name="project-dependencies"),
+    path("projects/<int:pk>/changes/",
+         ProjectChangesView.as_view(),
+         name="project-changes"),
+    path("projects/<int:pk>/tasks/<int:task_pk>/dependencies/",
+         TaskDependencyView.as_view(),
+         name="task-dependency-add"),
+    path("projects/<int:pk>/tasks/<int:task_pk>/dependencies/<int:depends_on_pk>/delete/",
+         TaskDependencyDeleteView.as_view(),
+         name="task-dependency-delete"),
     path("projects/create/",
          ProjectCreateView.as_view(),
          name="project-create"
@@ -76,6 +138,36 @@ urlpatterns = [
     path("projects/<int:pk>/chat/",
          ChatMessagesView.as_view(),
          name="project-chat"),
+    path("projects/<int:pk>/chat/messages/",
+         ChatHistoryView.as_view(),
+         name="project-chat-messages"),
+    path("projects/<int:pk>/export/<slug:kind>/",
+         ProjectExportView.as_view(),
+         name="project-export"),
+    path("api/projects/",
+         ApiProjectListView.as_view(),
+         name="api-project-list"),
+    path("api/projects/<int:pk>/",
+         ApiProjectDetailView.as_view(),
+         name="api-project-detail"),
+    path("api/projects/<int:pk>/tasks/",
+         ApiTaskListView.as_view(),
+         name="api-task-list"),
+    path("api/projects/<int:pk>/tasks/<int:task_pk>/",
+         ApiTaskDetailView.as_view(),
+         name="api-task-detail"),
+    path("api/projects/<int:pk>/tasks/<int:task_pk>/comments/",
+         ApiCommentListView.as_view(),
+         name="api-comment-list"),
+    path("api/projects/<int:pk>/messages/",
+         ApiMessageListView.as_view(),
+         name="api-message-list"),
+    path("search/",
+         SearchView.as_view(),
+         name="search"),
+    path("metrics/",
+         RequestMetricsView.as_view(),
+         name="request-metrics"),
     path("profile/",
          ProfileDetailView.as_view(),
          name="profile-detail"
@@ -1,16 +1,24 @@
+import csv
+import io
 import uuid
 
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import logout
 from django.contrib.auth.decorators import login_required
-from django.contrib.auth.mixins import LoginRequiredMixin
+from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.contrib.auth.views import LoginView, PasswordChangeView
-from django.db.models import Q
+from django.core.exceptions import ValidationError
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.db.models import Count
 
 from django.shortcuts import render, redirect, get_object_or_404
 from django.urls import reverse_lazy
+from django.utils import timezone
 from django.views import generic, View
-from django.http import HttpResponseForbidden
+from django.views.static import serve
+from django.http import HttpResponseForbidden, JsonResponse, StreamingHttpResponse
 
 from tasks.forms import (
     RegistrationForm,
@@ -23,15 +31,36 @@ from tasks.forms import (
     TaskForm,
     CommentForm,
     ProjectTaskSearchForm,
-    ProfileForm
+    ProfileForm,
+    TaskBulkForm,
+    TaskBulkUpdateForm,
+    TaskDependencyForm,
+    TaskImportForm
 )
 from tasks.models import (
     Task,
     Project,
     ChatMessage,
     TaskComment,
-    Worker
+    Worker,
+    SearchDocument,
+    ChangeLogEntry
 )
+from tasks.board import COLUMNS, column_page, get_board
+from tasks.bulk import bulk_delete_tasks, bulk_update_tasks
+from tasks.changelog import CursorExpired, head_cursor, read_changes, record_changes
+from tasks.conditional import ConditionalProjectMixin, invalidate_project_version
+from tasks.counters import get_dashboard_counts
+from tasks.dependencies import add_dependency, dependency_report, remove_dependency
+from tasks.export import EXPORTS, FORMATS, astream_export, stream_export
+from tasks.images import THUMBNAIL_DIR, sanitize_upload
+from tasks.importer import TaskImporter, read_rows
+from tasks.jobs import enqueue
+from tasks.metrics import registry
+from tasks.pagination import keyset_page
+from tasks.permissions import ProjectMemberRequiredMixin, TaskAccessMixin, accessible_projects
+from tasks.search import filter_by_rank, search
+from tasks.serializers import board_column_payload, chat_message_payload, dependency_report_payload
 
 
 class IndexView(generic.View):
@@ -39,18 +68,7 @@ class IndexView(generic.View):
 
     def get(self, request, *args, **kwargs):
         if request.user.is_authenticated:
-            user_projects = Project.objects.filter(
-                Q(creator=request.user) | Q(assignees=request.user)
-            ).distinct()
-
-            project_ids = set(user_projects.values_list('id', flat=True))
-            num_projects = len(project_ids)
-            num_tasks = Task.objects.filter(creator=request.user).count()
-
-            context = {
-                "num_projects": num_projects,
-                "num_tasks": num_tasks
-            }
+            context = get_dashboard_counts(request.user)
 
             return render(request, self.template_name, context)
 
@@ -82,105 +100,208 @@ class UserPasswordChangeView(PasswordChangeView):
     template_name = "accounts/change_password.html"
 
 
-class TaskListView(LoginRequiredMixin, generic.ListView):
+class TaskListView(ProjectMemberRequiredMixin, ConditionalProjectMixin, generic.ListView):
     model = Task
     template_name = "tasks/task_list.html"
     context_object_name = "task_list"
 
     def get_queryset(self):
-        project = get_object_or_404(Project, id=self.kwargs["pk"])
-        queryset = super().get_queryset().filter(project=project, creator=self.request.user)
+        queryset = super().get_queryset().filter(project=self.project, creator=self.request.user)
 
         return queryset
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        project = get_object_or_404(Project, id=self.kwargs["pk"])
-        context["project"] = project
+        context["project"] = self.project
         context["show_tabs"] = True
 
         return context
 
 
-class ProjectTaskListView(LoginRequiredMixin, generic.ListView):
+class ProjectTaskListView(ProjectMemberRequiredMixin, ConditionalProjectMixin, generic.ListView):
     model = Task
     template_name = "tasks/project_task_list.html"
     context_object_name = "project_tasks"
     paginate_by = 10
 
     def get_queryset(self):
-        project = get_object_or_404(Project, id=self.kwargs["pk"])
-        queryset = super().get_queryset().filter(project=project)
+        queryset = (
+            super().get_queryset()
+            .filter(project=self.project)
+            .select_related("creator__position")
+            .order_by("id")
+        )
         search_query = self.request.GET.get("title", None)
         if search_query:
-            queryset = queryset.filter(name__icontains=search_query)
+            queryset = filter_by_rank(queryset, self.request.user, search_query, SearchDocument.TASK, self.project)
 
         return queryset
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        project = get_object_or_404(Project, id=self.kwargs["pk"])
-        context["project"] = project
+        context["project"] = self.project
         context["search_form"] = ProjectTaskSearchForm()
         context["show_tabs"] = True
         context["show_search"] = True
 
         return context
 
-    def dispatch(self, request, *args, **kwargs):
-        project = get_object_or_404(Project, id=self.kwargs["pk"])
-        if request.user in project.assignees.all() or request.user == project.creator:
-            return super().dispatch(request, *args, **kwargs)
-
-        return HttpResponseForbidden("You do not have permission to view this page.")
 
+class ProjectBoardView(ProjectMemberRequiredMixin, generic.View):
+    paginate_by = 20
 
-class TaskDetailView(LoginRequiredMixin, generic.View):
-    @staticmethod
-    def get(request, pk, task_pk):
-        project = get_object_or_404(Project, pk=pk)
-        task = get_object_or_404(Task, id=task_pk)
-        comments = TaskComment.objects.filter(task=task)
-        if request.user not in project.assignees.all():
-            return HttpResponseForbidden("You do not have permission to this page.")
-        form = CommentForm()
+    def get(self, request, pk):
         context = {
+            "project": self.project,
+            "columns": get_board(self.project, self.paginate_by),
+            "show_tabs": True
+        }
+
+        return render(request, "tasks/project_board.html", context)
+
+
+class ProjectBoardDataView(ProjectMemberRequiredMixin, generic.View):
+    paginate_by = 20
+    max_paginate_by = 100
+
+    def get(self, request, pk):
+        status = request.GET.get("status")
+
+        try:
+            limit = max(min(int(request.GET.get("limit", self.paginate_by)), self.max_paginate_by), 1)
+            if status is None:
+                columns = get_board(self.project, limit)
+            elif status in COLUMNS:
+                page = column_page(self.project, status, limit, before=request.GET.get("before") or None)
+                columns = [{"status": status, "tasks": page}]
+            else:
+                raise ValueError(status)
+        except ValueError:
+            return JsonResponse({"error": "Invalid status, cursor or limit."}, status=400)
+
+        return JsonResponse({"columns": [board_column_payload(column) for column in columns]})
+
+
+class TaskStatusView(TaskAccessMixin, generic.View):
+    creator_required = True
+
+    def post(self, request, pk, task_pk):
+        status = request.POST.get("status")
+        expected = request.POST.get("from", self.task.status)
+        if status not in COLUMNS:
+            return JsonResponse({"error": "Invalid status."}, status=400)
+
+        # Only move the task if nobody else has moved it since the board was loaded.
+        modified = timezone.now()
+        with transaction.atomic():
+            if not Task.objects.filter(pk=self.task.pk, status=expected).update(status=status, modified=modified):
+                current = Task.objects.filter(pk=self.task.pk).values_list("status", flat=True).first()
+                return JsonResponse(
+                    {"error": "The task has been moved by someone else.", "status": current}, status=409
+                )
+            record_changes(self.project.pk, ChangeLogEntry.TASK, [self.task.pk])
+        invalidate_project_version([self.project.pk])
+
+        return JsonResponse({"id": self.task.pk, "status": status, "modified": modified.isoformat()})
+
+
+class ProjectDependencyView(ProjectMemberRequiredMixin, generic.View):
+    def get(self, request, pk):
+        return JsonResponse(dependency_report_payload(dependency_report(self.project)))
+
+
+class ProjectChangesView(ProjectMemberRequiredMixin, generic.View):
+    """
+    Changes to a project since ``since``, the ``cursor`` of the previous
+    response. Without it only the current cursor is returned, to be taken
+    right before downloading the project.
+    """
+
+    paginate_by = 500
+    max_paginate_by = 1000
+
+    def get(self, request, pk):
+        since = request.GET.get("since")
+        if not since:
+            return JsonResponse({"changes": [], "cursor": head_cursor(self.project.pk), "has_more": False})
+
+        try:
+            limit = max(min(int(request.GET.get("limit", self.paginate_by)), self.max_paginate_by), 1)
+            changes, cursor, has_more = read_changes(self.project.pk, since, limit)
+        except CursorExpired as error:
+            return JsonResponse({"error": str(error), "reset": True}, status=410)
+        except ValueError:
+            return JsonResponse({"error": "Invalid cursor or limit."}, status=400)
+
+        return JsonResponse({"changes": changes, "cursor": cursor, "has_more": has_more})
+
+
+class TaskDependencyView(TaskAccessMixin, generic.View):
+    creator_required = True
+
+    def post(self, request, pk, task_pk):
+        form = TaskDependencyForm(request.POST, task=self.task)
+        if not form.is_valid():
+            return JsonResponse({"errors": form.errors}, status=400)
+
+        try:
+            dependency = add_dependency(self.task, form.cleaned_data["depends_on"])
+        except ValidationError as error:
+            return JsonResponse({"errors": {"depends_on": error.messages}}, status=400)
+
+        return JsonResponse({"task": dependency.task_id, "depends_on": dependency.depends_on_id}, status=201)
+
+
+class TaskDependencyDeleteView(TaskAccessMixin, generic.View):
+    creator_required = True
+
+    def post(self, request, pk, task_pk, depends_on_pk):
+        if not remove_dependency(self.task, depends_on_pk):
+            return JsonResponse({"error": "The task does not depend on that task."}, status=404)
+
+        return JsonResponse({"task": self.task.pk, "depends_on": depends_on_pk})
+
+
+class TaskDetailView(TaskAccessMixin, ConditionalProjectMixin, generic.View):
+    paginate_by = 20
+
+    def get_comment_queryset(self):
+        return TaskComment.objects.filter(task=self.task).select_related("sender")
+
+    def get_context_data(self, form, comments=None):
+        if comments is None:
+            try:
+                comments = keyset_page(
+                    self.get_comment_queryset(), self.paginate_by, before=self.request.GET.get("before") or None
+                )
+            except ValueError:
+                comments = keyset_page(self.get_comment_queryset(), self.paginate_by)
+
+        return {
             "form": form,
-            "task": task,
-            "project": project,
+            "task": self.task,
+            "project": self.project,
             "show_tabs": True,
             "comments": comments
         }
 
-        return render(request, "tasks/task_detail.html", context)
+    def get(self, request, pk, task_pk):
+        return render(request, "tasks/task_detail.html", self.get_context_data(CommentForm()))
 
-    @staticmethod
-    def post(request, pk, task_pk):
-        project = get_object_or_404(Project, pk=pk)
-        task = get_object_or_404(Task, id=task_pk)
-        comments = TaskComment.objects.filter(task=task)
-        if request.user not in project.assignees.all():
-            return HttpResponseForbidden("You do not have permission to this page.")
+    def post(self, request, pk, task_pk):
         form = CommentForm(request.POST)
         if form.is_valid():
             comment = form.save(commit=False)
             comment.sender = request.user
-            comment.task = task
+            comment.task = self.task
             comment.save()
         else:
             form = CommentForm()
-        context = {
-            "form": form,
-            "task": task,
-            "project": project,
-            "show_tabs": True,
-            "comments": comments
-        }
 
-        return render(request, "tasks/task_detail.html", context)
+        return render(request, "tasks/task_detail.html", self.get_context_data(form))
 
 
-class TaskCreateView(LoginRequiredMixin, generic.CreateView):
+class TaskCreateView(ProjectMemberRequiredMixin, generic.CreateView):
     model = Task
     template_name = "tasks/task_form.html"
     form_class = TaskForm
@@ -194,35 +315,23 @@ class TaskCreateView(LoginRequiredMixin, generic.CreateView):
         return super().form_valid(form)
 
 
-class TaskUpdateView(LoginRequiredMixin, generic.View):
-    @staticmethod
-    def get(request, pk, task_pk):
-        project = get_object_or_404(Project, pk=pk)
-        task = get_object_or_404(Task, id=task_pk)
-
-        if request.user != task.creator:
-            return HttpResponseForbidden("You do not have permission to this page.")
+class TaskUpdateView(TaskAccessMixin, generic.View):
+    creator_required = True
 
-        form = TaskForm(instance=task)
+    def get(self, request, pk, task_pk):
+        form = TaskForm(instance=self.task)
 
         context = {
             "form": form,
-            "project": project,
-            "task": task,
+            "project": self.project,
+            "task": self.task,
             "show_tabs": True
         }
 
         return render(request, "tasks/task_form.html", context)
 
-    @staticmethod
-    def post(request, pk, task_pk):
-        project = get_object_or_404(Project, pk=pk)
-        task = get_object_or_404(Task, id=task_pk)
-
-        if request.user != task.creator:
-            return HttpResponseForbidden("You do not have permission to this page.")
-
-        form = TaskForm(request.POST, instance=task)
+    def post(self, request, pk, task_pk):
+        form = TaskForm(request.POST, instance=self.task)
 
         if form.is_valid():
             form.instance.creator_id = request.user.id
@@ -233,40 +342,100 @@ class TaskUpdateView(LoginRequiredMixin, generic.View):
 
         context = {
             "form": form,
-            "project": project,
-            "task": task,
+            "project": self.project,
+            "task": self.task,
             "show_tabs": True
         }
 
         return render(request, "tasks/task_form.html", context)
 
 
-class TaskDeleteView(LoginRequiredMixin, generic.View):
-    @staticmethod
-    def post(request, pk, task_pk):
-        task = get_object_or_404(Task, id=task_pk)
-
-        if request.user != task.creator:
-            return HttpResponseForbidden("You do not have permission to this page.")
+class TaskDeleteView(TaskAccessMixin, generic.View):
+    creator_required = True
 
-        task.delete()
+    def post(self, request, pk, task_pk):
+        self.task.delete()
 
         return redirect("tasks:task-list", pk=pk)
 
-    @staticmethod
-    def get(request, pk, task_pk):
-        project = get_object_or_404(Project, pk=pk)
-        task = get_object_or_404(Task, id=task_pk)
-
+    def get(self, request, pk, task_pk):
         context = {
-            "project": project,
-            "task": task,
+            "project": self.project,
+            "task": self.task,
             "show_tabs": True
         }
 
         return render(request, "tasks/task_confirm_delete.html", context)
 
 
+class TaskImportView(ProjectMemberRequiredMixin, generic.View):
+    max_reported_errors = 500
+
+    def get(self, request, pk):
+        return render(request, "tasks/task_import.html", {"form": TaskImportForm(), "project": self.project})
+
+    def post(self, request, pk):
+        wants_json = request.accepts("application/json") and not request.accepts("text/html")
+        form = TaskImportForm(request.POST, request.FILES)
+        if not form.is_valid():
+            if wants_json:
+                return JsonResponse({"errors": form.errors}, status=400)
+            return render(request, "tasks/task_import.html", {"form": form, "project": self.project})
+
+        errors = []
+
+        def report(line_number, row, row_errors):
+            if len(errors) < self.max_reported_errors:
+                errors.append({"line": line_number, "errors": row_errors})
+
+        # utf-8-sig drops the byte order mark spreadsheet programs put in front of CSV files.
+        file = io.TextIOWrapper(form.cleaned_data["file"].file, encoding="utf-8-sig", newline="")
+        importer = TaskImporter(
+            self.project, request.user, create_task_types=form.cleaned_data["create_task_types"]
+        )
+        try:
+            importer.run(read_rows(file, form.cleaned_data["format"]), report)
+        except (UnicodeDecodeError, csv.Error) as error:
+            form.add_error("file", f"The file could not be read: {error}")
+            if wants_json:
+                return JsonResponse({"errors": form.errors, "created": importer.created}, status=400)
+            return render(request, "tasks/task_import.html", {"form": form, "project": self.project})
+
+        result = {"created": importer.created, "failed": importer.failed, "errors": errors}
+        if wants_json:
+            return JsonResponse(result)
+
+        return render(request, "tasks/task_import.html", {
+            "form": TaskImportForm(),
+            "project": self.project,
+            "result": result,
+        })
+
+
+class TaskBulkUpdateView(ProjectMemberRequiredMixin, generic.View):
+    def post(self, request, pk):
+        form = TaskBulkUpdateForm(request.POST, project=self.project)
+        if not form.is_valid():
+            return JsonResponse({"errors": form.errors}, status=400)
+
+        updated, failed, modified = bulk_update_tasks(
+            self.project, request.user, form.cleaned_data["ids"], form.get_changes()
+        )
+
+        return JsonResponse({"updated": updated, "failed": failed, "modified": modified.isoformat()})
+
+
+class TaskBulkDeleteView(ProjectMemberRequiredMixin, generic.View):
+    def post(self, request, pk):
+        form = TaskBulkForm(request.POST)
+        if not form.is_valid():
+            return JsonResponse({"errors": form.errors}, status=400)
+
+        deleted, failed = bulk_delete_tasks(self.project, request.user, form.cleaned_data["ids"])
+
+        return JsonResponse({"deleted": deleted, "failed": failed})
+
+
 class ProjectListView(LoginRequiredMixin, generic.ListView):
     model = Project
     queryset = Project.objects.all()
@@ -275,13 +444,18 @@ class ProjectListView(LoginRequiredMixin, generic.ListView):
     paginate_by = 3
 
     def get_queryset(self):
-        user = self.request.user
-        queryset = Project.objects.filter(Q(creator=user) | Q(assignees=user)).distinct()
+        queryset = (
+            accessible_projects(self.request.user)
+            .select_related("creator")
+            .annotate(num_assignees=Count("assignees"))
+            .order_by("title", "id")
+        )
 
         form = ProjectSearchForm(self.request.GET)
         if form.is_valid():
             title = form.cleaned_data.get("title")
-            queryset = queryset.filter(title__icontains=title)
+            if title:
+                queryset = filter_by_rank(queryset, self.request.user, title, SearchDocument.PROJECT)
 
         return queryset
 
@@ -296,16 +470,34 @@ class ProjectListView(LoginRequiredMixin, generic.ListView):
         return context
 
 
-class ProjectDetailView(LoginRequiredMixin, generic.DetailView):
+class SearchView(LoginRequiredMixin, generic.ListView):
+    template_name = "tasks/search_results.html"
+    context_object_name = "results"
+    paginate_by = 20
+
+    def get_queryset(self):
+        form = ProjectSearchForm(self.request.GET)
+        if form.is_valid() and form.cleaned_data.get("title"):
+            return search(self.request.user, form.cleaned_data["title"]).select_related("project", "task")
+
+        return SearchDocument.objects.none()
+
+    def get_context_data(self, *, object_list=None, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["search_form"] = ProjectSearchForm(initial={"title": self.request.GET.get("title", "")})
+        context["show_search"] = True
+
+        return context
+
+
+class ProjectDetailView(ProjectMemberRequiredMixin, generic.DetailView):
     model = Project
     template_name = "tasks/project_detail.html"
     context_object_name = "project"
+    permission_denied_message = "You do not have permission to this page"
 
-    def dispatch(self, request, *args, **kwargs):
-        if request.user == self.get_object().creator or request.user in self.get_object().assignees.all():
-            return super().dispatch(request, *args, **kwargs)
-
-        return HttpResponseForbidden("You do not have permission to this page")
+    def get_object(self, queryset=None):
+        return self.project
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data()
@@ -402,49 +594,82 @@ class JoinProjectView(LoginRequiredMixin, generic.View):
             return render(request, "tasks/project_join_form.html", {"form": form})
 
 
-class ChatMessagesView(LoginRequiredMixin, generic.View):
-    @staticmethod
-    def get(request, pk):
-        project = get_object_or_404(Project, id=pk)
+class ChatMessagesView(ProjectMemberRequiredMixin, generic.View):
+    permission_denied_message = "You do not have permission to view this project."
+    paginate_by = 50
+
+    def get_message_queryset(self):
+        return ChatMessage.objects.filter(project=self.project).select_related("sender__position")
+
+    def get_context_data(self, message_form, messages_connected=None):
+        if messages_connected is None:
+            messages_connected = keyset_page(self.get_message_queryset(), self.paginate_by)
 
-        if request.user == project.creator or request.user in project.assignees.all():
-            messages_connected = ChatMessage.objects.filter(project=project)
-            context = {
-                "project": project,
-                "messages": messages_connected,
-                "message_form": ChatMessageForm(),
-                "show_tabs": True
-            }
+        return {
+            "project": self.project,
+            "messages": messages_connected,
+            "message_form": message_form,
+            "show_tabs": True
+        }
 
-            return render(request, "tasks/chat_messages.html", context)
+    def get(self, request, pk):
+        return render(request, "tasks/chat_messages.html", self.get_context_data(ChatMessageForm()))
 
-        return HttpResponseForbidden("You do not have permission to view this project.")
+    def post(self, request, pk):
+        message_form = ChatMessageForm(request.POST)
+        if message_form.is_valid():
+            new_message = message_form.save(commit=False)
+            new_message.project = self.project
+            new_message.sender = request.user
+            new_message.save()
 
-    @staticmethod
-    def post(request, pk):
-        project = get_object_or_404(Project, id=pk)
+            if request.accepts("application/json") and not request.accepts("text/html"):
+                return JsonResponse(chat_message_payload(new_message), status=201)
 
-        if request.user == project.creator or request.user in project.assignees.all():
-            message_form = ChatMessageForm(request.POST)
-            if message_form.is_valid():
-                new_message = message_form.save(commit=False)
-                new_message.project = project
-                new_message.sender = request.user
-                new_message.save()
+            return redirect("tasks:project-chat", pk=pk)
+
+        if request.accepts("application/json") and not request.accepts("text/html"):
+            return JsonResponse({"errors": message_form.errors}, status=400)
+
+        return render(request, "tasks/chat_messages.html", self.get_context_data(message_form))
 
-                return redirect("tasks:project-chat", pk=pk)
-            else:
-                messages_connected = ChatMessage.objects.filter(project=project)
-                context = {
-                    "project": project,
-                    "messages": messages_connected,
-                    "message_form": message_form,
-                    "show_tabs": True
-                }
 
-                return render(request, "tasks/chat_messages.html", context)
+class ChatHistoryView(ProjectMemberRequiredMixin, generic.View):
+    permission_denied_message = "You do not have permission to view this project."
+    paginate_by = 50
+    max_paginate_by = 200
 
-        return HttpResponseForbidden("You do not have permission to view this project.")
+    def get(self, request, pk):
+        try:
+            limit = min(int(request.GET.get("limit", self.paginate_by)), self.max_paginate_by)
+            page = keyset_page(
+                ChatMessage.objects.filter(project=self.project).select_related("sender__position"),
+                max(limit, 1),
+                before=request.GET.get("before") or None,
+                after=request.GET.get("after") or None
+            )
+        except ValueError:
+            return JsonResponse({"error": "Invalid cursor or limit."}, status=400)
+
+        return JsonResponse({
+            "messages": [chat_message_payload(message) for message in page],
+            "has_more": page.has_more,
+            "before": page.first_cursor,
+            "after": page.last_cursor,
+        })
+
+
+class ProjectExportView(ProjectMemberRequiredMixin, generic.View):
+    def get(self, request, pk, kind):
+        fmt = request.GET.get("format", "csv")
+        if kind not in EXPORTS or fmt not in FORMATS:
+            return JsonResponse({"error": f"Export one of {', '.join(EXPORTS)} as {' or '.join(FORMATS)}."}, status=400)
+
+        stream = astream_export if isinstance(request, ASGIRequest) else stream_export
+        response = StreamingHttpResponse(stream(self.project, kind, fmt), content_type=FORMATS[fmt])
+        response["Content-Disposition"] = f'attachment; filename="project-{self.project.pk}-{kind}.{fmt}"'
+
+        return response
 
 
 class ProfileDetailView(LoginRequiredMixin, generic.DetailView):
@@ -470,8 +695,28 @@ class ProfileUpdateView(LoginRequiredMixin, generic.UpdateView):
         profile.user = self.request.user
         new_profile_image = self.request.FILES.get("profile_image")
         if new_profile_image:
-            profile.profile_image = new_profile_image
+            profile.profile_image = sanitize_upload(new_profile_image)
+            profile.profile_image_hash = ""
 
         profile.save()
+        if new_profile_image:
+            enqueue("generate_thumbnails", {"worker_id": profile.pk})
 
         return super().form_valid(form)
+
+
+class RequestMetricsView(LoginRequiredMixin, UserPassesTestMixin, generic.View):
+    def test_func(self):
+        return self.request.user.is_staff
+
+    @staticmethod
+    def get(request):
+        return JsonResponse({"sample_rate": settings.TASKS_METRICS_SAMPLE_RATE, "views": registry.snapshot()})
+
+
+def serve_media(request, path):
+    response = serve(request, path, document_root=settings.MEDIA_ROOT)
+    if path.startswith(f"{THUMBNAIL_DIR}/"):
+        response["Cache-Control"] = "public, max-age=31536000, immutable"
+
+    return response